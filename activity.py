@@ -0,0 +1,70 @@
+"""Process-wide feed of recent note activity shared by every session.
+
+New revisions seen by the process-level notes cache (local saves and
+edits from other processes) are published into a bounded ring buffer,
+so a note written in one session shows up in every other session's
+sidebar without re-reading the database. Each entry carries a sequence
+number; sessions keep the last one they have seen as a cursor.
+"""
+import threading
+from collections import deque
+from functools import lru_cache
+
+from notes_cache import get_notes_cache
+
+FEED_SIZE = 50
+
+
+def summarize(body, width=50):
+    body = body.strip()
+    return body if len(body) < width else body[:width - 3] + "..."
+
+
+class ActivityFeed:
+    def __init__(self, maxlen=FEED_SIZE):
+        self._entries = deque(maxlen=maxlen)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def publish(self, changes):
+        """Add (tab, revision, body, saved_at) changes, folding repeated edits of one tab"""
+        with self._lock:
+            for tab, revision, body, saved_at in changes:
+                if not body.strip():
+                    continue
+                if self._entries and self._entries[-1]["tab"] == tab:
+                    self._entries.pop()
+                self._seq += 1
+                self._entries.append({
+                    "seq": self._seq,
+                    "tab": tab,
+                    "revision": revision,
+                    "summary": summarize(body),
+                    "timestamp": saved_at
+                })
+
+    @property
+    def cursor(self):
+        """Sequence number of the newest entry"""
+        with self._lock:
+            return self._seq
+
+    def recent(self, limit=5):
+        """Return the newest entries, newest first"""
+        with self._lock:
+            return list(self._entries)[::-1][:limit]
+
+    def since(self, cursor):
+        """Return entries published after cursor, newest first"""
+        with self._lock:
+            return [entry for entry in reversed(self._entries) if entry["seq"] > cursor]
+
+
+@lru_cache(maxsize=None)
+def get_activity_feed():
+    """Return the process-wide feed, seeded from the notes cache and subscribed to its changes"""
+    cache = get_notes_cache()
+    feed = ActivityFeed()
+    feed.publish(reversed(cache.recent(FEED_SIZE)))
+    cache.subscribe(feed.publish)
+    return feed
@@ -0,0 +1,55 @@
+"""Compare standard and size-optimized PDF output per section.
+
+    python benchmarks/pdf_size.py [--repeat 5]
+
+Prints byte size and best-of-N render time for every section and the
+Complete Dashboard, with and without optimize_pdf().
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datasets import KEY_METRICS  # noqa: E402
+from layouts import SECTIONS, pdf_context  # noqa: E402
+from pdf_templates import optimize_pdf, render_pdf  # noqa: E402
+from cache_registry import get_cache  # noqa: E402
+
+
+def best_of(repeat, func):
+    best, result = None, None
+    for _ in range(repeat):
+        get_cache("pdf_fragments").clear()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    context = pdf_context(KEY_METRICS)
+    notes = {section: f"Sample notes for {section}." for section in SECTIONS}
+
+    print(f"{'Section':<20} {'Std bytes':>10} {'Opt bytes':>10} {'Saved':>7} {'Std ms':>8} {'Opt ms':>8}")
+    for section in SECTIONS + ["Complete Dashboard"]:
+        def standard():
+            return render_pdf(section, context=context, section_notes=notes.get(section, ""),
+                              global_notes="Sample global notes.", notes_by_section=notes)
+
+        std_time, std_pdf = best_of(args.repeat, standard)
+        opt_time, (opt_pdf, report) = best_of(args.repeat, lambda: optimize_pdf(standard()))
+        print(
+            f"{section:<20} {len(std_pdf):>10,} {len(opt_pdf):>10,} {report['saved_percent']:>6}% "
+            f"{std_time * 1000:>8.1f} {opt_time * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Process-wide named LRU caches with hit, miss and eviction counters"""
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe LRU mapping shared by every session in the process"""
+
+    def __init__(self, name, maxsize=128):
+        self.name = name
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_create(self, key, factory):
+        """Return the cached value for key, building it with factory() on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def items(self):
+        """Return [(key, value), ...] from least to most recently used"""
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+_caches = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(name, maxsize=128):
+    """Return the process-wide cache registered under name, creating it once"""
+    with _registry_lock:
+        if name not in _caches:
+            _caches[name] = LRUCache(name, maxsize)
+        return _caches[name]
+
+
+def all_caches():
+    with _registry_lock:
+        return dict(_caches)
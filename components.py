@@ -0,0 +1,200 @@
+"""Building blocks shared by the dashboard sections.
+
+Leadership updates, notes panels, data downloads and status badges look
+the same on every tab, so each section module renders them through these
+helpers.
+"""
+import pandas as pd
+import streamlit as st
+from datetime import datetime
+
+from datasets import EXPORT_FORMATS, available_formats, section_datasets
+from narrative import get_narrative
+from note_writer import SessionFlushGuard, get_note_writer
+from notes_cache import get_notes_cache
+from notes_export import notes_csv
+from notes_store import get_notes_store
+from perf import span, timed
+from theme import achieved_green
+
+
+def add_board_update(tab_name):
+    """Add a leadership update section to the top of a tab"""
+    dark_mode = st.session_state.dark_mode if 'dark_mode' in st.session_state else False
+    
+    # Check if there are notes for this tab
+    notes_key = f"notes_{tab_name}"
+    update_content = get_narrative(tab_name, "update")
+
+    if not update_content:
+        if notes_key in st.session_state and st.session_state[notes_key].strip():
+            update_content = st.session_state[notes_key]
+        else:
+            update_content = "<p style='font-style: italic; color: #999;'>No leadership updates at this time.</p>"
+    
+    if dark_mode:
+        board_update_html = f'''
+        <div style="background-color: #1E2130; border-left: 5px solid #0088FF; 
+             padding: 20px; border-radius: 5px; margin: 15px 0 25px 0; box-shadow: 0 2px 5px rgba(0,0,0,0.3);">
+            <h4 style="color: #4DA6FF; margin-top: 0; margin-bottom: 15px; font-size: 18px;">Leadership Update: {tab_name}</h4>
+            <div style="color: #E0E0E0; line-height: 1.6;">
+                {update_content}
+            </div>
+        </div>
+        '''
+    else:
+        board_update_html = f'''
+        <div style="background-color: #F3F9FF; border-left: 5px solid #0088FF; 
+             padding: 20px; border-radius: 5px; margin: 15px 0 25px 0; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
+            <h4 style="color: #0088FF; margin-top: 0; margin-bottom: 15px; font-size: 18px;">Leadership Update: {tab_name}</h4>
+            <div style="color: #333333; line-height: 1.6;">
+                {update_content}
+            </div>
+        </div>
+        '''
+    
+    st.markdown(board_update_html, unsafe_allow_html=True)
+
+
+def create_notes_section(tab_name):
+    """Create a notes section for any tab with persistence across sessions"""
+    notes_key = f"notes_{tab_name}"
+    
+    # Initialize notes in session state if they don't exist
+    if notes_key not in st.session_state:
+        # Load the latest revision from the process-wide cache, including edits not yet flushed
+        pending = get_note_writer().pending(tab_name)
+        latest = get_notes_cache().latest(tab_name)
+        st.session_state[notes_key] = pending if pending is not None else (latest[1] if latest else "")
+        if latest and latest[1]:
+            st.session_state.setdefault('last_edit_time', {})[notes_key] = latest[2]
+    
+    with st.expander(f"📝 Notes for {tab_name}", expanded=False):
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            # Create text area for notes with the current value from session state
+            notes = st.text_area(
+                "Add your notes here:",
+                value=st.session_state[notes_key],
+                height=150,
+                key=f"textarea_{notes_key}_{tab_name}"  # Made key more unique
+            )
+            
+            # Automatically save notes when they change
+            if notes != st.session_state[notes_key]:
+                st.session_state[notes_key] = notes
+                
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                
+                # Queue the edit; the note writer coalesces bursts and saves in the background
+                writer = get_note_writer()
+                writer.submit(tab_name, notes, saved_at=timestamp)
+                if 'notes_flush_guard' not in st.session_state:
+                    st.session_state.notes_flush_guard = SessionFlushGuard(writer)
+                
+                if 'last_edit_time' not in st.session_state:
+                    st.session_state.last_edit_time = {}
+                    
+                st.session_state.last_edit_time[notes_key] = timestamp
+                
+                st.success("✅ Notes saved automatically!")
+            
+            # Browse earlier revisions from the notes journal
+            if st.checkbox("🕘 Show history", key=f"history_{tab_name}"):
+                history = get_notes_store().history(tab_name)
+                if history:
+                    saved_times = dict(history)
+                    revision = st.selectbox(
+                        "Revision:",
+                        list(saved_times),
+                        format_func=lambda r: f"Revision {r} - {saved_times[r]}",
+                        key=f"history_revision_{tab_name}"
+                    )
+                    st.text(get_notes_store().get_revision(tab_name, revision) or "(empty)")
+                else:
+                    st.markdown("*No saved revisions yet*")
+
+        with col2:
+            # Display timestamp of last edit if available
+            if 'last_edit_time' in st.session_state and notes_key in st.session_state.last_edit_time:
+                st.info(f"Last edited: {st.session_state.last_edit_time[notes_key]}")
+            
+            # Add export functionality
+            st.download_button(
+                "Export Notes",
+                data=lambda: export_notes_csv(tab_name),
+                file_name=f"{tab_name}_notes.csv",
+                mime="text/csv",
+                key=f"export_{tab_name}"
+            )
+            
+            # Add ability to clear notes
+            if st.button("Clear Notes", key=f"clear_{tab_name}"):
+                st.session_state[notes_key] = ""
+                # Drop the text area's state too, or it re-saves the old text on rerun
+                st.session_state.pop(f"textarea_{notes_key}_{tab_name}", None)
+                if 'last_edit_time' in st.session_state and notes_key in st.session_state.last_edit_time:
+                    del st.session_state.last_edit_time[notes_key]
+                
+                # Record the cleared notes as a new revision, replacing any queued edit
+                writer = get_note_writer()
+                writer.submit(tab_name, "")
+                writer.flush([tab_name])
+                
+                st.rerun()  # Updated from experimental_rerun
+
+
+@timed("export", "notes_csv")
+def export_notes_csv(tab_name):
+    """Flush queued edits, then stream one tab's notes and revision history as CSV"""
+    get_note_writer().flush([tab_name])
+    return notes_csv(get_notes_store(), [tab_name], history=True)
+
+
+def status_badge(status):
+    if status == "On Track":
+        return f'<span style="background-color: #4CAF50; color: white; padding: 3px 8px; border-radius: 4px;">On Track</span>'
+    elif status == "At Risk":
+        return f'<span style="background-color: #FF9800; color: white; padding: 3px 8px; border-radius: 4px;">At Risk</span>'
+    elif status == "Achieved":
+        return f'<span style="background-color: {achieved_green}; color: white; padding: 3px 8px; border-radius: 4px;">Achieved</span>'
+    else:
+        return f'<span style="background-color: #F44336; color: white; padding: 3px 8px; border-radius: 4px;">Off Track</span>'
+
+
+def serialize_dataset(serialize, df, extension):
+    with span("export", f"dataset_{extension}"):
+        return serialize(df)
+
+
+def download_data(df, filename, key=None, fmt="CSV"):
+    """Render a download button that serializes the dataset only when clicked"""
+    if not isinstance(df, pd.DataFrame):
+        st.error(f"Error: Invalid data format for {filename}")
+        return
+    extension, mime, serialize = EXPORT_FORMATS[fmt]
+    st.download_button(
+        f"Download {filename} data",
+        data=lambda: serialize_dataset(serialize, df, extension),
+        file_name=f"{filename}.{extension}",
+        mime=mime,
+        key=key or f"download_{filename}_{extension}"
+    )
+
+
+def create_data_downloads(tab_name):
+    """Add the downloads for the datasets behind a tab"""
+    datasets = section_datasets(tab_name)
+    if not datasets:
+        return
+    with st.expander(f"📥 Data for {tab_name}", expanded=False):
+        fmt = st.radio(
+            "Format:",
+            available_formats(),
+            horizontal=True,
+            key=f"download_format_{tab_name}",
+            help="Parquet and Arrow keep column types (dates, amounts) and load much faster in notebooks"
+        )
+        for name, df in datasets.items():
+            download_data(df, name, key=f"download_{tab_name}_{name}", fmt=fmt)
@@ -0,0 +1,67 @@
+"""One ZIP with every dashboard dataset plus a manifest.
+
+Each dataset is written once under data/, whatever number of sections
+show it. manifest.json lists row counts, content versions and the
+sections using each dataset. Built bundles are cached per format and
+dataset version, so repeat downloads are served from memory.
+"""
+import io
+import json
+import zipfile
+from datetime import datetime
+
+from cache_registry import get_cache
+from datasets import EXPORT_FORMATS, SECTION_DATASETS, dataset_versions, datasets_version, load_datasets
+
+_bundle_cache = get_cache("data_bundles", maxsize=4)
+
+
+def _zip_info(name):
+    info = zipfile.ZipInfo(name, date_time=datetime.now().timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def build_manifest(fmt):
+    extension = EXPORT_FORMATS[fmt][0]
+    versions = dataset_versions()
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "format": fmt,
+        "version": datasets_version(),
+        "datasets": [
+            {
+                "name": name,
+                "file": f"data/{name}.{extension}",
+                "rows": len(df),
+                "columns": list(df.columns),
+                "version": versions[name],
+                "sections": [section for section, names in SECTION_DATASETS.items() if name in names],
+            }
+            for name, df in load_datasets().items()
+        ],
+    }
+
+
+def write_data_bundle(fileobj, fmt="CSV"):
+    """Stream every dataset and the manifest into a ZIP written to fileobj"""
+    _, _, serialize = EXPORT_FORMATS[fmt]
+    manifest = build_manifest(fmt)
+    datasets = load_datasets()
+    with zipfile.ZipFile(fileobj, "w") as bundle:
+        for entry in manifest["datasets"]:
+            data = serialize(datasets[entry["name"]])
+            with bundle.open(_zip_info(entry["file"]), "w") as f:
+                f.write(data.encode("utf-8") if isinstance(data, str) else data)
+        with bundle.open(_zip_info("manifest.json"), "w") as f:
+            f.write(json.dumps(manifest, indent=2).encode("utf-8"))
+
+
+def data_bundle(fmt="CSV"):
+    """Return the ZIP bytes for a format, built once per dataset version"""
+    def build():
+        buffer = io.BytesIO()
+        write_data_bundle(buffer, fmt)
+        return buffer.getvalue()
+
+    return _bundle_cache.get_or_create((fmt, datasets_version()), build)
@@ -0,0 +1,358 @@
+"""Datasets behind the dashboard tabs, shared by the app and the export tools"""
+import hashlib
+import importlib.util
+import io
+import re
+from datetime import datetime
+from functools import lru_cache
+
+import pandas as pd
+
+# Key metrics - Real data from CSV
+KEY_METRICS = {
+    "total_membership": 1244476,
+    "new_members": 15438,
+    "total_contributions": 3109294.25,
+    "total_grants": 3101133.09,
+}
+
+# Report card goals on the Executive Summary tab; Progress is the percent as a number
+REPORT_CARD = {
+    "Goal": [
+        "Recruit 100,000 new members",
+        "Engage 250,000 members",
+        "Support 65,000 walking daily",
+        "Unite 3 advocacy partners",
+        "Raise $10M",
+        "Establish Care Village (40k)",
+        "Achieve 85% organizational health"
+    ],
+    "Current Total": [
+        "15,438", "13,119", "5,634", "0",
+        "$3,109,294.25", "7,660", "End of Year Metric"
+    ],
+    "Percent Progress": [
+        "15.44%", "5.25%", "8.67%", "0%", "31.09%", "19.15%", "TBD"
+    ],
+    "Status": [
+        "On Track", "On Track", "At Risk", "On Track",
+        "On Track", "On Track", "On Track"
+    ],
+    "Progress": [
+        15.44, 5.25, 8.67, 0, 31.09, 19.15, 0
+    ]
+}
+
+CURRENCY_PATTERN = r"-?\$[\d,]+(\.\d+)?"
+_CURRENCY_RE = re.compile(CURRENCY_PATTERN)
+
+# Datasets shown (or summarized) on each tab, in display order
+SECTION_DATASETS = {
+    "Executive Summary": ["historic_growth", "membership_by_age", "top_states", "top_cities"],
+    "Recruitment": ["new_members_by_month", "new_members_by_age"],
+    "Engagement": [],
+    "Development": ["contributions_breakdown", "grants"],
+    "Marketing": ["email_activity", "email_comparison", "audience_performance", "campaign_comparison"],
+    "Campaigns": ["knowledge_impact", "campaign_age_distribution", "badge_weeks"],
+    "Operations": ["finance_trend"],
+    "Member Care": ["member_care"],
+    "Advocacy": [],
+    "Impact": ["knowledge_impact"],
+}
+
+
+@lru_cache(maxsize=None)
+def load_datasets():
+    """Build every dashboard dataset once per process.
+
+    The returned frames are shared between sessions and must be treated
+    as read-only.
+    """
+    # Load dataframes with real data from CSV
+
+    # New Members by Month - Real data
+    df_extended = pd.DataFrame({
+        'Month': ['Oct 2024', 'Nov 2024', 'Dec 2024', 'Jan 2025', 'Feb 2025', 'Mar 2025', 'Apr 2025', 'May 2025', 'Jun 2025'],
+        'New Members': [1365, 1419, 182, 591, 1588, 4382, 6073, 2610, 123],
+        'Date': [
+            datetime(2024, 10, 1),
+            datetime(2024, 11, 1),
+            datetime(2024, 12, 1),
+            datetime(2025, 1, 1),
+            datetime(2025, 2, 1),
+            datetime(2025, 3, 1),
+            datetime(2025, 4, 1),
+            datetime(2025, 5, 1),
+            datetime(2025, 6, 1)
+        ]
+    })
+
+    # New Members by Age - Real data
+    df_new_age = pd.DataFrame({
+        'Age Group': ['18 to 24', '25 to 34', '35 to 49', '50 to 64', '65+', 'Unknown'],
+        'New Members': [90, 504, 1923, 2389, 2039, 8479]
+    })
+
+    # Total Membership by Age - Real data
+    df_total_age = pd.DataFrame({
+        'Age Group': ['18 to 24', '25 to 34', '35 to 49', '50 to 64', '65+', 'Unknown*'],
+        'Members': [1739, 16515, 82893, 164106, 108669, 755521]
+    })
+
+    # Top States & Top Cities - Real data
+    df_top_states = pd.DataFrame({
+        'State': ['Texas', 'Georgia', 'California', 'New York', 'Florida'],
+        'Members': [89043, 84799, 77919, 66670, 64880]
+    })
+
+    df_top_cities = pd.DataFrame({
+        'City': ['Chicago', 'Philadelphia', 'Houston', 'Brooklyn', 'Atlanta'],
+        'Members': [20166, 16775, 16662, 15197, 12797]
+    })
+
+    # Historic Movement Growth Numbers - Real data where available
+    df_historic_growth = pd.DataFrame({
+        'Year': [2020, 2021, 2022, 2023, 2024, 2025],
+        'Trekkers': [1000000, 1218000, 1214566, 1207517, 1229038, 1244476],
+        'New Women': [626660, 218000, -3434, -7049, 21521, 15438]
+    })
+
+    # Financial Revenue Breakdown - Real data
+    df_finance = pd.DataFrame({
+        'Category': ['Donations', 'Grants'],
+        'Amount': [8161.16, 3101133.09]
+    })
+
+    # Financial Trend Data - Real data (May 2025 YTD)
+    finance_trend_data = pd.DataFrame({
+        'Month': ['January', 'February', 'March', 'April', 'May'],
+        'Revenue': [648705, 648705, 648705, 648705, 648706],  # Total: 3,243,526
+        'Expenses': [468772, 468772, 468772, 468773, 468773]  # Total: 2,343,862
+    })
+
+    # Email and Subscriber Activity Data - Real data
+    df_activity = pd.DataFrame({
+        'Period': ['30 day'],
+        'Openers': [19148],
+        'Clickers': [12904]
+    })
+
+    # Member Care Data - Real data
+    member_care_data = pd.DataFrame({
+        'Metric': ['Member Satisfaction Rating', 'Resolution/Responsiveness Rate', 'Top Member Issues/Concerns'],
+        'Goal': ['95%', '48 hours', '-'],
+        'Current Total': ['93%', '2 hours', 'SCS Registration Error Message & Connecting to the Movement']
+    })
+
+    # Email Performance Comparison Data
+    comparison_data = pd.DataFrame({
+        'Metric': ['Open Rate', 'Click-Through Rate'],
+        'GirlTREK': [18.54, 1.06],
+        'Nonprofit Industry Average': [28.59, 3.29]
+    })
+
+    # Knowledge Impact Data for Campaigns
+    knowledge_data = pd.DataFrame({
+        'Topic': [
+            'Land rights, housing & environmental justice',
+            'Civic engagement & political participation',
+            'Safety, self-defense & public resource access',
+            'Decarceration, gun safety & restorative justice',
+            'Mental health & emotional boundaries',
+            'Radical care, family legacy & intergenerational healing',
+            'Parenting, mentorship & end-of-life planning',
+            'Self-esteem, celebration & personal empowerment'
+        ],
+        'Members': [710, 569, 645, 658, 622, 695, 536, 602]
+    })
+
+    # Age Distribution Data for Campaigns
+    age_dist_data = pd.DataFrame({
+        'Age Group': ['0-17', '18-24', '25-34', '35-44', '45-54', '55-64', '65-74', '75-84', '85-94'],
+        'Participants': [21, 66, 386, 1316, 2268, 1077, 440, 50, 2]
+    })
+
+    # Badge Week Data for Campaigns
+    badge_week_data = pd.DataFrame({
+        'Week': ['Week 0', 'Week 1', 'Week 2', 'Week 3', 'Week 4', 'Week 5', 
+                'Week 6', 'Week 7', 'Week 8', 'Week 9', 'Week 10', 'Final Impact'],
+        'Badges Claimed': [3442, 2400, 2862, 1928, 1521, 1477, 2234, 1531, 1460, 1847, 1334, 867]
+    })
+
+    # Create grants data
+    grants_data = {
+        'Account': [
+            'Pivotal Ventures', 'National Trust for Historic Preservation', 'Echoing Green', 'Emerson Collective',
+            'National Trust for Historic Preservation', 'Gabell Foundation', 'National Trust for Historic Preservation',
+            'National Trust for Historic Preservation', 'Borealis Philanthropy', 'National Trust for Historic Preservation',
+            'Robert Wood Johnson Foundation', 'Emergent Fund', 'Southern Black Girls', 'Lumena Foundation',
+            'Sun Life', 'Black Feminist Fund', 'Elevate Prize Foundation', 'Saks Fifth Avenue Foundation',
+            'Borealis Philanthropy', 'Central Alabama Community Foundation', 'JusPax Fund', 'Tow Foundation'
+        ],
+        'Grant Name': [
+            '2025 Action for Women\'s Health', '2025 National Trust Preservation', '2025 Follow-On Funding',
+            '2025 EC Special Grant', '2025 AACHAF', '2025 CF Special Grant', '2025 Johanna Favrot',
+            '2025 Cynthia Woods Mitchell', '2025 Black Led Movement', '2025 Black Modernism',
+            '2025 Data Equity', '2025 Emergent Fund', '2025 SBG Defense Fund', '2025 Lumena Foundation Moon',
+            '2025 Sun Life Health Access', '2025 Sustain Fund', '2025 Elevate Prize', '2025 Local Funding',
+            '2025 Borealis Philanthropy REACH Fund', '2025 Montgomery City Council', '2025 JusPax Fund: Gender Justice',
+            'Tow Foundation'
+        ],
+        'Amount Requested': [
+            '$5,000,000', '$5,000', '$100,000', '$224,250', '$75,000', '$10,000', '$15,000', '$15,000',
+            '$183,500', '$150,000', '$50,000', '$25,000', '$2,000', '$50,000', '$100,000', '$1,600,000',
+            '$100,000', '$30,000', '$150,000', '$10,000', '$25,000', '$600,000'
+        ],
+        'Amount Funded': [
+            '', '$2,500', '', '', '', '$10,000', '', '', '', '', '', '', '$2,000', '', '', '', '', '', '', '', '', ''
+        ],
+        'Due Date': [
+            'Jan', 'Feb', 'Feb', 'Feb', 'Feb', 'Feb', 'Mar', 'Mar', 'Mar', 'Mar', 'Mar', 'Mar', 'Apr', 'Apr',
+            'Apr', 'May', 'Jun', 'Jul', 'Jul', 'Jul', 'Jul', 'Jul'
+        ],
+        'Status': [
+            'Pending', 'Closed - Funded', 'Closed - Declined', 'Closed - Declined', 'Pending', 'Closed - Funded',
+            'Pending', 'Pending', 'Pending', 'Pending', 'Closed - Declined', 'Pending', 'Closed - Funded',
+            'Closed - Declined', 'Closed - Declined', 'Pending', 'Pending', 'Pending', 'Prepare', 'Prepare',
+            'Prepare', 'Prepare'
+        ]
+    }
+    grants_df = pd.DataFrame(grants_data)
+
+    # Underground App Audience Performance
+    audience_data = pd.DataFrame({
+        'Audience Type': ['Lookalikes', 'Cultural Interests'],
+        'Leads Generated': [128, 116]
+    })
+
+    # Campaign Comparison
+    campaign_comparison = pd.DataFrame({
+        'Campaign': ['WNBA', 'Underground App'],
+        'Spend': [3901.12, 7279.07],
+        'CTR': [1.23, 1.30],
+        'CPC': [0.94, 2.37],
+        'Clicks': [1986, 3074]
+    })
+
+    return {
+        "new_members_by_month": df_extended,
+        "new_members_by_age": df_new_age,
+        "membership_by_age": df_total_age,
+        "top_states": df_top_states,
+        "top_cities": df_top_cities,
+        "historic_growth": df_historic_growth,
+        "contributions_breakdown": df_finance,
+        "finance_trend": finance_trend_data,
+        "email_activity": df_activity,
+        "member_care": member_care_data,
+        "email_comparison": comparison_data,
+        "knowledge_impact": knowledge_data,
+        "campaign_age_distribution": age_dist_data,
+        "badge_weeks": badge_week_data,
+        "grants": grants_df,
+        "audience_performance": audience_data,
+        "campaign_comparison": campaign_comparison,
+    }
+
+
+@lru_cache(maxsize=None)
+def dataset_versions():
+    """Return {name: short content hash} for every dataset; changes whenever the data does"""
+    versions = {}
+    for name, df in load_datasets().items():
+        digest = hashlib.sha256(repr((list(df.columns), list(df.dtypes.astype(str)))).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        versions[name] = digest.hexdigest()[:16]
+    return versions
+
+
+def datasets_version():
+    """Return one hash covering every dataset"""
+    return hashlib.sha256(repr(sorted(dataset_versions().items())).encode()).hexdigest()[:16]
+
+
+def section_datasets(section_name):
+    """Return {name: DataFrame} for the datasets behind one section"""
+    datasets = load_datasets()
+    return {name: datasets[name] for name in SECTION_DATASETS.get(section_name, [])}
+
+
+def dataset_to_csv(df):
+    """Serialize a dataset the same way for every CSV download and export"""
+    return df.to_csv(index=False)
+
+
+def _is_currency_text(values):
+    # Stops at the first value that is not an amount, so other text columns cost a cell or two
+    filled = False
+    for value in values:
+        text = str(value).strip()
+        if not text:
+            continue
+        if not _CURRENCY_RE.fullmatch(text):
+            return False
+        filled = True
+    return filled
+
+
+def currency_text_columns(df):
+    """Return the text columns whose non-blank values are all "$1,234" amounts"""
+    return [
+        column for column in df.columns
+        if df[column].dtype.kind not in "biufcmM" and _is_currency_text(df[column])
+    ]
+
+
+def parse_currency(value):
+    """Return a "$1,234" amount as a float, or None when blank"""
+    text = str(value).strip().replace("$", "").replace(",", "")
+    return float(text) if text else None
+
+
+def typed_dataset(df):
+    """Return a copy with "$1,234" text columns converted to float amounts (blank -> NaN)"""
+    typed = df.copy()
+    for column in currency_text_columns(typed):
+        text = typed[column].astype(str).str.strip()
+        typed[column] = pd.to_numeric(
+            text.str.replace(r"[$,]", "", regex=True).replace("", None), errors="coerce"
+        ).astype(float)
+    return typed
+
+
+def _arrow_table(df):
+    import pyarrow as pa
+    return pa.Table.from_pandas(typed_dataset(df), preserve_index=False)
+
+
+def dataset_to_parquet(df):
+    """Serialize a dataset to zstd-compressed Parquet, keeping dtypes (requires pyarrow)"""
+    import pyarrow.parquet as pq
+    buffer = io.BytesIO()
+    pq.write_table(_arrow_table(df), buffer, compression="zstd")
+    return buffer.getvalue()
+
+
+def dataset_to_arrow(df):
+    """Serialize a dataset to a zstd-compressed Arrow IPC file (requires pyarrow)"""
+    import pyarrow as pa
+    table = _arrow_table(df)
+    buffer = io.BytesIO()
+    with pa.ipc.new_file(buffer, table.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")) as writer:
+        writer.write_table(table)
+    return buffer.getvalue()
+
+
+# Download/export formats: name -> (file extension, MIME type, serializer)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv", dataset_to_csv),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", dataset_to_parquet),
+    "Arrow": ("arrow", "application/vnd.apache.arrow.file", dataset_to_arrow),
+}
+
+
+def available_formats():
+    """Return the export format names usable in this environment"""
+    if importlib.util.find_spec("pyarrow") is None:
+        return ["CSV"]
+    return list(EXPORT_FORMATS)
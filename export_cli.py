@@ -0,0 +1,126 @@
+"""Headless batch export of the dashboard for board packets.
+
+Writes every section's PDF (plus the Complete Dashboard), a CSV bundle
+per section, an Excel workbook of all datasets, the notes with their
+revision history and a static HTML snapshot to an output directory
+without starting a Streamlit server:
+
+    python export_cli.py --output board_packet --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from datasets import EXPORT_FORMATS, KEY_METRICS, section_datasets
+from notes_export import write_notes_zip
+from notes_store import DB_PATH, GLOBAL_TAB, get_notes_store
+from layouts import SECTIONS, pdf_context
+from pdf_templates import optimize_pdf, render_pdf
+from snapshot import render_snapshot
+from workbook import write_workbook
+
+
+def slugify(name):
+    return name.lower().replace(" ", "_")
+
+
+def read_saved_notes(notes_db, as_of=None):
+    """Load the tab and global notes saved by the dashboard, optionally as of a date"""
+    store = get_notes_store(notes_db)
+    saved = store.get_all_as_of(as_of) if as_of else store.get_all()
+    notes = {section: saved.get(section, "") for section in SECTIONS}
+    notes["global"] = saved.get(GLOBAL_TAB, "")
+    return notes
+
+
+def export_section_pdf(section_name, output_dir, dark_mode, context, notes, optimize=False):
+    pdf_data = render_pdf(
+        section_name,
+        dark_mode=dark_mode,
+        context=context,
+        section_notes=notes.get(section_name, ""),
+        global_notes=notes["global"],
+        notes_by_section=notes
+    )
+    if optimize:
+        pdf_data, report = optimize_pdf(pdf_data)
+        print(
+            f"{section_name}: {report['original_bytes']} -> {report['optimized_bytes']} bytes "
+            f"({report['saved_percent']}% smaller)",
+            file=sys.stderr
+        )
+    path = os.path.join(output_dir, "pdf", f"{slugify(section_name)}.pdf")
+    with open(path, "wb") as f:
+        f.write(pdf_data)
+    return path
+
+
+def export_section_data(section_name, output_dir, fmt="CSV"):
+    datasets = section_datasets(section_name)
+    if not datasets:
+        return None
+    extension, _, serialize = EXPORT_FORMATS[fmt]
+    path = os.path.join(output_dir, extension, f"{slugify(section_name)}.zip")
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for name, df in datasets.items():
+            bundle.writestr(f"{name}.{extension}", serialize(df))
+    return path
+
+
+def run_export(output_dir, workers=None, dark_mode=False, notes_db=DB_PATH, optimize=False, notes_as_of=None,
+               data_format="CSV"):
+    """Export every section and return the list of written files"""
+    os.makedirs(os.path.join(output_dir, "pdf"), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, EXPORT_FORMATS[data_format][0]), exist_ok=True)
+
+    notes = read_saved_notes(notes_db, notes_as_of)
+    context = pdf_context(KEY_METRICS)
+
+    notes_path = os.path.join(output_dir, "notes.zip")
+    with open(notes_path, "wb") as f:
+        write_notes_zip(f, get_notes_store(notes_db))
+
+    snapshot_path = os.path.join(output_dir, "dashboard.html")
+    with open(snapshot_path, "w", encoding="utf-8") as f:
+        f.write(render_snapshot(context, {s: notes[s] for s in SECTIONS}, notes["global"], dark_mode))
+
+    workbook_path = os.path.join(output_dir, "dashboard_data.xlsx")
+    with open(workbook_path, "wb") as f:
+        write_workbook(f)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(export_section_pdf, section, output_dir, dark_mode, context, notes, optimize)
+            for section in SECTIONS + ["Complete Dashboard"]
+        ]
+        futures += [pool.submit(export_section_data, section, output_dir, data_format) for section in SECTIONS]
+        return [notes_path, snapshot_path, workbook_path] + [path for path in (future.result() for future in futures) if path]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export GirlTREK dashboard PDFs and data bundles")
+    parser.add_argument("--output", "-o", default="board_packet", help="output directory")
+    parser.add_argument("--workers", "-j", type=int, default=None, help="parallel workers (default: CPU count)")
+    parser.add_argument("--dark-mode", action="store_true", help="render PDFs with the dark theme")
+    parser.add_argument("--optimize", action="store_true", help="write size-optimized PDFs and report the savings")
+    parser.add_argument("--data-format", choices=list(EXPORT_FORMATS), default="CSV",
+                        help="format of the per-section data bundles (Parquet/Arrow need pyarrow)")
+    parser.add_argument("--notes-db", default=DB_PATH, help="notes database written by the dashboard")
+    parser.add_argument("--notes-as-of", type=date.fromisoformat, default=None,
+                        help="use notes as they were at the end of this date (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    written = run_export(args.output, args.workers, args.dark_mode, args.notes_db, args.optimize, args.notes_as_of,
+                         args.data_format)
+    for path in sorted(written):
+        print(path)
+    print(f"Exported {len(written)} files in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
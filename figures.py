@@ -0,0 +1,258 @@
+"""Plotly figures shown on the dashboard tabs.
+
+Each builder takes the dataset it plots and returns a new figure, so the
+app and the static HTML snapshot draw identical charts. get_figure() shares
+one built figure per dataset version between all sessions.
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+
+from cache_registry import get_cache
+from datasets import dataset_versions, load_datasets
+from perf import span
+
+from theme import (
+    primary_blue, primary_orange, primary_yellow, secondary_blue, secondary_orange,
+    secondary_pink, secondary_purple, secondary_green
+)
+
+_figure_cache = get_cache("figures", maxsize=64)
+
+
+def historic_growth_figure(df):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df['Year'],
+        y=df['Trekkers'],
+        mode='lines+markers',
+        name='Trekkers',
+        line=dict(color=primary_blue, width=3),
+        marker=dict(size=8)
+    ))
+    fig.update_layout(
+        title='Historic Growth of Trekkers (2020–2025)',
+        xaxis_title='Year',
+        yaxis_title='Total Trekkers',
+        title_font=dict(color=primary_blue),
+        height=400
+    )
+    return fig
+
+
+def membership_by_age_figure(df):
+    fig = px.bar(
+        df,
+        x='Age Group',
+        y='Members',
+        title='Total Membership by Age Group',
+        color='Members',
+        color_continuous_scale=[secondary_purple, primary_blue, secondary_pink]
+    )
+    fig.update_layout(title_font=dict(color=primary_blue))
+    return fig
+
+
+def top_states_figure(df):
+    fig = px.bar(
+        df,
+        x='State',
+        y='Members',
+        title='Top 5 States by Membership',
+        color='Members',
+        color_continuous_scale=[primary_blue, secondary_purple]
+    )
+    fig.update_layout(title_font=dict(color=primary_blue))
+    return fig
+
+
+def top_cities_figure(df):
+    fig = px.bar(
+        df,
+        x='City',
+        y='Members',
+        title='Top 5 Cities by Membership',
+        color='Members',
+        color_continuous_scale=[primary_blue, secondary_orange]
+    )
+    fig.update_layout(title_font=dict(color=primary_blue))
+    return fig
+
+
+def new_members_by_month_figure(df):
+    fig = px.bar(
+        df,
+        x='Month',
+        y='New Members',
+        title='New Member Recruitment by Month (2024-2025)',
+        color='New Members',
+        color_continuous_scale=[secondary_blue, primary_blue, primary_orange]
+    )
+    fig.update_layout(title_font=dict(color=primary_blue))
+    return fig
+
+
+def new_members_by_age_figure(df):
+    fig = px.pie(
+        df,
+        values='New Members',
+        names='Age Group',
+        title='New Members by Age Group Distribution',
+        color_discrete_sequence=[primary_blue, primary_orange, primary_yellow, secondary_pink, secondary_purple, secondary_green]
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title_font=dict(color=primary_blue))
+    return fig
+
+
+def contributions_figure(df):
+    fig = px.pie(
+        df,
+        values='Amount',
+        names='Category',
+        title='Total Contributions Breakdown',
+        color_discrete_sequence=[primary_blue, primary_orange]
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title_font=dict(color=primary_blue))
+    return fig
+
+
+def email_comparison_figure(df):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='GirlTREK',
+        x=df['Metric'],
+        y=df['GirlTREK'],
+        marker_color=primary_blue,
+        text=df['GirlTREK'].apply(lambda x: f'{x}%'),
+        textposition='auto'
+    ))
+    fig.add_trace(go.Bar(
+        name='Nonprofit Industry Average',
+        x=df['Metric'],
+        y=df['Nonprofit Industry Average'],
+        marker_color=secondary_orange,
+        text=df['Nonprofit Industry Average'].apply(lambda x: f'{x}%'),
+        textposition='auto'
+    ))
+    fig.update_layout(
+        title='Email Performance Comparison',
+        yaxis_title='Percentage (%)',
+        barmode='group',
+        title_font=dict(color=primary_blue),
+        height=400
+    )
+    return fig
+
+
+def audience_performance_figure(df):
+    fig = px.bar(
+        df,
+        x='Audience Type',
+        y='Leads Generated',
+        title='Underground App Campaign - Leads by Audience Type',
+        color='Leads Generated',
+        color_continuous_scale=[primary_blue, primary_orange]
+    )
+    fig.update_layout(
+        title_font=dict(color=primary_blue),
+        height=350
+    )
+    return fig
+
+
+def campaign_comparison_figure(df):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df['Spend'],
+        y=df['Clicks'],
+        mode='markers+text',
+        text=df['Campaign'],
+        textposition="top center",
+        marker=dict(
+            size=[20, 30],  # Scaled by relative spend
+            color=[primary_blue, primary_orange],
+            opacity=0.8
+        ),
+        name='Campaigns'
+    ))
+    fig.update_layout(
+        title='Campaign Spend vs Clicks Performance',
+        xaxis_title='Total Spend ($)',
+        yaxis_title='Total Clicks',
+        title_font=dict(color=primary_blue),
+        height=400
+    )
+    return fig
+
+
+def knowledge_topics_figure(df):
+    fig = px.bar(
+        df,
+        x='Topic',
+        y='Members',
+        title='Members Reporting Significant Knowledge Increase by Topic',
+        color='Members',
+        color_continuous_scale=[primary_blue, primary_orange, primary_yellow]
+    )
+    fig.update_layout(
+        title_font=dict(color=primary_blue),
+        xaxis_tickangle=-45,
+        height=500
+    )
+    return fig
+
+
+def knowledge_impact_figure(df):
+    fig = px.bar(
+        df,
+        x='Members',
+        y='Topic',
+        orientation='h',
+        title='Self-Care School Knowledge Impact by Topic',
+        color='Members',
+        color_continuous_scale=[primary_blue, primary_orange, primary_yellow]
+    )
+    fig.update_layout(
+        title_font=dict(color=primary_blue),
+        height=400,
+        xaxis_title='Number of Participants',
+        yaxis_title=''
+    )
+    return fig
+
+
+# Charts on each tab, in display order: (builder, dataset name)
+SECTION_FIGURES = {
+    "Executive Summary": [
+        (historic_growth_figure, "historic_growth"),
+        (membership_by_age_figure, "membership_by_age"),
+        (top_states_figure, "top_states"),
+        (top_cities_figure, "top_cities"),
+    ],
+    "Recruitment": [
+        (new_members_by_month_figure, "new_members_by_month"),
+        (new_members_by_age_figure, "new_members_by_age"),
+    ],
+    "Development": [(contributions_figure, "contributions_breakdown")],
+    "Marketing": [
+        (email_comparison_figure, "email_comparison"),
+        (audience_performance_figure, "audience_performance"),
+        (campaign_comparison_figure, "campaign_comparison"),
+    ],
+    "Campaigns": [
+        (knowledge_topics_figure, "knowledge_impact"),
+        (knowledge_impact_figure, "knowledge_impact"),
+    ],
+    "Impact": [(knowledge_impact_figure, "knowledge_impact")],
+}
+
+
+def get_figure(builder, dataset_name):
+    """Return the figure for a dataset, built once per dataset version; treat it as read-only"""
+    def build():
+        with span("figure", builder.__name__):
+            return builder(load_datasets()[dataset_name])
+
+    key = (builder.__name__, dataset_name, dataset_versions()[dataset_name])
+    return _figure_cache.get_or_create(key, build)
@@ -0,0 +1,22 @@
+"""Number and currency formatting shared by the dashboard and its exports"""
+import re
+
+
+def format_currency(value):
+    if isinstance(value, str):
+        try:
+            clean_value = re.sub(r'[^\d.]', '', value)
+            value = float(clean_value)
+        except:
+            return value
+    return f"${value:,.2f}"
+
+
+def format_number(value):
+    if isinstance(value, str):
+        try:
+            clean_value = value.replace(',', '')
+            value = float(clean_value)
+        except:
+            return value
+    return f"{value:,.0f}"
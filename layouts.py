@@ -0,0 +1,283 @@
+"""Section content shared by the PDF and HTML exports.
+
+Each section's exportable content is declared as data so that every
+renderer (ReportLab, static HTML) produces the same tables and text.
+"""
+from formatting import format_currency, format_number
+
+SECTIONS = [
+    "Executive Summary", "Recruitment", "Engagement", "Development", "Marketing",
+    "Campaigns", "Operations", "Member Care", "Advocacy", "Impact"
+]
+
+# Each layout is a list of (kind, value) blocks:
+#   ("subheading", text) / ("text", text) / ("spacer", height in inches)
+#   ("table", {"rows": [...], "widths": [inches, ...], "align": "CENTER"|"LEFT",
+#              "header_padding": bool})
+# Cells may contain {placeholders} that are filled from the render context.
+SECTION_LAYOUTS = {
+    "Executive Summary": [
+        ("subheading", "Key Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal", "Status"],
+                ["Total Membership", "{total_membership}", "1,700,000", "On Track"],
+                ["Total New Members", "{new_members}", "100,000", "At Risk"],
+                ["Total Contributions", "{total_contributions}", "$10,000,000", "On Track"]
+            ],
+            "widths": [2, 1.5, 1.5, 1],
+            "align": "CENTER",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Report Card Progress"),
+        ("table", {
+            "rows": [
+                ["Goal", "Current Total", "Percent Progress", "Status"],
+                ["Recruit 100,000 new members", "15,438", "15.44%", "On Track"],
+                ["Engage 250,000 members", "13,119", "5.25%", "On Track"],
+                ["Support 65,000 walking daily", "5,634", "8.67%", "At Risk"],
+                ["Unite 3 advocacy partners", "0", "0%", "On Track"],
+                ["Raise $10M", "$3,109,294.25", "31.09%", "On Track"],
+                ["Establish Care Village (40k)", "7,660", "19.15%", "On Track"],
+                ["Achieve 85% organizational health", "100%", "100%", "On Track"]
+            ],
+            "widths": [2.5, 1.5, 1, 1],
+            "align": "CENTER",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "GirlTREK General Member Profile"),
+        ("text", "The Everyday Health Activist - Age: 52 years old"),
+        ("text", "Education: College-educated with bachelor's degree"),
+        ("text", "Income: $100K+ annually (69% of engaged members)"),
+        ("text", "Location: Southern states (GA, TX, FL) or urban metros"),
+        ("text", "Walking Habit: 30 minutes/day, 5 days/week"),
+    ],
+    "Recruitment": [
+        ("subheading", "Recruitment Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal", "Status"],
+                ["Total New Members", "15,438", "100,000", "At Risk"],
+                ["New Members Age 18-25", "316", "100,000", "At Risk"],
+                ["Total Recruitment Partnerships", "18", "10", "Achieved"]
+            ],
+            "widths": [2.5, 1.5, 1, 1],
+            "align": "CENTER",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Recruitment Programs"),
+        ("text", "College Crews: 11/100 leads recruited (11%)"),
+        ("text", "Mommy and Me: 45/50 coaches recruited (90%), 8 walks completed"),
+        ("spacer", 0.15),
+        ("subheading", "New Members by Month (Oct 2024 - Jun 2025)"),
+        ("table", {
+            "rows": [
+                ["Month", "New Members"],
+                ["Oct 2024", "1,365"],
+                ["Nov 2024", "1,419"],
+                ["Dec 2024", "182"],
+                ["Jan 2025", "591"],
+                ["Feb 2025", "1,588"],
+                ["Mar 2025", "4,382"],
+                ["Apr 2025", "6,073"],
+                ["May 2025", "2,610"],
+                ["Jun 2025", "123"]
+            ],
+            "widths": [2, 2],
+            "align": "CENTER",
+            "header_padding": False,
+        }),
+    ],
+    "Engagement": [
+        ("subheading", "Engagement Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal/Context"],
+                ["Total New Crews (2025)", "727", ""],
+                ["Members Walking Daily", "5,439", "Goal: 50,000"],
+                ["Active Volunteers", "3,348", "Has hosted an event this year"],
+                ["Documented Crew Leaders", "3,856", ""],
+                ["Active Crew Leaders", "1,846", "On Track"],
+                ["Total Trained Volunteers", "11,535", ""],
+                ["Care Village Population Reached", "3,055", "Goal: 40,000 (7.64%)"]
+            ],
+            "widths": [2.5, 1.5, 2],
+            "align": "LEFT",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Special Programs"),
+        ("text", "Blue Brigade Mental Health Initiative"),
+        ("text", "- Fully Certified: 7/100 (7%)"),
+        ("text", "- In Progress: 50/100 (50%)"),
+        ("text", "- Community Care Walks: 1 scheduled"),
+        ("text", "- Wellness Walks Hosted: 4"),
+        ("spacer", 0.15),
+        ("text", "Caregiver Tribe Program"),
+        ("text", "- Workshops Completed: 2/4 (50%)"),
+        ("text", "- Caregivers Engaged: 649"),
+        ("text", "- Self-Care Assessments: 15"),
+    ],
+    "Development": [
+        ("subheading", "Development Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal", "Status"],
+                ["Total Contributions", "$3,109,294.25", "$10,000,000", "On Track"],
+                ["Total Grants", "$3,101,133.09", "17 of 48 Grants", "On Track"],
+                ["Corporate Sponsorships", "$130,000", "$1,500,000", "At Risk"],
+                ["Earned Revenue (Store)", "$99,836", "$400,000", "At Risk"],
+                ["Bricklayer's Fundraising", "$2,500", "$500,000", "At Risk"]
+            ],
+            "widths": [2.5, 1.5, 1.5, 1],
+            "align": "CENTER",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Grant Applications Summary"),
+        ("text", "Total Applications: 22"),
+        ("text", "Total Requested: $8,519,750"),
+        ("text", "Total Funded: $14,500"),
+        ("text", "Success Rate: 18.2% (3 funded out of 11 decided)"),
+        ("text", "Pending Decisions: 7"),
+    ],
+    "Marketing": [
+        ("subheading", "Marketing Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal/Industry Avg"],
+                ["Total Subscribers", "931,141", "Goal: 1,300,000"],
+                ["Active Subscribers", "320,463", "34.4% of Total"],
+                ["Average Open Rate", "18.54%", "Industry: 28.59%"],
+                ["Click-Through Rate", "1.06%", "Industry: 3.29%"]
+            ],
+            "widths": [2.5, 1.5, 2],
+            "align": "LEFT",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "META Advertising Summary"),
+        ("text", "Total Ad Spend: $11,180.19"),
+        ("text", "Total Impressions: 858,890"),
+        ("text", "Total Clicks: 5,060"),
+        ("spacer", 0.15),
+        ("text", "Campaign Performance:"),
+        ("text", "- WNBA: $3,901.12 spend, 1.23% CTR, $0.94 CPC"),
+        ("text", "- Underground App: $7,279.07 spend, 1.30% CTR, $2.37 CPC, 281 leads"),
+    ],
+    "Campaigns": [
+        ("subheading", "Self-Care School 2025 Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Context"],
+                ["Members Recruited", "5,377", "Through Self-Care School"],
+                ["Walking at Life-Saving Level", "12,037", "30+ min/day, 5 days/week"],
+                ["Total Supporting Goal", "5,634", "Goal: 65,000"],
+                ["Mental Well-Being Improvement", "998", "99.90% of respondents"],
+                ["Social Connection", "673", "68.53% of respondents"],
+                ["Empowered to Act", "907", "90.52% of respondents"],
+                ["Stronger Walking Habit", "709", "68.70% of respondents"],
+                ["Shared Lessons with Others", "819", "83.66% of respondents"]
+            ],
+            "widths": [2.5, 1.5, 2],
+            "align": "LEFT",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Knowledge Impact by Topic"),
+        ("text", "- Land rights, housing & environmental justice: 710 (71.60%)"),
+        ("text", "- Radical care, family legacy & intergenerational healing: 695 (67.34%)"),
+        ("text", "- Decarceration, gun safety & restorative justice: 658 (63.76%)"),
+        ("text", "- Safety, self-defense & public resource access: 645 (64.40%)"),
+        ("text", "- Mental health & emotional boundaries: 622 (60.27%)"),
+        ("text", "- Self-esteem, celebration & personal empowerment: 602 (58.33%)"),
+        ("text", "- Civic engagement & political participation: 569 (57.00%)"),
+        ("text", "- Parenting, mentorship & end-of-life planning: 536 (51.94%)"),
+    ],
+    "Operations": [
+        ("subheading", "Operations Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal/Budget"],
+                ["YTD Revenue", "$3,243,526", "Budget: $1,237,419"],
+                ["YTD Expenses", "$2,343,862", "Budget: $1,608,765"],
+                ["Asana Adoption", "38%", "Goal: 85%"],
+                ["Audit Compliance", "100%", "Goal: 100%"],
+                ["Cybersecurity Compliance", "70%", "Goal: 90%"],
+                ["Staff Retention", "94%", "Industry Avg: 86%"],
+                ["Employee Satisfaction", "88%", "Target: 85%"],
+                ["Store Sales", "$99,836", "Goal: $400,000"]
+            ],
+            "widths": [2.5, 1.5, 2],
+            "align": "LEFT",
+        }),
+    ],
+    "Member Care": [
+        ("subheading", "Member Care Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal"],
+                ["Member Satisfaction Rating", "93%", "Goal: 95%"],
+                ["Resolution/Responsiveness Rate", "2 hours", "Goal: 48 hours"]
+            ],
+            "widths": [2.5, 1.5, 2],
+            "align": "LEFT",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Top Member Issues"),
+        ("text", "• SCS Registration Error Message"),
+        ("text", "• Connecting to the Movement"),
+        ("spacer", 0.25),
+        ("subheading", "Member Impact"),
+        ("text", "- Karen Laing: Found joy and healing during job loss and housing challenges"),
+        ("text", "- Angelia Taylor: Lost 106 pounds through plant-based eating"),
+        ("text", "- Alicia Cross: Continuing journey despite knee replacement surgery"),
+    ],
+    "Advocacy": [
+        ("subheading", "Advocacy Metrics"),
+        ("table", {
+            "rows": [
+                ["Metric", "Current Value", "Goal"],
+                ["Advocacy Briefs Published", "7/10", "On Track"],
+                ["Advocacy Partnerships", "0/3", "On Track"],
+                ["Member Listening Sessions", "0/5", "In 5 key geographies"],
+                ["Case Studies", "0/4", "Showcasing local impact"]
+            ],
+            "widths": [2.5, 1.5, 2],
+            "align": "LEFT",
+        }),
+        ("spacer", 0.25),
+        ("text", "Note: Timeline adjusted to Q1 2026 based on external conditions"),
+        ("text", "Active partnerships in development with 1K Women Strong and Health in Partnership (HiP)"),
+    ],
+    "Impact": [
+        ("subheading", "Impact Metrics - Self-Care School 2025"),
+        ("table", {
+            "rows": [
+                ["Metric", "Participants", "Percentage"],
+                ["Mental Well-Being Improvement", "998", "99.90%"],
+                ["Social Connection", "673", "68.53%"],
+                ["Empowered to Take Action", "907", "90.52%"],
+                ["Stronger Walking Habit", "709", "68.70%"],
+                ["Implemented New Habits", "293", "34.92%"],
+                ["Shared with Others", "819", "83.66%"]
+            ],
+            "widths": [3, 1.5, 1.5],
+            "align": "CENTER",
+        }),
+        ("spacer", 0.25),
+        ("subheading", "Summary"),
+        ("text", "Total Knowledge Topics: 8"),
+        ("text", "Average Impact per Topic: 630 participants (61.08%)"),
+        ("text", "Total Knowledge Impacts: 5,037 across all topics"),
+    ],
+}
+
+
+def pdf_context(metrics):
+    """Format the live key metrics referenced by {placeholders} in the layouts"""
+    return {
+        "total_membership": format_number(metrics["total_membership"]),
+        "new_members": format_number(metrics["new_members"]),
+        "total_contributions": format_currency(metrics["total_contributions"]),
+    }
+
+
+def fill_cell(cell, context):
+    return cell.format_map(context) if "{" in cell else cell
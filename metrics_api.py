@@ -0,0 +1,181 @@
+"""Read-only JSON API over the dashboard's metrics and datasets.
+
+    python metrics_api.py --port 8502
+
+or set DASHBOARD_API_PORT to serve it from a thread inside the Streamlit
+process. Endpoints:
+
+    /api                      index of endpoints and the data version
+    /api/metrics              key metrics
+    /api/report-card          report card goals
+    /api/sections             datasets behind each section
+    /api/sections/<section>   every dataset of one section (e.g. member-care)
+    /api/datasets/<name>      one dataset as records
+    /health                   warm-up progress; 200 once caches are built, 503 before
+    /metrics                  Prometheus metrics: rerun latency, sessions, caches, memory
+
+Responses are serialized once per dataset version and carry an ETag, so
+clients polling with If-None-Match get an empty 304 back.
+"""
+import argparse
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cache_registry import get_cache
+from datasets import (
+    KEY_METRICS, REPORT_CARD, SECTION_DATASETS, dataset_versions, datasets_version, load_datasets
+)
+from monitoring import CONTENT_TYPE, render_metrics
+from warmup import health, start_api_warmup
+
+_response_cache = get_cache("api_responses", maxsize=128)
+
+
+def slugify(name):
+    return name.lower().replace(" ", "-")
+
+
+def dataset_records(name):
+    df = load_datasets()[name]
+    return {
+        "name": name,
+        "version": dataset_versions()[name],
+        "rows": len(df),
+        "columns": list(df.columns),
+        "data": json.loads(df.to_json(orient="records", date_format="iso")),
+    }
+
+
+def build_payload(path):
+    """Return the JSON-ready payload for a path, or None if it does not exist"""
+    parts = [part for part in path.split("/") if part]
+    if not parts or parts[0] != "api":
+        return None
+    parts = parts[1:]
+    if not parts:
+        return {
+            "version": datasets_version(),
+            "endpoints": ["/api/metrics", "/api/report-card", "/api/sections"]
+            + [f"/api/sections/{slugify(section)}" for section in SECTION_DATASETS]
+            + [f"/api/datasets/{name}" for name in load_datasets()],
+        }
+    if parts == ["metrics"]:
+        return KEY_METRICS
+    if parts == ["report-card"]:
+        return [dict(zip(REPORT_CARD, row)) for row in zip(*REPORT_CARD.values())]
+    if parts == ["sections"]:
+        return SECTION_DATASETS
+    if len(parts) == 2 and parts[0] == "sections":
+        for section, names in SECTION_DATASETS.items():
+            if slugify(section) == parts[1]:
+                return {"section": section, "datasets": [dataset_records(name) for name in names]}
+    if len(parts) == 2 and parts[0] == "datasets" and parts[1] in load_datasets():
+        return dataset_records(parts[1])
+    return None
+
+
+def response_etag(body):
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def get_response(path):
+    """Return (body bytes, etag) for a path, serialized once per dataset version"""
+    key = (path.rstrip("/"), datasets_version())
+    response = _response_cache.get(key)
+    if response is None:
+        payload = build_payload(path)
+        if payload is None:
+            return None  # Unknown paths are not cached, so they cannot evict real responses
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        response = body, response_etag(body)
+        _response_cache.set(key, response)
+    return response
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    server_version = "GirlTREKMetrics/1.0"
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        path = self.path.split("?", 1)[0]
+        if path.rstrip("/") == "/health":
+            self._respond_health(send_body)
+            return
+        if path.rstrip("/") == "/metrics":
+            self._send_uncached(200, CONTENT_TYPE, render_metrics().encode("utf-8"), send_body)
+            return
+        response = get_response(path)
+        if response is None:
+            self.send_error(404, "Unknown endpoint")
+            return
+        body, etag = response
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _respond_health(self, send_body):
+        state = health()
+        body = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        self._send_uncached(200 if state["ready"] else 503, "application/json", body, send_body)
+
+    def _send_uncached(self, status, content_type, body, send_body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Polling clients would flood the Streamlit log
+
+
+def make_server(host="127.0.0.1", port=8502):
+    return ThreadingHTTPServer((host, port), MetricsHandler)
+
+
+@lru_cache(maxsize=None)
+def start_api_server(host="127.0.0.1", port=8502):
+    """Serve the API from a daemon thread, once per process; returns None if the port is taken"""
+    try:
+        server = make_server(host, port)
+    except OSError as e:
+        print(f"Metrics API not started on {host}:{port}: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name="metrics-api", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the dashboard metrics as read-only JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    start_api_warmup()
+    print(f"Serving dashboard metrics on http://{args.host}:{args.port}/api")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Prometheus text exposition of the dashboard's runtime metrics.
+
+Served by the metrics API at /metrics. Covers rerun latency per section,
+the other timing spans from perf.py (figures, PDFs, exports), notes write
+latency, active Streamlit sessions, hit/miss/eviction counts of every
+process cache and the process's resident memory. Only meaningful when the
+API runs inside the Streamlit process (DASHBOARD_API_PORT or serve.py).
+"""
+import os
+import threading
+import time
+import weakref
+
+import perf
+from cache_registry import all_caches
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+START_TIME = time.time()
+
+_sessions_lock = threading.Lock()
+_sessions = 0
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsWriter:
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name, kind, help_text):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name, value, labels=None):
+        self.lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(self, name, counts, count, total, labels=None):
+        labels = labels or {}
+        cumulative = 0
+        for bound, bucket_count in zip(perf.BUCKETS + ("+Inf",), counts):
+            cumulative += bucket_count
+            self.sample(f"{name}_bucket", cumulative, dict(labels, le=bound if bound == "+Inf" else repr(bound)))
+        self.sample(f"{name}_sum", total, labels)
+        self.sample(f"{name}_count", count, labels)
+
+    def text(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def _session_ended():
+    global _sessions
+    with _sessions_lock:
+        _sessions -= 1
+
+
+class SessionTracker:
+    """Kept in a session's state; counts the session as active until it is discarded"""
+
+    def __init__(self):
+        global _sessions
+        with _sessions_lock:
+            _sessions += 1
+        weakref.finalize(self, _session_ended)
+
+
+def active_sessions():
+    """Number of Streamlit sessions holding a SessionTracker in this process"""
+    with _sessions_lock:
+        return _sessions
+
+
+def resident_memory():
+    """Return ("current" or "peak", bytes) for this process's resident memory"""
+    try:
+        with open("/proc/self/statm") as f:
+            return "current", int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return "peak", peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB elsewhere
+
+
+def render_metrics():
+    """Return the current metrics in the Prometheus text format"""
+    out = MetricsWriter()
+    histograms = perf.histograms()
+
+    out.family("dashboard_rerun_seconds", "histogram", "Script rerun latency by the section on screen")
+    for (name, label), (counts, count, total) in sorted(histograms.items()):
+        if name == "rerun":
+            out.histogram("dashboard_rerun_seconds", counts, count, total, {"section": label})
+
+    out.family("dashboard_notes_write_seconds", "histogram", "Latency of notes transactions")
+    for (name, label), (counts, count, total) in sorted(histograms.items()):
+        if name == "notes_write":
+            out.histogram("dashboard_notes_write_seconds", counts, count, total)
+
+    out.family("dashboard_span_seconds", "histogram", "Latency of timed sections, figure builds, PDFs and exports")
+    for (name, label), (counts, count, total) in sorted(histograms.items()):
+        if name not in ("rerun", "notes_write"):
+            out.histogram("dashboard_span_seconds", counts, count, total, {"span": name, "label": label})
+
+    out.family("dashboard_active_sessions", "gauge", "Streamlit sessions open in this process")
+    out.sample("dashboard_active_sessions", active_sessions())
+
+    caches = sorted(all_caches().items())
+    stats = [(name, cache.stats()) for name, cache in caches]
+    for metric, key, kind, help_text in [
+        ("dashboard_cache_hits_total", "hits", "counter", "Cache lookups that found an entry"),
+        ("dashboard_cache_misses_total", "misses", "counter", "Cache lookups that had to build the value"),
+        ("dashboard_cache_evictions_total", "evictions", "counter", "Entries dropped to stay within maxsize"),
+        ("dashboard_cache_entries", "size", "gauge", "Entries currently cached"),
+    ]:
+        out.family(metric, kind, help_text)
+        for name, cache_stats in stats:
+            out.sample(metric, cache_stats[key], {"cache": name})
+    out.family("dashboard_cache_hit_ratio", "gauge", "Hits over lookups since start (0 before the first lookup)")
+    for name, cache_stats in stats:
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        out.sample("dashboard_cache_hit_ratio", round(cache_stats["hits"] / lookups, 4) if lookups else 0.0, {"cache": name})
+
+    kind, rss = resident_memory()
+    if kind == "current":
+        out.family("process_resident_memory_bytes", "gauge", "Resident memory size in bytes")
+        out.sample("process_resident_memory_bytes", rss)
+    else:
+        out.family("process_peak_resident_memory_bytes", "gauge", "Peak resident memory size in bytes")
+        out.sample("process_peak_resident_memory_bytes", rss)
+    out.family("process_start_time_seconds", "gauge", "Start time of the process since the Unix epoch")
+    out.sample("process_start_time_seconds", round(START_TIME, 3))
+    return out.text()
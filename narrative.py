@@ -0,0 +1,221 @@
+"""Leadership updates and analysis text shown on each tab.
+
+Narrative content lives in files rather than code, one directory per
+quarter and tab:
+
+    content/2025-Q3/advocacy/update.html            leadership update (HTML)
+    content/2025-Q3/advocacy/insights.md            key insights (Markdown)
+    content/2025-Q3/advocacy/recommendations.md     strategic recommendations
+
+Files are read and sanitized once into an in-memory store, so rendering is
+a dictionary lookup. The store re-checks file modification times every few
+seconds and reloads when anything changed, so edited content goes live
+without restarting the server. Every kind of content is also kept in the
+notes search index, re-indexed on each reload.
+"""
+import hashlib
+import html
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from layouts import SECTIONS
+from notes_store import get_notes_store
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+CURRENT_QUARTER = "2025-Q3"
+CONTENT_TYPES = {".html": "html", ".md": "markdown"}
+CONTENT_KINDS = ["update", "insights", "recommendations"]
+
+ALLOWED_TAGS = {
+    "a", "b", "blockquote", "br", "div", "em", "h3", "h4", "h5", "h6", "hr", "i", "li", "mark",
+    "ol", "p", "span", "strong", "table", "tbody", "td", "th", "thead", "tr", "u", "ul"
+}
+VOID_TAGS = {"br", "hr"}
+DROPPED_TAGS = {"script", "style", "iframe", "object", "embed", "template"}  # dropped with their content
+SAFE_STYLE = re.compile(r"^[\w\s:;.,%#()-]*$")
+SAFE_URL = re.compile(r"^(https?:|mailto:|#)", re.IGNORECASE)
+
+
+class _Sanitizer(HTMLParser):
+    """Rebuild HTML keeping only allowlisted tags and attributes"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_TAGS:
+            self.skipping += 1
+        if self.skipping or tag not in ALLOWED_TAGS:
+            return
+        kept = []
+        for name, value in attrs:
+            value = value or ""
+            if name == "style" and SAFE_STYLE.match(value) and "expression" not in value.lower():
+                kept.append((name, value))
+            elif name == "href" and tag == "a" and SAFE_URL.match(value.strip()):
+                kept.append((name, value.strip()))
+            elif name == "title":
+                kept.append((name, value))
+        attributes = "".join(f' {name}="{html.escape(value)}"' for name, value in kept)
+        self.parts.append(f"<{tag}{attributes}>")
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in DROPPED_TAGS:
+            self.skipping -= 1
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_TAGS:
+            self.skipping = max(self.skipping - 1, 0)
+        elif not self.skipping and tag in ALLOWED_TAGS and tag not in VOID_TAGS:
+            self.parts.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(html.escape(data, quote=False))
+
+
+def sanitize_html(text):
+    """Strip scripts, event handlers and unknown tags from trusted-but-edited HTML"""
+    sanitizer = _Sanitizer()
+    sanitizer.feed(text)
+    sanitizer.close()
+    return "".join(sanitizer.parts).strip()
+
+
+def tab_slug(tab_name):
+    return tab_name.lower().replace(" ", "-")
+
+
+def load_content(directory):
+    """Return {(quarter, tab slug, kind): text} for every content file under directory"""
+    content = {}
+    if not os.path.isdir(directory):
+        return content
+    for quarter in sorted(os.listdir(directory)):
+        quarter_dir = os.path.join(directory, quarter)
+        if not os.path.isdir(quarter_dir):
+            continue
+        for slug in sorted(os.listdir(quarter_dir)):
+            tab_dir = os.path.join(quarter_dir, slug)
+            if not os.path.isdir(tab_dir):
+                continue
+            for filename in sorted(os.listdir(tab_dir)):
+                kind, ext = os.path.splitext(filename)
+                if ext not in CONTENT_TYPES:
+                    continue
+                with open(os.path.join(tab_dir, filename), encoding="utf-8") as f:
+                    text = f.read()
+                content[(quarter, slug, kind)] = sanitize_html(text) if CONTENT_TYPES[ext] == "html" else text.strip()
+    return content
+
+
+class NarrativeStore:
+    def __init__(self, directory=CONTENT_DIR, interval=2.0):
+        self.directory = directory
+        self.interval = interval
+        self.version = ""
+        self._content = {}
+        self._signature = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._listeners = []
+        self.refresh(force=True)
+
+    def subscribe(self, listener):
+        """Call listener(store) after every reload of changed content"""
+        self._listeners.append(listener)
+
+    def _scan(self):
+        signature = []
+        for root, dirs, files in os.walk(self.directory):
+            dirs.sort()
+            for filename in sorted(files):
+                if os.path.splitext(filename)[1] in CONTENT_TYPES:
+                    stat = os.stat(os.path.join(root, filename))
+                    signature.append((os.path.relpath(os.path.join(root, filename), self.directory),
+                                      stat.st_mtime_ns, stat.st_size))
+        return signature
+
+    def refresh(self, force=False):
+        """Reload the content if any file was added, removed or modified since the last check"""
+        now = time.monotonic()
+        if not force and now - self._checked < self.interval:
+            return
+        with self._lock:
+            self._checked = now
+            try:
+                signature = self._scan()
+                if signature == self._signature:
+                    return
+                content = load_content(self.directory)
+            except Exception as e:
+                print(f"Error loading narrative content: {e}")
+                return  # Keep serving the last good content
+            self._content = content
+            self._signature = signature
+            self.version = hashlib.sha256(repr(sorted(content.items())).encode("utf-8")).hexdigest()[:16]
+        for listener in self._listeners:
+            try:
+                listener(self)
+            except Exception as e:
+                print(f"Error notifying narrative listener: {e}")
+
+    def get(self, tab_name, kind, quarter=CURRENT_QUARTER, default=""):
+        """Return a tab's sanitized content of one kind (update, insights, recommendations)"""
+        self.refresh()
+        return self._content.get((quarter, tab_slug(tab_name), kind), default)
+
+    def documents(self, kind, quarter=CURRENT_QUARTER):
+        """Return {tab name: content} for the tabs that have content of one kind"""
+        self.refresh()
+        content = self._content
+        return {
+            tab: content[(quarter, tab_slug(tab), kind)]
+            for tab in SECTIONS
+            if (quarter, tab_slug(tab), kind) in content
+        }
+
+    def board_updates(self, quarter=CURRENT_QUARTER):
+        """Return {tab name: update HTML} for the tabs that have a leadership update"""
+        return self.documents("update", quarter)
+
+    def quarters(self):
+        self.refresh()
+        return sorted({quarter for quarter, _, _ in self._content})
+
+
+@lru_cache(maxsize=None)
+def get_narrative_store():
+    """Return the process-wide narrative content store"""
+    return NarrativeStore()
+
+
+def index_for_search(store):
+    """Replace the narrative documents in the notes search index, one kind at a time"""
+    notes_store = get_notes_store()
+    for kind in CONTENT_KINDS:
+        notes_store.index_content(kind, store.documents(kind))
+
+
+@lru_cache(maxsize=None)
+def start_search_indexing():
+    """Index the narrative content now and again whenever the store reloads changed files"""
+    store = get_narrative_store()
+    store.subscribe(index_for_search)
+    index_for_search(store)
+    return store
+
+
+def get_narrative(tab_name, kind, quarter=CURRENT_QUARTER):
+    return get_narrative_store().get(tab_name, kind, quarter)
+
+
+def board_updates(quarter=CURRENT_QUARTER):
+    return get_narrative_store().board_updates(quarter)
@@ -0,0 +1,110 @@
+"""Debounced write-behind queue for note autosave.
+
+Edits are coalesced per tab and written by a background thread once a tab
+has been quiet for a short window (or has been pending for max_delay), so
+a burst of keystroke-driven reruns becomes one revision. Every flush
+writes all pending tabs in a single transaction, which costs one WAL
+fsync instead of one per tab. The same thread compacts the notes journal
+about once a day, after a flush.
+"""
+import atexit
+import threading
+import time
+import weakref
+from functools import lru_cache
+
+from notes_cache import get_notes_cache
+from notes_store import get_notes_store
+
+
+class NoteWriteQueue:
+    def __init__(self, store, delay=1.0, max_delay=5.0, reader=None):
+        self.store = store
+        self.reader = reader or store
+        self.delay = delay
+        self.max_delay = max_delay
+        self._pending = {}  # tab -> (body, saved_at, first_queued, last_queued)
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="note-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, tab, body, saved_at=None):
+        """Queue the latest text for a tab, replacing any unflushed edit"""
+        now = time.monotonic()
+        with self._cond:
+            first_queued = self._pending[tab][2] if tab in self._pending else now
+            self._pending[tab] = (body, saved_at, first_queued, now)
+            self._cond.notify()
+
+    def pending(self, tab):
+        """Return the unflushed text for a tab, or None if nothing is queued"""
+        with self._cond:
+            entry = self._pending.get(tab)
+            return entry[0] if entry else None
+
+    def read(self, tab):
+        """Return a tab's note including edits that have not been flushed yet"""
+        body = self.pending(tab)
+        return self.reader.get(tab) if body is None else body
+
+    def flush(self, tabs=None):
+        """Write pending edits now (all tabs, or only the given ones)"""
+        with self._flush_lock:
+            with self._cond:
+                selected = list(self._pending) if tabs is None else [t for t in tabs if t in self._pending]
+                batch = [(tab, self._pending.pop(tab)) for tab in selected]
+            if batch:
+                try:
+                    self.store.save_many([(tab, body, saved_at) for tab, (body, saved_at, _, _) in batch])
+                except Exception:
+                    # Put the edits back unless a newer one arrived meanwhile
+                    with self._cond:
+                        for tab, entry in batch:
+                            self._pending.setdefault(tab, entry)
+                    raise
+            return len(batch)
+
+    def _due(self, now):
+        return [
+            tab for tab, (_, _, first_queued, last_queued) in self._pending.items()
+            if now - last_queued >= self.delay or now - first_queued >= self.max_delay
+        ]
+
+    def _next_deadline(self):
+        return min(
+            min(last_queued + self.delay, first_queued + self.max_delay)
+            for _, _, first_queued, last_queued in self._pending.values()
+        )
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                now = time.monotonic()
+                due = self._due(now)
+                if not due:
+                    self._cond.wait(timeout=max(self._next_deadline() - now, 0))
+                    continue
+            try:
+                self.flush(due)
+                self.store.maybe_compact()
+            except Exception as e:
+                print(f"Error flushing notes: {e}")
+                time.sleep(self.delay)
+
+
+class SessionFlushGuard:
+    """Kept in a session's state; flushes pending notes when the session is discarded"""
+
+    def __init__(self, writer):
+        weakref.finalize(self, writer.flush)
+
+
+@lru_cache(maxsize=None)
+def get_note_writer():
+    """Return the process-wide note writer, flushed again at interpreter exit"""
+    writer = NoteWriteQueue(get_notes_store(), reader=get_notes_cache())
+    atexit.register(writer.flush)
+    return writer
@@ -0,0 +1,78 @@
+"""Process-level cache of the newest revision of every note.
+
+The cache is loaded once per process and kept current by the notes store's
+change events. A watcher thread polls SQLite's data_version so that notes
+saved by other processes (the export CLI, a second server) are picked up
+too. New sessions read their notes from memory instead of the database.
+"""
+import threading
+import time
+from functools import lru_cache
+
+from notes_store import get_notes_store
+
+
+class NotesCache:
+    def __init__(self, store, interval=2.0):
+        self.store = store
+        self.interval = interval
+        self._heads = {}  # tab -> (revision, body, saved_at)
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._apply(store.heads())
+        store.subscribe(self._apply)
+        self._thread = threading.Thread(target=self._watch, name="notes-watcher", daemon=True)
+        self._thread.start()
+
+    def subscribe(self, listener):
+        """Call listener([(tab, revision, body, saved_at), ...]) for every new revision, local or external"""
+        self._listeners.append(listener)
+
+    def get(self, tab):
+        """Return the current text of a tab's notes ("" if never saved)"""
+        head = self._heads.get(tab)
+        return head[1] if head else ""
+
+    def latest(self, tab):
+        """Return (revision, body, saved_at) for a tab's newest revision, or None"""
+        return self._heads.get(tab)
+
+    def recent(self, limit=20):
+        """Return [(tab, revision, body, saved_at), ...] for the most recently saved tabs, newest first"""
+        with self._lock:
+            heads = sorted(self._heads.items(), key=lambda item: item[1][2], reverse=True)
+        return [(tab, revision, body, saved_at) for tab, (revision, body, saved_at) in heads[:limit]]
+
+    def _apply(self, changes):
+        # Local saves arrive from the store and may also be seen by the watcher; keep the first
+        with self._lock:
+            fresh = []
+            for tab, revision, body, saved_at in changes:
+                head = self._heads.get(tab)
+                if head is None or revision > head[0]:
+                    self._heads[tab] = (revision, body, saved_at)
+                    fresh.append((tab, revision, body, saved_at))
+        if fresh:
+            for listener in self._listeners:
+                try:
+                    listener(fresh)
+                except Exception as e:
+                    print(f"Error notifying notes listener: {e}")
+
+    def _watch(self):
+        version = None  # rescan once at start to catch commits made while loading
+        while True:
+            try:
+                current = self.store.data_version()
+                if current != version:
+                    version = current
+                    self._apply(sorted(self.store.heads(), key=lambda head: head[3]))
+            except Exception as e:
+                print(f"Error watching notes: {e}")
+            time.sleep(self.interval)
+
+
+@lru_cache(maxsize=None)
+def get_notes_cache():
+    """Return the process-wide notes cache"""
+    return NotesCache(get_notes_store())
@@ -0,0 +1,80 @@
+"""Streaming CSV, JSON and ZIP exports of dashboard notes.
+
+Rows are produced one revision at a time and written through csv.writer
+(RFC 4180 quoting, CRLF line endings) in small chunks, so a long note
+history is never built up as one string. The download helpers return
+bytes, the form st.download_button serves; write_notes_zip() streams into
+any file object for the batch export.
+"""
+import csv
+import io
+import json
+import zipfile
+from datetime import datetime
+
+FIELDS = ["tab", "revision", "saved_at", "notes"]
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_note_rows(store, tabs=None, history=False):
+    """Yield (tab, revision, saved_at, notes) for the current notes or every revision"""
+    for tab in tabs or sorted(store.get_all()):
+        if history:
+            for revision, body, saved_at in store.iter_revisions(tab):
+                yield tab, revision, saved_at, body
+        else:
+            head = store.latest(tab)
+            if head:
+                revision, body, saved_at = head
+                yield tab, revision, saved_at, body
+
+
+def iter_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(FIELDS)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_json(rows):
+    yield "["
+    for i, row in enumerate(rows):
+        yield ("," if i else "") + "\n  " + json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False)
+    yield "\n]\n"
+
+
+def notes_csv(store, tabs=None, history=False):
+    """Return the notes (or their full history) as UTF-8 CSV bytes"""
+    output = io.BytesIO()
+    for chunk in iter_csv(iter_note_rows(store, tabs, history)):
+        output.write(chunk.encode("utf-8"))
+    return output.getvalue()
+
+
+def write_notes_zip(fileobj, store, tabs=None):
+    """Bundle current notes and full revision history as CSV and JSON"""
+    files = [
+        ("notes.csv", lambda: iter_csv(iter_note_rows(store, tabs))),
+        ("notes_history.csv", lambda: iter_csv(iter_note_rows(store, tabs, history=True))),
+        ("notes_history.json", lambda: iter_json(iter_note_rows(store, tabs, history=True))),
+    ]
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for name, chunks in files:
+            info = zipfile.ZipInfo(name, date_time=datetime.now().timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with bundle.open(info, "w") as f:
+                for chunk in chunks():
+                    f.write(chunk.encode("utf-8"))
+
+
+def notes_zip(store, tabs=None):
+    """Return the notes bundle as ZIP bytes"""
+    output = io.BytesIO()
+    write_notes_zip(output, store, tabs)
+    return output.getvalue()
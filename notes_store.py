@@ -0,0 +1,485 @@
+"""SQLite-backed storage for tab and global dashboard notes.
+
+Notes are kept as a journal: every save appends a line-level delta
+against the previous revision, so a save costs the size of the edit
+rather than the whole text. Every SNAPSHOT_INTERVAL revisions the full
+text is checkpointed, which bounds the number of deltas replayed for a
+historical read.
+
+The journal is append-only and no revision is ever deleted by default.
+About once a day it is compacted without loss: snapshots of revisions
+older than RECENT_DAYS are thinned to one per ARCHIVE_SNAPSHOT_INTERVAL
+revisions, since old history is rarely read, while every delta stays.
+
+Pruning is opt-in. When DASHBOARD_NOTES_RETENTION_DAYS is set, revisions
+older than that many days are also thinned to the last one saved each
+day, and the surviving deltas are rewritten around the gaps. Reads as of
+a date stay exact, but the intra-day edits in between are gone for good.
+
+- Current note: one primary-key lookup in notes_head (O(1)).
+- Note as of a date: an index seek on (tab, saved_at) for the revision,
+  a seek for the nearest snapshot, then at most SNAPSHOT_INTERVAL - 1
+  deltas, or a few more than ARCHIVE_SNAPSHOT_INTERVAL for history older
+  than RECENT_DAYS (O(log n)).
+
+Current notes are also kept in an FTS5 index (together with other
+searchable content such as leadership updates), updated in the same
+transaction as each save. The database runs in WAL mode so readers never
+block the writer.
+"""
+import difflib
+import glob
+import html
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from perf import timed
+
+DB_PATH = os.environ.get("DASHBOARD_NOTES_DB", "dashboard_notes.db")
+GLOBAL_TAB = "Global"
+SNAPSHOT_INTERVAL = 16
+RECENT_DAYS = 90  # Newer revisions keep a snapshot every SNAPSHOT_INTERVAL
+ARCHIVE_SNAPSHOT_INTERVAL = 4 * SNAPSHOT_INTERVAL
+# Days of full edit history to keep; unset (the default) keeps every revision forever
+RETENTION_DAYS = os.environ.get("DASHBOARD_NOTES_RETENTION_DAYS")
+RETENTION_DAYS = int(RETENTION_DAYS) if RETENTION_DAYS else None
+COMPACT_INTERVAL = 24 * 60 * 60  # Seconds between journal compactions
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes_journal (
+    tab TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    delta TEXT NOT NULL,
+    saved_at TEXT NOT NULL,
+    PRIMARY KEY (tab, revision)
+);
+CREATE INDEX IF NOT EXISTS notes_journal_saved_at ON notes_journal (tab, saved_at, revision);
+CREATE TABLE IF NOT EXISTS notes_snapshots (
+    tab TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (tab, revision)
+);
+CREATE TABLE IF NOT EXISTS notes_head (
+    tab TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    saved_at TEXT NOT NULL
+);
+"""
+
+# Full-text index over current notes and other dashboard content (leadership updates)
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_search USING fts5(
+    kind UNINDEXED, tab UNINDEXED, body, tokenize = 'porter unicode61'
+)
+"""
+
+
+def strip_html(text):
+    return html.unescape(re.sub(r"<[^>]+>", " ", text))
+
+
+def fts_query(text):
+    """Quote each word of free-text input for FTS5; the last word matches as a prefix"""
+    terms = re.findall(r"\w+", text)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+
+
+def make_delta(old, new):
+    """Encode new as line-level edits against old.
+
+    ["=", n] keeps the next n old lines, ["-", n] drops them and
+    ["+", lines] inserts new ones.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+    return json.dumps(ops, separators=(",", ":"))
+
+
+def apply_delta(old, delta):
+    old_lines = old.splitlines(keepends=True)
+    pos = 0
+    out = []
+    for op, value in json.loads(delta):
+        if op == "=":
+            out.extend(old_lines[pos:pos + value])
+            pos += value
+        elif op == "-":
+            pos += value
+        else:
+            out.extend(value)
+    return "".join(out)
+
+
+def _timestamp(when):
+    if isinstance(when, datetime):
+        return when.strftime("%Y-%m-%d %H:%M:%S")
+    if hasattr(when, "isoformat"):
+        # A date means "as of the end of that day"
+        return f"{when.isoformat()} 23:59:59"
+    return when
+
+
+class NotesStore:
+    """Journaled notes repository, safe to share between sessions and threads"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self.search_enabled = False
+        self._listeners = []
+        self._compacted_at = 0.0
+        self._migrate()
+
+    def subscribe(self, listener):
+        """Call listener([(tab, revision, body, saved_at), ...]) after every committed save"""
+        self._listeners.append(listener)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Commits are batched by the note writer, so each one can afford a full fsync
+            conn.execute("PRAGMA synchronous=FULL")
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 2:
+                # executescript() would commit early, so run the statements one by one
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                # Version 1 kept a full copy of the text per revision in "notes"
+                legacy = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'notes'"
+                ).fetchone()
+                if legacy:
+                    rows = conn.execute(
+                        "SELECT tab, body, saved_at FROM notes ORDER BY tab, revision"
+                    ).fetchall()
+                    for tab, body, saved_at in rows:
+                        self._append(conn, tab, body, saved_at)
+                    conn.execute("DROP TABLE notes")
+            if version < 3:
+                try:
+                    conn.execute(SEARCH_SCHEMA)
+                except sqlite3.OperationalError:
+                    pass  # SQLite built without FTS5: search stays disabled
+                else:
+                    self.search_enabled = True
+                    for tab, body in conn.execute("SELECT tab, body FROM notes_head").fetchall():
+                        self._index(conn, "note", tab, body)
+            if version < SCHEMA_VERSION:
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.search_enabled = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'notes_search'"
+            ).fetchone() is not None
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _append(self, conn, tab, body, saved_at):
+        head = conn.execute("SELECT revision, body FROM notes_head WHERE tab = ?", (tab,)).fetchone()
+        revision, previous = (head[0] + 1, head[1]) if head else (1, "")
+        conn.execute(
+            "INSERT INTO notes_journal (tab, revision, delta, saved_at) VALUES (?, ?, ?, ?)",
+            (tab, revision, make_delta(previous, body), saved_at)
+        )
+        if revision % SNAPSHOT_INTERVAL == 1:
+            conn.execute(
+                "INSERT INTO notes_snapshots (tab, revision, body) VALUES (?, ?, ?)",
+                (tab, revision, body)
+            )
+        conn.execute(
+            "INSERT OR REPLACE INTO notes_head (tab, revision, body, saved_at) VALUES (?, ?, ?, ?)",
+            (tab, revision, body, saved_at)
+        )
+        if self.search_enabled:
+            self._index(conn, "note", tab, body)
+        return revision
+
+    def _prune_tab(self, conn, tab, cutoff):
+        head = conn.execute("SELECT revision FROM notes_head WHERE tab = ?", (tab,)).fetchone()[0]
+        rows = conn.execute(
+            "SELECT revision, delta, saved_at FROM notes_journal WHERE tab = ? ORDER BY revision", (tab,)
+        ).fetchall()
+        # A read as of a day picks the newest (saved_at, revision) up to its end, so keep that one per day
+        last_of_day = {}
+        for revision, _, saved_at in rows:
+            if saved_at < cutoff:
+                last_of_day[saved_at[:10]] = max(last_of_day.get(saved_at[:10], ("", 0)), (saved_at, revision))
+        keep = {revision for _, revision in last_of_day.values()} | {head}
+        dropped = [revision for revision, _, saved_at in rows if saved_at < cutoff and revision not in keep]
+        if not dropped:
+            return 0
+
+        body = kept_body = ""
+        kept = 0
+        gap = False
+        conn.execute("DELETE FROM notes_snapshots WHERE tab = ?", (tab,))
+        for revision, delta, saved_at in rows:
+            body = apply_delta(body, delta)
+            if saved_at < cutoff and revision not in keep:
+                conn.execute("DELETE FROM notes_journal WHERE tab = ? AND revision = ?", (tab, revision))
+                gap = True
+                continue
+            if gap:  # Re-diff against the last kept revision
+                conn.execute(
+                    "UPDATE notes_journal SET delta = ? WHERE tab = ? AND revision = ?",
+                    (make_delta(kept_body, body), tab, revision)
+                )
+                gap = False
+            if kept % SNAPSHOT_INTERVAL == 0 or revision % SNAPSHOT_INTERVAL == 1:
+                conn.execute(
+                    "INSERT INTO notes_snapshots (tab, revision, body) VALUES (?, ?, ?)",
+                    (tab, revision, body)
+                )
+            kept_body = body
+            kept += 1
+        return len(dropped)
+
+    def _fold_snapshots(self, conn, tab, cutoff):
+        rows = conn.execute(
+            "SELECT j.revision, j.saved_at, s.revision IS NOT NULL FROM notes_journal j "
+            "LEFT JOIN notes_snapshots s ON s.tab = j.tab AND s.revision = j.revision "
+            "WHERE j.tab = ? ORDER BY j.revision",
+            (tab,)
+        ).fetchall()
+        folded = 0
+        since = None  # Revisions since the last snapshot kept
+        for revision, saved_at, has_snapshot in rows:
+            if has_snapshot:
+                if saved_at < cutoff and since is not None and since < ARCHIVE_SNAPSHOT_INTERVAL:
+                    conn.execute("DELETE FROM notes_snapshots WHERE tab = ? AND revision = ?", (tab, revision))
+                    folded += 1
+                else:
+                    since = 0
+            if since is not None:
+                since += 1
+        return folded
+
+    def compact(self, retention_days=RETENTION_DAYS):
+        """Fold old snapshots, and prune old revisions if retention_days is set.
+
+        Returns (snapshots folded, revisions pruned).
+        """
+        now = datetime.now()
+        recent = (now - timedelta(days=RECENT_DAYS)).strftime("%Y-%m-%d")
+        retained = (now - timedelta(days=retention_days)).strftime("%Y-%m-%d") if retention_days else None
+        conn = self._connection()
+        folded = pruned = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for (tab,) in conn.execute("SELECT tab FROM notes_head").fetchall():
+                if retained:
+                    pruned += self._prune_tab(conn, tab, retained)
+                folded += self._fold_snapshots(conn, tab, recent)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._compacted_at = time.time()
+        return folded, pruned
+
+    def maybe_compact(self):
+        """Compact the journal if the last compaction was more than COMPACT_INTERVAL ago"""
+        if time.time() - self._compacted_at >= COMPACT_INTERVAL:
+            self.compact()
+
+    def _index(self, conn, kind, tab, text):
+        conn.execute("DELETE FROM notes_search WHERE kind = ? AND tab = ?", (kind, tab))
+        if text.strip():
+            conn.execute("INSERT INTO notes_search (kind, tab, body) VALUES (?, ?, ?)", (kind, tab, text))
+
+    def index_content(self, kind, documents):
+        """Replace all searchable documents of one kind with {tab: html or text}"""
+        if not self.search_enabled:
+            return
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM notes_search WHERE kind = ?", (kind,))
+            for tab, text in documents.items():
+                self._index(conn, kind, tab, strip_html(text))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def search(self, text, limit=10):
+        """Return ranked hits as [{"kind", "tab", "snippet"}], best match first"""
+        query = fts_query(text)
+        if not self.search_enabled or query is None:
+            return []
+        rows = self._connection().execute(
+            "SELECT kind, tab, snippet(notes_search, 2, '[[', ']]', '…', 16) FROM notes_search "
+            "WHERE notes_search MATCH ? ORDER BY bm25(notes_search) LIMIT ?",
+            (query, limit)
+        ).fetchall()
+        return [{"kind": kind, "tab": tab, "snippet": snippet} for kind, tab, snippet in rows]
+
+    def get(self, tab):
+        """Return the current text of a tab's notes ("" if never saved)"""
+        row = self._connection().execute("SELECT body FROM notes_head WHERE tab = ?", (tab,)).fetchone()
+        return row[0] if row else ""
+
+    def latest(self, tab):
+        """Return (revision, body, saved_at) for a tab's newest revision, or None"""
+        return self._connection().execute(
+            "SELECT revision, body, saved_at FROM notes_head WHERE tab = ?", (tab,)
+        ).fetchone()
+
+    def get_all(self):
+        """Return {tab: current text} for every tab with saved notes"""
+        return dict(self._connection().execute("SELECT tab, body FROM notes_head").fetchall())
+
+    def get_revision(self, tab, revision):
+        """Rebuild a tab's text at a given revision from the nearest snapshot"""
+        conn = self._connection()
+        snapshot = conn.execute(
+            "SELECT revision, body FROM notes_snapshots WHERE tab = ? AND revision <= ? "
+            "ORDER BY revision DESC LIMIT 1",
+            (tab, revision)
+        ).fetchone()
+        if snapshot is None:
+            return ""
+        body = snapshot[1]
+        for (delta,) in conn.execute(
+            "SELECT delta FROM notes_journal WHERE tab = ? AND revision > ? AND revision <= ? ORDER BY revision",
+            (tab, snapshot[0], revision)
+        ):
+            body = apply_delta(body, delta)
+        return body
+
+    def iter_revisions(self, tab):
+        """Yield (revision, body, saved_at) for every revision of a tab, oldest first"""
+        rows = self._connection().execute(
+            "SELECT revision, delta, saved_at FROM notes_journal WHERE tab = ? ORDER BY revision", (tab,)
+        ).fetchall()
+        body = ""
+        for revision, delta, saved_at in rows:
+            body = apply_delta(body, delta)
+            yield revision, body, saved_at
+
+    def get_as_of(self, tab, when):
+        """Return a tab's text as it was at a datetime (or end of a date)"""
+        row = self._connection().execute(
+            "SELECT revision FROM notes_journal WHERE tab = ? AND saved_at <= ? "
+            "ORDER BY saved_at DESC, revision DESC LIMIT 1",
+            (tab, _timestamp(when))
+        ).fetchone()
+        return self.get_revision(tab, row[0]) if row else ""
+
+    def get_all_as_of(self, when):
+        """Return {tab: text as of when} for every tab with saved notes"""
+        tabs = [row[0] for row in self._connection().execute("SELECT tab FROM notes_head")]
+        return {tab: self.get_as_of(tab, when) for tab in tabs}
+
+    def heads(self):
+        """Return [(tab, revision, body, saved_at), ...] for the newest revision of every tab"""
+        return self._connection().execute(
+            "SELECT tab, revision, body, saved_at FROM notes_head"
+        ).fetchall()
+
+    def data_version(self):
+        """Return a counter that changes whenever another connection commits"""
+        return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def history(self, tab, limit=50):
+        """Return [(revision, saved_at), ...] for a tab, newest first"""
+        return self._connection().execute(
+            "SELECT revision, saved_at FROM notes_journal WHERE tab = ? ORDER BY revision DESC LIMIT ?",
+            (tab, limit)
+        ).fetchall()
+
+    def save(self, tab, body, saved_at=None):
+        """Append a new revision of a tab's notes and return its number"""
+        return self.save_many([(tab, body, saved_at)])[0]
+
+    @timed("notes_write")
+    def save_many(self, items):
+        """Append revisions for several (tab, body, saved_at) items in one transaction"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._connection()
+        revisions = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for tab, body, saved_at in items:
+                revisions.append(self._append(conn, tab, body, saved_at or now))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        changes = [(tab, revision, body, saved_at or now) for (tab, body, saved_at), revision in zip(items, revisions)]
+        for listener in self._listeners:
+            try:
+                listener(changes)
+            except Exception as e:
+                print(f"Error notifying notes listener: {e}")
+        return revisions
+
+    def clear(self, tab):
+        """Record an empty revision so the cleared note stays in history"""
+        return self.save(tab, "")
+
+    def migrate_text_files(self, directory="."):
+        """Import legacy notes_{tab}.txt / global_notes.txt files for tabs with no history yet"""
+        imported = 0
+        paths = glob.glob(os.path.join(directory, "notes_*.txt"))
+        paths.append(os.path.join(directory, "global_notes.txt"))
+        for path in paths:
+            name = os.path.basename(path)
+            tab = GLOBAL_TAB if name == "global_notes.txt" else name[len("notes_"):-len(".txt")]
+            try:
+                with open(path, "r") as f:
+                    body = f.read()
+            except FileNotFoundError:
+                continue
+            saved_at = datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M:%S")
+            conn = self._connection()
+            # Check and import in one transaction, so concurrent processes import each file once
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.latest(tab) is None:
+                    self._append(conn, tab, body, saved_at)
+                    imported += 1
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return imported
+
+
+@lru_cache(maxsize=None)
+def get_notes_store(path=DB_PATH):
+    """Return the process-wide notes store, importing legacy .txt notes on first use"""
+    store = NotesStore(path)
+    store.migrate_text_files(os.path.dirname(os.path.abspath(path)))
+    return store
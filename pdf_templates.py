@@ -0,0 +1,253 @@
+"""ReportLab styles and section layouts shared by every dashboard PDF export.
+
+Paragraph and table styles are built once per (theme, accent color) and
+reused, and each section's PDF content is declared as data in
+layouts.SECTION_LAYOUTS. Nothing here touches Streamlit, so sections can be
+rendered from worker threads or processes. Complete Dashboard PDFs are
+assembled from per-section fragments cached by content hash.
+"""
+import hashlib
+import io
+import time
+from datetime import datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from pypdf import PdfReader, PdfWriter
+
+from cache_registry import get_cache
+from layouts import SECTIONS, SECTION_LAYOUTS, fill_cell
+
+DEFAULT_ACCENT = "#0088FF"
+
+# Rendered Complete Dashboard section fragments, keyed by content hash
+_fragment_cache = get_cache("pdf_fragments", maxsize=64)
+
+
+@lru_cache(maxsize=None)
+def _sample_stylesheet():
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def get_pdf_styles(dark_mode=False, accent=DEFAULT_ACCENT):
+    """Return the paragraph styles for a theme, built once per (theme, accent)"""
+    accent_color = colors.HexColor(accent)
+    text_color = colors.white if dark_mode else colors.black
+    styles = _sample_stylesheet()
+    return {
+        "accent": accent_color,
+        "title": ParagraphStyle(
+            'Title',
+            parent=styles['Title'],
+            textColor=accent_color,
+            spaceAfter=12
+        ),
+        "heading": ParagraphStyle(
+            'Heading',
+            parent=styles['Heading1'],
+            textColor=accent_color,
+            spaceAfter=10
+        ),
+        "subheading": ParagraphStyle(
+            'Subheading',
+            parent=styles['Heading2'],
+            textColor=accent_color,
+            spaceAfter=8,
+            fontSize=14
+        ),
+        "normal": ParagraphStyle(
+            'Normal',
+            parent=styles['Normal'],
+            textColor=text_color,
+            spaceAfter=6
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def get_table_style(align="CENTER", header_padding=True, accent=DEFAULT_ACCENT):
+    """Return the shared metrics-table style for an alignment and accent color"""
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(accent)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ]
+    if header_padding:
+        commands.append(('BOTTOMPADDING', (0, 0), (-1, 0), 12))
+    commands.append(('GRID', (0, 0), (-1, -1), 1, colors.black))
+    return TableStyle(commands)
+
+
+def build_section_elements(section_name, styles, context, accent=DEFAULT_ACCENT):
+    """Turn a section's declared layout into ReportLab flowables"""
+    elements = []
+    for kind, value in SECTION_LAYOUTS.get(section_name, []):
+        if kind == "subheading":
+            elements.append(Paragraph(value, styles["subheading"]))
+        elif kind == "text":
+            elements.append(Paragraph(fill_cell(value, context), styles["normal"]))
+        elif kind == "spacer":
+            elements.append(Spacer(1, value*inch))
+        elif kind == "table":
+            rows = [[fill_cell(cell, context) for cell in row] for row in value["rows"]]
+            t = Table(rows, colWidths=[w*inch for w in value["widths"]])
+            t.setStyle(get_table_style(value["align"], value.get("header_padding", True), accent))
+            elements.append(t)
+    return elements
+
+
+def _build_document(elements):
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72,
+        pageCompression=1
+    )
+    doc.build(elements)
+    pdf_data = buffer.getvalue()
+    buffer.close()
+    return pdf_data
+
+
+def _header_elements(section_name, styles):
+    return [
+        Paragraph("GirlTREK Organizational Dashboard", styles["title"]),
+        Paragraph(f"Q3 2025 Metrics Overview - {section_name}", styles["heading"]),
+        Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles["normal"]),
+        Spacer(1, 0.25*inch),
+    ]
+
+
+def notes_markup(notes):
+    """Escape user-written notes for Paragraph, keeping their line breaks"""
+    return escape(notes).replace("\r\n", "\n").replace("\n", "<br/>")
+
+
+def _notes_elements(title, notes, styles):
+    return [
+        Spacer(1, 0.5*inch),
+        Paragraph(title, styles["heading"]),
+        Paragraph(notes_markup(notes), styles["normal"]),
+    ]
+
+
+def fragment_key(section_name, dark_mode, context, section_notes, accent=DEFAULT_ACCENT):
+    """Content hash of everything that affects a section fragment's pages"""
+    payload = repr((
+        section_name,
+        SECTION_LAYOUTS.get(section_name),
+        sorted((context or {}).items()),
+        section_notes,
+        dark_mode,
+        accent,
+    ))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_section_fragment(section_name, dark_mode=False, context=None, section_notes="",
+                            accent=DEFAULT_ACCENT):
+    """Render one Complete Dashboard section to its own PDF, reusing it while its inputs are unchanged"""
+    context = context or {}
+
+    def build():
+        styles = get_pdf_styles(dark_mode, accent)
+        elements = [Paragraph(section_name, styles["heading"])]
+        elements.extend(build_section_elements(section_name, styles, context, accent))
+        if section_notes:
+            elements.extend(_notes_elements("Notes", section_notes, styles))
+        return _build_document(elements)
+
+    key = fragment_key(section_name, dark_mode, context, section_notes, accent)
+    return _fragment_cache.get_or_create(key, build)
+
+
+def _global_notes_fragment(global_notes, dark_mode, accent):
+    def build():
+        styles = get_pdf_styles(dark_mode, accent)
+        return _build_document(_notes_elements("Global Dashboard Notes", global_notes, styles)[1:])
+
+    key = fragment_key("Global Dashboard Notes", dark_mode, None, global_notes, accent)
+    return _fragment_cache.get_or_create(key, build)
+
+
+def splice_pdfs(fragments):
+    """Concatenate PDF documents page by page"""
+    writer = PdfWriter()
+    for pdf_data in fragments:
+        writer.append(PdfReader(io.BytesIO(pdf_data)))
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def optimize_pdf(pdf_data):
+    """Shrink a rendered PDF for emailing and archiving.
+
+    Content streams are (re)compressed and identical objects - the font
+    resources and procsets every spliced fragment carries - are merged.
+    The dashboard only uses the built-in Helvetica faces, which are never
+    embedded, so there is no font data to subset. Returns the optimized
+    bytes and a size report; the input is kept if it was already smaller.
+    """
+    start = time.perf_counter()
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(pdf_data)))
+    for page in writer.pages:
+        page.compress_content_streams()
+    writer.compress_identical_objects()
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    optimized = buffer.getvalue()
+    if len(optimized) >= len(pdf_data):
+        optimized = pdf_data
+    report = {
+        "original_bytes": len(pdf_data),
+        "optimized_bytes": len(optimized),
+        "saved_percent": round(100 * (1 - len(optimized) / len(pdf_data)), 1),
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+    return optimized, report
+
+
+def render_pdf(section_name, dark_mode=False, context=None, section_notes="", global_notes="",
+               accent=DEFAULT_ACCENT, notes_by_section=None):
+    """Render a section (or the Complete Dashboard) to PDF bytes.
+
+    The Complete Dashboard is spliced from a fresh cover page and one cached
+    fragment per section, so only sections whose layout, metrics or notes
+    changed are re-rendered.
+    """
+    context = context or {}
+    styles = get_pdf_styles(dark_mode, accent)
+
+    if section_name == "Complete Dashboard":
+        notes_by_section = notes_by_section or {}
+        fragments = [_build_document(_header_elements(section_name, styles))]
+        fragments += [
+            render_section_fragment(section, dark_mode, context, notes_by_section.get(section, ""), accent)
+            for section in SECTIONS
+        ]
+        if global_notes:
+            fragments.append(_global_notes_fragment(global_notes, dark_mode, accent))
+        return splice_pdfs(fragments)
+
+    elements = _header_elements(section_name, styles)
+    elements.extend(build_section_elements(section_name, styles, context, accent))
+
+    if section_notes:
+        elements.extend(_notes_elements("Notes", section_notes, styles))
+
+    if global_notes:
+        elements.extend(_notes_elements("Global Dashboard Notes", global_notes, styles))
+
+    return _build_document(elements)
@@ -0,0 +1,143 @@
+"""Lightweight timing spans for reruns, sections, figures, PDFs and exports.
+
+    with span("section", "Recruitment"):
+        render_section("Recruitment", datasets)
+
+Every (name, label) pair keeps fixed histogram buckets plus its last
+SAMPLE_SIZE durations, so memory stays bounded however long the server
+runs. Spans recorded while a rerun is being timed (see rerun()) are also
+kept with that rerun, so the slowest recent reruns can be broken down.
+A span costs a few microseconds and can stay on in production.
+"""
+import bisect
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SAMPLE_SIZE = 512
+RERUN_HISTORY = 200
+
+_lock = threading.Lock()
+_histograms = {}  # (name, label) -> Histogram
+_reruns = deque(maxlen=RERUN_HISTORY)
+_local = threading.local()
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def percentile(self, q):
+        """Nearest-rank percentile (0-100) of the recent samples, in seconds"""
+        samples = sorted(self.samples)
+        if not samples:
+            return 0.0
+        return samples[max(math.ceil(q / 100 * len(samples)) - 1, 0)]
+
+
+def observe(name, label, seconds):
+    with _lock:
+        histogram = _histograms.get((name, label))
+        if histogram is None:
+            histogram = _histograms[(name, label)] = Histogram()
+        histogram.observe(seconds)
+    spans = getattr(_local, "spans", None)
+    if spans is not None:
+        spans.append((name, label, seconds))
+
+
+@contextmanager
+def span(name, label=""):
+    """Time the block and record it under (name, label)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, label, time.perf_counter() - start)
+
+
+def timed(name, label=""):
+    """Decorator form of span()"""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, label or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def label_rerun(label):
+    """Name the rerun being timed on this thread, e.g. after the section on screen"""
+    _local.rerun_label = label
+
+
+@contextmanager
+def rerun():
+    """Time a whole script run and keep the spans recorded inside it"""
+    outer = getattr(_local, "spans", None)
+    spans = _local.spans = []
+    _local.rerun_label = ""
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        _local.spans = outer
+        label = _local.rerun_label
+        observe("rerun", label, seconds)
+        with _lock:
+            _reruns.append({"started_at": started_at, "label": label, "seconds": seconds, "spans": spans})
+
+
+def summary():
+    """Return one row per span: count, mean and recent p50/p95/p99/max in milliseconds"""
+    with _lock:
+        items = [(key, h.count, h.total, list(h.samples)) for key, h in _histograms.items()]
+    rows = []
+    for (name, label), count, total, samples in sorted(items):
+        histogram = Histogram()
+        histogram.samples.extend(samples)
+        rows.append({
+            "span": name,
+            "label": label,
+            "count": count,
+            "mean_ms": round(1000 * total / count, 2),
+            "p50_ms": round(1000 * histogram.percentile(50), 2),
+            "p95_ms": round(1000 * histogram.percentile(95), 2),
+            "p99_ms": round(1000 * histogram.percentile(99), 2),
+            "max_ms": round(1000 * max(samples), 2),
+        })
+    return rows
+
+
+def slowest_reruns(limit=10):
+    """Return the slowest of the recent reruns, slowest first, each with its spans slowest first"""
+    with _lock:
+        reruns = list(_reruns)
+    reruns.sort(key=lambda run: run["seconds"], reverse=True)
+    return [
+        dict(run, spans=sorted(run["spans"], key=lambda s: s[2], reverse=True))
+        for run in reruns[:limit]
+    ]
+
+
+def histograms():
+    """Return {(name, label): (bucket counts, count, sum)} for exporting, buckets as in BUCKETS plus +Inf"""
+    with _lock:
+        return {key: (list(h.counts), h.count, h.total) for key, h in _histograms.items()}
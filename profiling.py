@@ -0,0 +1,110 @@
+"""Sampling profiler for a single rerun, enabled on demand in production.
+
+A background thread reads the profiled thread's current stack through
+sys._current_frames() every few milliseconds; the profiled code runs
+untouched, so the overhead is one stack walk per sample. The result is
+saved as folded stacks (one "frame;frame;frame count" line per distinct
+stack, the input format of flamegraph.pl and speedscope) plus a plain-text
+summary of the hottest functions.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.environ.get("DASHBOARD_PROFILE_DIR", os.path.join(BASE_DIR, "profiles"))
+INTERVAL = 0.005
+MAX_SECONDS = 120  # Stop sampling a rerun that never finishes
+TOP_N = 25
+
+
+def _frame_label(code):
+    path = code.co_filename
+    if path.startswith(BASE_DIR + os.sep):
+        path = os.path.relpath(path, BASE_DIR)
+    else:
+        path = os.sep.join(path.split(os.sep)[-2:])
+    # ";" separates frames in the folded format
+    return f"{code.co_name} ({path}:{code.co_firstlineno})".replace(";", ",")
+
+
+class SamplingProfiler:
+    def __init__(self, thread_id=None, interval=INTERVAL, max_seconds=MAX_SECONDS):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks = Counter()  # (outermost, ..., innermost) -> samples
+        self.samples = 0
+        self.seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self._started
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        deadline = time.perf_counter() + self.max_seconds
+        while not self._stop.wait(self.interval) and time.perf_counter() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def folded(self):
+        """Return the samples in folded-stack format, heaviest stacks first"""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, limit=TOP_N):
+        """Return [(function, self samples, total samples)] for the functions with the most self samples"""
+        own = Counter()
+        total = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack):  # Recursion counts once per sample
+                total[label] += count
+        hottest = sorted(total, key=lambda label: (own[label], total[label]), reverse=True)
+        return [(label, own[label], total[label]) for label in hottest[:limit]]
+
+    def summary(self, title="rerun", limit=TOP_N):
+        lines = [
+            f"Profile of {title}",
+            f"{self.samples} samples every {self.interval * 1000:.0f} ms over {self.seconds:.3f} s",
+            "",
+            f"{'self %':>7} {'total %':>8}  function",
+        ]
+        for label, own, total in self.top(limit):
+            share = 100 / max(self.samples, 1)
+            lines.append(f"{own * share:7.1f} {total * share:8.1f}  {label}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, name, directory=PROFILE_DIR, title="rerun"):
+        """Write <name>.folded and <name>.txt to directory and return both paths"""
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{name}")
+        with open(f"{stem}.folded", "w", encoding="utf-8") as f:
+            f.write(self.folded())
+        with open(f"{stem}.txt", "w", encoding="utf-8") as f:
+            f.write(self.summary(title))
+        return f"{stem}.folded", f"{stem}.txt"
@@ -0,0 +1,15 @@
+"""Dashboard sections, one module per tab.
+
+A section's module is imported the first time it is viewed and stays in
+sys.modules afterwards, so a rerun only executes the section on screen.
+"""
+import importlib
+
+
+def module_name(section_name):
+    return "sections." + section_name.lower().replace(" ", "_")
+
+
+def render_section(section_name, datasets):
+    """Import the section's module on first use and render it"""
+    importlib.import_module(module_name(section_name)).render(datasets)
@@ -0,0 +1,419 @@
+"""Advocacy tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section, status_badge
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Advocacy")
+    
+    st.markdown('<h3 class="section-title">Advocacy Metrics</h3>', unsafe_allow_html=True)
+
+    adv_col1, adv_col2 = st.columns(2)
+
+    with adv_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">ADVOCACY BRIEFS PUBLISHED</p>'
+            f'<p class="metric-value">7 / 10</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Research basis for how J&J agenda items increase Black women\'s life expectancy</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with adv_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">ADVOCACY PARTNERSHIPS</p>'
+            f'<p class="metric-value">0 / 3</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Partner-led advocacy activations</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    # Additional Advocacy Metrics
+    st.markdown('<h4>Additional Advocacy Initiatives</h4>', unsafe_allow_html=True)
+    
+    adv_col3, adv_col4 = st.columns(2)
+    
+    with adv_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">MEMBER LISTENING SESSIONS</p>'
+            f'<p class="metric-value">0 / 5</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">In 5 key geographies</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with adv_col4:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CASE STUDIES</p>'
+            f'<p class="metric-value">0 / 4</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Showcasing GirlTREK\'s local advocacy impact</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    st.markdown('<h3>Current Focus Areas</h3>', unsafe_allow_html=True)
+    st.markdown(
+        """
+        - Produce advocacy briefs establishing research basis for why each J&J agenda item leads to an increase in Black women's life expectancy
+        - Uplift best-in-class organizations
+        - Secure advocacy partners that align with GirlTREK's Joy & Justice Agenda through signed MOUs
+        - Catalyze local advocacy by convening member listening sessions in key geographies
+        - Produce compelling case studies showcasing GirlTREK's impact through local advocacy engagement
+        """,
+        unsafe_allow_html=True
+    )
+    
+    # Strategic Context
+    st.markdown('<h3>Strategic Context - Timeline Adjustment</h3>', unsafe_allow_html=True)
+    st.markdown(
+        f"""
+        <div style="background-color: #FFF3E0; border-left: 5px solid #FF9800; 
+             padding: 15px; border-radius: 5px; margin: 10px 0;">
+            <p style="color: #E65100; margin: 0;">
+            <strong>Note:</strong> Given c-suite conversations, external conditions, and internal priorities we have been reevaluating the pacing of advocacy goals. We are currently considering shifting timeline to Q1 2026, and reevaluating the approach to these objectives. Current focus includes relationship building with national and place-based organizations to test potential activations and applications, participation in national convenings and briefings, and active conversations with 1K Women Strong and Health in Partnership (HiP).
+            </p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+   # Advocacy Listening Sessions
+    st.markdown('<h3>📍 Advocacy Listening Sessions</h3>', unsafe_allow_html=True)
+    
+    with st.expander("📍 Atlanta, Georgia - August 21, 2025", expanded=False):
+        # Session Overview
+        col1, col2 = st.columns(2)
+        with col1:
+            st.info("""
+            **Session Details:**
+            - **Location:** The MURPH
+            - **Participants:** 12 GirlTREK members
+            - **Duration:** 60 minutes
+            - **Demographics:** Primarily 35+ age group
+            - **Note:** Second stop in advocacy listening tour
+            """)
+        
+        with col2:
+            st.success("""
+            **Key Insight:**
+            Atlanta members are actively engaged in their communities and embody "we are the leaders we are looking for." Ready to put something in their hands today and move it forward.
+            """)
+        
+        # Vision of a Healthy Community
+        st.markdown("#### Vision of a Healthy Community")
+        st.markdown("""
+        Atlanta members envision a healthy community that includes:
+        - **Diversity** across economic classes, shapes, sizes, and complexions
+        - **Social and spiritual support** with neighbors knowing each other
+        - **Access to services:** healthcare, dental, mental health
+        - **Economic opportunity:** living wages and job security
+        - **Safe infrastructure:** proper streetlights and sidewalks
+        - **Gathering spaces** like Grant Park where everyone feels welcome
+        - **Food access:** fresh fruits and vegetables, addressing food deserts
+        - **Sisterhood** that extends beyond walking together
+        """)
+        
+        st.markdown("> *\"A healthy community is a place where you feel safe to be yourself, where people know each other, and where you have a sisterhood. It's like a village where you can rely on others and feel heard when you have problems.\"*")
+        
+        # Priority Issues
+        st.markdown("#### Priority Issues & Concerns")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("""
+            **🏠 Housing Affordability**
+            - Atlanta now <50% Black due to gentrification
+            - Property taxes pushing residents out
+            - Section 8 limited to 2 years
+            - Many living in extended stay hotels without kitchens
+            - Need housing for all income levels, not just low-income
+            """)
+        
+        with col2:
+            st.markdown("""
+            **🧠 Mental Health**
+            - Top priority but still stigmatized
+            - Need for coping skills development
+            - Support for medical diagnoses
+            - Safe spaces for Black women to release burdens
+            - Self-help perspective needed
+            - Black women carry family burdens silently
+            """)
+        
+        with col3:
+            st.markdown("""
+            **🏥 Healthcare & Food**
+            - Georgia refuses to expand Medicaid
+            - Many counties lack providers
+            - Food deserts/apartheid prevalent
+            - Need awareness of healthy options
+            - Interconnected with housing crisis
+            """)
+        
+        st.warning("""
+        **Critical Gaps Identified:**
+        - Resources exist but awareness is lacking - opportunity for GirlTREK to bridge this gap
+        - Need younger voices (under 35) to understand next generation priorities
+        - Disconnect between community-level and systems-level change understanding
+        """)
+        
+        # GirlTREK Alignment
+        st.markdown("#### GirlTREK Joy & Justice Alignment")
+        st.markdown("""
+        ✊🏾 **We want economic freedom** - *"Foundation for everything else"*  
+        ✊🏾 We want healthy minds  
+        ✊🏾 We want land and housing  
+        ✊🏾 We want power  
+        ✊🏾 We want safety and decarceration  
+        ✊🏾 We want the next generation to lead
+        
+        **Special Note:** Economic freedom especially resonated as the foundation for healthy bodies, healthy food, and housing stability.
+        """)
+        
+        # Partners and Skills Development
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("""
+            **Potential Partners:**
+            - **Jimmy Carter Presidential Library** - Mental Health Parity Bill (HB 1013)
+            - **Black Voters Matter** - Voter education in majority-Black cities
+            - **Georgia Poor People's Campaign** - Active in 42 states addressing systemic issues
+            - **ACLU of Georgia** - Civil rights frontline
+            - **Housing Justice League** - Preventing displacement through grassroots organizing
+            - **NAMI** - National Alliance on Mental Illness
+            - **The People's Agenda** - Voter rights advocacy
+            """)
+        
+        with col2:
+            st.markdown("""
+            **Skills Members Want to Develop:**
+            - Grant writing and fundraising (Economic Freedom)
+            - Mental Health First Aid certification (Healthy Minds)
+            - Safe gun ownership for women (Safety)
+            - Home buying and retention strategies (Land & Housing)
+            - Legal observation for protests/elections
+            - Meditation and mindfulness facilitation
+            """)
+        
+        # Opportunities
+        st.info("""
+        **How GirlTREK Can Support Atlanta:**
+        - Create member connection map for local and travel networking
+        - Develop on-demand training platform (YouTube-style repository)
+        - Build robust localized resource lists
+        - Train "resource officers" as trusted messengers
+        - Help members understand difference between community and systems-level change
+        - Address Underground app siloing concerns
+        - Provide creative alternatives for reaching Black women beyond traditional channels
+        """)
+    
+    with st.expander("📍 Montgomery, Alabama - August 6, 2025", expanded=False):
+        # Session Overview
+        col1, col2 = st.columns(2)
+        with col1:
+            st.info("""
+            **Session Details:**
+            - **Location:** The Sanctuary
+            - **Participants:** 6 GirlTREK members
+            - **Duration:** 60 minutes
+            - **Note:** First stop in listening tour; GirlTREK HQ's new home
+            - **Engagement:** Only 2 of 6 actively walk with GirlTREK
+            """)
+        
+        with col2:
+            st.success("""
+            **Key Insight:**
+            Members desire return to 1950s-style close-knit community care. Most have deep roots (decades) but weren't born in Montgomery.
+            """)
+        
+        # Vision & Context
+        st.markdown("#### Community Vision")
+        st.markdown("""
+        Montgomery members define a "healthy community" as having:
+        - **Physical, mental, and financial health** as interconnected elements
+        - **Access to comprehensive services:** healthcare, mental health resources, financial literacy
+        - **Strong community bonds** like the close-knit neighborhoods of the past
+        - **Mutual aid networks** where neighbors are like family
+        """)
+        
+        st.markdown("> *\"Progress would look like it did in the 1950s; a community that cares for one another collectively.\"*")
+        
+        # Priority Issues with More Detail
+        st.markdown("#### Priority Issues & Systemic Challenges")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("""
+            **🧠 Mental Health**
+            - Top priority for wellbeing
+            - Limited accessible services
+            - Stigma still prevalent
+            - Need crisis intervention
+            - Counseling and psychiatric support
+            """)
+        
+        with col2:
+            st.markdown("""
+            **🏘️ Community Infrastructure**
+            - Public schools "not the greatest"
+            - Lack of safe gathering spaces
+            - Need workforce development
+            - Young women underpaid/underemployed
+            - Limited childcare options
+            - Self-worth issues leading to unhealthy habits
+            """)
+        
+        with col3:
+            st.markdown("""
+            **💰 Economic Resources**
+            - Financial literacy training needed
+            - Affordable housing crisis
+            - Food deserts prevalent
+            - Nutrition education lacking
+            - Elder care resources needed
+            - Support for caregivers missing
+            """)
+        
+        st.warning("""
+        **Critical Service Gap:** 
+        Single, middle-income women (especially without children) fall through the cracks - don't qualify for low-income resources but still need support. This represents a significant portion of GirlTREK's demographic.
+        """)
+        
+        # GirlTREK Alignment
+        st.markdown("#### GirlTREK Advocacy Alignment")
+        st.markdown("""
+        **Most Resonant Demand:** ✊🏾 **Healthy Families** - *"Foundation; if we focus here, everything else takes care of itself"*
+        
+        ✊🏾 Healthy Minds - Mental health resources  
+        ✊🏾 Healthy Food - Address food deserts  
+        ✊🏾 Healthy Bodies - Healthcare access  
+        ✊🏾 Land and Housing - Affordable housing  
+        ✊🏾 Economic Freedom - Financial literacy & entrepreneurship  
+        ✊🏾 Safety and Decarceration - Safe gathering spaces  
+        ✊🏾 Care for Caregivers - Elder care support
+        """)
+        
+        # Partners and Resources
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("""
+            **Active Partners & Resources:**
+            - **Black Women Rest** - Healing spaces (AL, GA, FL)
+            - **One Place Family Justice Center** - DV/SA survivor support with 20+ agency partners
+            - **Carastar Crisis Center** - 24/7 mental health crisis support
+            - **Fresh Greens Urban Farm** - Black sister-led organic food access
+            - **Tuskegee University Urban Agriculture** - Food security in Peacock Tract
+            - **True Divine Baptist Church** - Food pantry and clothing closet
+            """)
+        
+        with col2:
+            st.markdown("""
+            **Skills Members Want to Develop:**
+            - Public speaking
+            - Empathetic listening
+            - Sector-specific advocacy (education, senior care)
+            - Coalition building and collaboration
+            - Grant writing and funding acquisition
+            - Community organizing basics
+            """)
+        
+        # Barriers and Opportunities
+        st.markdown("#### Barriers to Systems Change")
+        st.error("""
+        - Low civic engagement among members
+        - Lack of awareness about available resources
+        - Need to identify community-approved communication channels
+        - Members don't see themselves as "advocates"
+        - Limited understanding of policy landscape
+        """)
+        
+        st.info("""
+        **How GirlTREK Can Help Montgomery:**
+        - Connect community to Care Village resources
+        - Help navigate red tape and eligibility barriers
+        - Share successful strategies from other communities
+        - Build deeper relationships with local members
+        - Bring funding opportunities and grant support
+        - Shine national spotlight on Montgomery's progress
+        - Bridge awareness gap about existing resources
+        - Train members in mental health and financial literacy
+        """)
+    
+    # Listening Sessions Summary and Analysis
+    st.markdown('<h4>Listening Sessions Analysis</h4>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">SESSIONS COMPLETED</p>'
+            f'<p class="metric-value">2 / 5</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Atlanta & Montgomery</p>'
+            f'<p style="font-size: 14px; color: #666;">40% of target</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">MEMBERS ENGAGED</p>'
+            f'<p class="metric-value">18</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Across both sessions</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">KEY THEMES IDENTIFIED</p>'
+            f'<p class="metric-value">7</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Common priority areas</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Key Findings Comparison
+    st.markdown("#### Key Findings Across Cities")
+    st.success("""
+    **Common Themes:**
+    - Mental health as top priority in both cities
+    - Housing affordability crisis affecting Black communities
+    - Resources exist but awareness and access are barriers
+    - Desire for stronger community connections and mutual aid
+    - Need for economic empowerment and financial literacy
+    
+    **Key Differences:**
+    - **Atlanta:** Economic freedom seen as foundation; members ready for immediate action
+    - **Montgomery:** Healthy families seen as foundation; members seeking community reconnection
+    - **Atlanta:** More civically engaged but need systems-change education
+    - **Montgomery:** Less civic engagement but strong desire for collective care
+    """)
+    
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.warning(get_narrative("Advocacy", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Advocacy", "recommendations"))
+    
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Advocacy")
+    create_notes_section("Advocacy")
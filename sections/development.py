@@ -0,0 +1,221 @@
+"""Development tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section, status_badge
+from figures import contributions_figure, get_figure
+from formatting import format_currency
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Development")
+    
+    st.markdown('<h3 class="section-title">Development Metrics</h3>', unsafe_allow_html=True)
+    
+    dev_col1, dev_col2, dev_col3 = st.columns(3)
+
+    with dev_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL CONTRIBUTIONS</p>'
+            f'<p class="metric-value">{format_currency(st.session_state.total_contributions)}</p>'
+            f'<p>Goal: $10M</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with dev_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL GRANTS</p>'
+            f'<p class="metric-value">{format_currency(st.session_state.total_grants)}</p>'
+            f'<p>17 of 48 Grants</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with dev_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CORPORATE SPONSORSHIPS</p>'
+            f'<p class="metric-value">$130,000</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">Additional $60k verbally agreed to but not yet in bank</p>'
+            f'<p>Goal: $1.5M</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    dev_finance_fig = get_figure(contributions_figure, "contributions_breakdown")
+    st.plotly_chart(dev_finance_fig, use_container_width=True, key="dev_finance_fig")
+    
+    # Funding Definitions Section (moved below chart and always visible)
+    st.markdown('<h4>Funding Categories Definitions</h4>', unsafe_allow_html=True)
+    
+    # Create expandable sections for each funding category
+    with st.expander("💰 View Funding Category Definitions", expanded=True):
+        st.markdown("**Grants:**")
+        st.info("Funding awarded by foundations, government agencies, or corporations for specific projects or general operations. These are typically awarded through a competitive application process and may have specific requirements or restrictions on how funds are used.")
+        
+        st.markdown("**Donations:**")
+        st.info("Individual contributions from supporters, members, and donors. These include one-time gifts, recurring donations, monthly giving programs, and major gifts from individual philanthropists. Donations are often unrestricted and provide flexible funding for organizational priorities.")
+        
+        st.markdown("**Corporate Sponsorships:**")
+        st.info("Financial support from businesses and corporations, often in exchange for marketing benefits, brand visibility, or partnership opportunities. These may include event sponsorships, program partnerships, or cause marketing initiatives.")
+        
+        st.markdown("**Earned Revenue:**")
+        st.info("Income generated through GirlTREK's own activities and services, including online store sales (merchandise, apparel, wellness products), training and workshop fees, licensing or consulting revenue, and investment income.")
+        
+        st.markdown("**Bricklayer's Fundraising:**")
+        st.info("Contributions from GirlTREK's major donor network, typically involving significant individual gifts from high-capacity donors who are deeply committed to the organization's mission.")
+    
+    # Grant Tracking Table
+    st.markdown('<h4>2025 Grant Applications Tracking</h4>', unsafe_allow_html=True)
+    
+    grants_df = datasets["grants"]
+    
+    # Display the table with status color coding
+    st.markdown(
+        """
+        <style>
+        .grants-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+            font-size: 12px;
+        }
+        .grants-table th, .grants-table td {
+            padding: 8px;
+            text-align: left;
+            border: 1px solid #ddd;
+        }
+        .grants-table th {
+            background-color: #4A90E2;
+            color: white;
+            font-weight: bold;
+        }
+        .status-pending { background-color: #E3F2FD; }
+        .status-funded { background-color: #E8F5E8; }
+        .status-declined { background-color: #FFEBEE; }
+        .status-prepare { background-color: #FFF3E0; }
+        </style>
+        """,
+        unsafe_allow_html=True
+    )
+    
+    # Create HTML table with color coding
+    table_html = '<table class="grants-table"><thead><tr>'
+    table_html += '<th>Account</th><th>Grant Name</th><th>Amount Requested</th><th>Amount Funded</th><th>Due Date</th><th>Status</th>'
+    table_html += '</tr></thead><tbody>'
+    
+    for _, row in grants_df.iterrows():
+        status_class = ""
+        if "Pending" in row['Status']:
+            status_class = "status-pending"
+        elif "Funded" in row['Status']:
+            status_class = "status-funded"
+        elif "Declined" in row['Status']:
+            status_class = "status-declined"
+        elif "Prepare" in row['Status']:
+            status_class = "status-prepare"
+            
+        table_html += f'<tr class="{status_class}">'
+        table_html += f'<td>{row["Account"]}</td>'
+        table_html += f'<td>{row["Grant Name"]}</td>'
+        table_html += f'<td>{row["Amount Requested"]}</td>'
+        table_html += f'<td>{row["Amount Funded"]}</td>'
+        table_html += f'<td>{row["Due Date"]}</td>'
+        table_html += f'<td><strong>{row["Status"]}</strong></td>'
+        table_html += '</tr>'
+    
+    # Add total row
+    table_html += '<tr style="background-color: #FFF9C4; font-weight: bold;">'
+    table_html += '<td colspan="2"><strong>TOTAL</strong></td>'
+    table_html += '<td><strong>$8,519,750.00</strong></td>'
+    table_html += '<td><strong>$14,500.00</strong></td>'
+    table_html += '<td colspan="2"></td>'
+    table_html += '</tr>'
+    
+    table_html += '</tbody></table>'
+    
+    st.markdown(table_html, unsafe_allow_html=True)
+    
+    # Summary statistics
+    st.markdown('<h5>Grant Application Summary</h5>', unsafe_allow_html=True)
+    
+    grant_summary_col1, grant_summary_col2, grant_summary_col3 = st.columns(3)
+    
+    with grant_summary_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL APPLICATIONS</p>'
+            f'<p class="metric-value">22</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Grant applications submitted in 2025</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with grant_summary_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">SUCCESS RATE</p>'
+            f'<p class="metric-value">18.2%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">3 funded out of 11 decided applications</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with grant_summary_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">PENDING DECISIONS</p>'
+            f'<p class="metric-value">7</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Applications awaiting funding decisions</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Additional Development Metrics
+    st.markdown('<h4>Additional Fundraising Metrics</h4>', unsafe_allow_html=True)
+    
+    fund_col1, fund_col2 = st.columns(2)
+    
+    with fund_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">EARNED REVENUE (STORE)</p>'
+            f'<p class="metric-value">$99,836</p>'
+            f'<p>Goal: $400,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with fund_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">BRICKLAYER\'S FUNDRAISING</p>'
+            f'<p class="metric-value">$2,500</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">Another significant donation is anticipated by fall of 2025</p>'
+            f'<p>Goal: $500,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.info(get_narrative("Development", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Development", "recommendations"))
+    
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Development")
+    create_notes_section("Development")
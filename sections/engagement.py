@@ -0,0 +1,803 @@
+"""Engagement tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section, status_badge
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Engagement")
+    
+    st.markdown('<h3 class="section-title">Engagement Metrics</h3>', unsafe_allow_html=True)
+
+    engagement_col1, engagement_col2 = st.columns(2)
+
+    with engagement_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL NEW CREWS (2025)</p>'
+            f'<p class="metric-value">727</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with engagement_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">MEMBERS WALKING DAILY</p>'
+            f'<p class="metric-value">5,439</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Walking at least 30 min/day, 5 days/week (from Self-Care School exit data)</p>'
+            f'<p>Goal: 50,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    eng_col1, eng_col2, eng_col3 = st.columns(3)
+    
+    with eng_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">ACTIVE VOLUNTEERS</p>'
+            f'<p class="metric-value">3,348</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Has hosted an event this year</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with eng_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">DOCUMENTED CREW LEADERS</p>'
+            f'<p class="metric-value">3,856</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Submitted crew via website, attended training, or previously noted as leader</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with eng_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">ACTIVE CREW LEADERS</p>'
+            f'<p class="metric-value">1,846</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Hosted an event this year or signed up this year</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Additional engagement metrics with definitions
+    st.markdown('<h4>Training & Development</h4>', unsafe_allow_html=True)
+    
+    train_col1, train_col2, train_col3 = st.columns(3)
+    
+    with train_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL TRAINED VOLUNTEERS</p>'
+            f'<p class="metric-value">11,535</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Includes: Self-care for Freedom Fighters, Ketruah training, Mental Health First Aid, training walks, teach-in events</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with train_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CREW LEADERS TRAINED (2025)</p>'
+            f'<p class="metric-value">124</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total number of crew leaders trained in 2025</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with train_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">SPECIAL IMPACT PROGRAMS</p>'
+            f'<p class="metric-value">100</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Members in MHFA, crew leader training, faith initiatives, caregiver events, justice programs</p>'
+            f'<p>Goal: 65,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    # Training and volunteer metrics already exist above
+    
+    # Care Village Section
+    st.markdown('<h4>Care Village Initiative</h4>', unsafe_allow_html=True)
+    
+    care_col1, care_col2 = st.columns(2)
+    
+    with care_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CARE VILLAGE POPULATION REACHED</p>'
+            f'<p class="metric-value">7,660</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total number of women who have joined movement in AL</p>'
+            f'<p>Goal: 40,000 (19.15%)</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    # Blue Brigade Mental Health Initiative
+    st.markdown('<h4>Blue Brigade Mental Health Initiative</h4>', unsafe_allow_html=True)
+    
+    with st.expander("🧠 GirlTREK Blue Brigade (Mental Health Skills)", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The GirlTREK Blue Brigade initiative aims to address the need for mental health access, resources and support for GirlTREK members and their communities. Utilizing the skills of Mental Health First Aid (MHFA), a nationally certified, research-based, peer support mental health intervention program, GirlTREK CARES trained a cohort of volunteers to provide empathetic and compassionate phone calls to members to alleviate isolation and loneliness during the COVID-19 pandemic of 2020. 
+            
+            The Blue Brigade is an evolution of this initiative; volunteers are trained as MHFA Responders and GirlTREK Crew Leaders, and put these skills into practice by leading Wellness Walks in their communities.
+            
+            Blue Brigade volunteers receive ongoing support and learning opportunities via monthly Office Hours where learning and engagement ranges from guest presentations from local/national mental health organizations, to topical discussions, Q&A sessions and a check-in for personal mental wellness of volunteers. Volunteers join quarterly workshop sessions (**April, June, August and October**) to become Crew Leaders and learn to host a walk that is responsive to the needs of sisters who may be experiencing a mental health challenge. 
+            
+            These walks are intended to be a mindfulness exercise, connecting mind and body to create a space of safety where sharing becomes natural and support feels welcomed. Volunteers are not acting in the capacity of a mental health professional and as such they do not diagnose, treat or "fix" problems, but rather serve as a connection to community care.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * **Recruitment & Training**: Identify and train 100 Trekkers in MHFA and GirlTREK Culture Crew Leader to serve as Blue Brigade members in 2025 and an additional 1,000 members in 2026.
+            * **Engagement**: Support volunteers as they host one (1) Wellness Walk per month or assist in coordinating Community Care Walks with local mental health focused organizations. Coordinate a national day of Wellness Walks for World Mental Health Day on October 10th and 11th 2025 and weekly Wellness Walks in May 2026 in observance of Mental Health Awareness Month.
+            * **Impact**: Decrease stigma around mental health, increase access to peer and professional support and encourage mindfulness practices such as walking to support healthy mental health.
+            """
+        )
+        
+        # Current Status Metrics
+        st.markdown('<h5>Current Status</h5>', unsafe_allow_html=True)
+        
+        blue_col1, blue_col2 = st.columns(2)
+        
+        with blue_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">FULLY CERTIFIED BLUE BRIGADE MEMBERS</p>'
+                f'<p class="metric-value">7 / 100</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Attended workshop, MHFA certified, Crew Leader trained & hosted walk(s)</p>'
+                f'<p style="font-size: 14px; color: #666;">7% of target achieved</p>'
+                f'<p>{status_badge("At Risk")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with blue_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">BLUE BRIGADE MEMBERS IN PROGRESS</p>'
+                f'<p class="metric-value">50 / 100</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Attended workshop, office hours, Crew Leader training & will be MHFA certified before October</p>'
+                f'<p style="font-size: 14px; color: #666;">50% of target</p>'
+                f'<p>{status_badge("On Track")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        blue_col3, blue_col4 = st.columns(2)
+        
+        with blue_col3:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">COMMUNITY CARE WALKS</p>'
+                f'<p class="metric-value">1</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Scheduled for Aug 23, 2025 in Chicago, IL with Sista Afya Community Care</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with blue_col4:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WELLNESS WALKS HOSTED</p>'
+                f'<p class="metric-value">4</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Once per month April-July</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # MHFA Training Schedule
+        st.markdown('<h5>MHFA Training Schedule</h5>', unsafe_allow_html=True)
+        st.markdown('<p style="font-style: italic;">Up to 30 members may be trained per session:</p>', unsafe_allow_html=True)
+        
+        training_schedule_html = f"""
+        <div style="background-color: #F3F9FF; border-radius: 10px; padding: 15px; margin: 10px 0;">
+            <p><strong>Virtual Training Sessions:</strong></p>
+            <ul style="margin-left: 20px;">
+                <li>August 9th</li>
+                <li>August 17th</li>
+                <li>September 6th</li>
+                <li>September 26th</li>
+            </ul>
+            <p><strong>In-Person Training:</strong></p>
+            <p style="margin-left: 20px;">Montgomery, AL Blue Brigade Mental Wellness Experience<br>
+            Saturday, September 13, 2025<br>
+            <em style="font-size: 12px;">(Note: This is not the full MHFA certification training but a Wellness Walk Leader session)</em></p>
+        </div>
+        """
+        st.markdown(training_schedule_html, unsafe_allow_html=True)
+        
+        # Long-term Goals
+        st.markdown('<h5>Long-term Goals</h5>', unsafe_allow_html=True)
+        
+        longterm_col1, longterm_col2 = st.columns(2)
+        
+        with longterm_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">2025 GOAL</p>'
+                f'<p class="metric-value">100</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Blue Brigade members trained and active</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with longterm_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">2026 GOAL</p>'
+                f'<p class="metric-value">1,000</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">MHFA Responders certified</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Mission Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This programming supports GirlTREK's Joy & Justice demand, item number two (2) <strong>"We want healthy minds"</strong> and serves to connect the GirlTREK community with culturally relevant resources and supports.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # Justice-Impacted Women's Initiative
+    st.markdown('<h4>Justice-Impacted Programs</h4>', unsafe_allow_html=True)
+    
+    with st.expander("⚖️ Justice-Impacted Women's Wellness & Reentry Initiative", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The Justice-Impacted Women's Initiative was created to support women who have been affected by the criminal legal system—whether currently incarcerated, formerly incarcerated, or navigating reentry. These women often face compounded barriers to health, housing, and healing. GirlTREK believes that wellness is justice, and that justice-impacted women deserve radical self-care, sisterhood, and leadership opportunities as they reclaim their time, health, and dignity.
+            
+            Grounded in GirlTREK's legacy of walking as a healing practice, this initiative provides a culturally relevant framework to support wellness inside and outside of prison walls. Through self-care workshops, walking crews, and reentry curriculum rooted in our R.A.D.I.C.A.L. values, we aim to extend the life expectancy of Black women who have been justice-impacted. We believe that healing is possible—and that the women most impacted by incarceration should be at the forefront of systems change.
+            
+            This initiative activates walking as a life-saving intervention, fosters connection through sisterhood, and centers joy as resistance. From transitional housing in Georgia to reentry programs in Alabama, GirlTREK is walking with women as they rebuild their lives and legacies.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * To increase the membership with Justice Impacted Women
+            * To start walking programs in transitional facilities
+            * To establish a Self Care Curriculum in 1 facility as a Pilot for upcoming years
+            """
+        )
+        
+        # Key Objectives
+        st.markdown('<h5>Key Objectives</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            **Recruitment & Training:**
+            - Identify and train formerly incarcerated women as Crew Leaders and wellness facilitators in transitional housing, reentry programs, and prisons
+            
+            **Engagement:**
+            - Launch walking crews and wellness workshops in Atlanta, GA and virtually
+            
+            **Impact:**
+            - Improve mental and physical health outcomes for justice-impacted women through walking and community connection and support
+            - Build a national model for radical self-care in reentry that can be integrated into prison education programs and partner organizations
+            """
+        )
+        
+        # Current Progress Metrics
+        st.markdown('<h5>Current Progress</h5>', unsafe_allow_html=True)
+        
+        justice_col1, justice_col2 = st.columns(2)
+        
+        with justice_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WALKS COMPLETED</p>'
+                f'<p class="metric-value">21 / 40</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">For Breakthru House participants</p>'
+                f'<p style="font-size: 14px; color: #666;">52.5% Complete</p>'
+                f'<p>{status_badge("On Track")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with justice_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">LOCATIONS ACTIVE</p>'
+                f'<p class="metric-value">2</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Atlanta, GA + Virtual Programs</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Upcoming Events
+        st.markdown('<h5>Upcoming Events (August 2025)</h5>', unsafe_allow_html=True)
+        
+        events_html = f"""
+        <div style="background-color: #F3F9FF; border-radius: 10px; padding: 15px; margin: 10px 0;">
+            <p><strong>🤝 Connections & Conversations</strong> - August 2025</p>
+            <p><strong>🔓 Beyond the Bars Workshop</strong> - August 2025</p>
+            <p><strong>🚶🏾‍♀️ "I am walking for..." Walk</strong> - August 2025</p>
+        </div>
+        """
+        st.markdown(events_html, unsafe_allow_html=True)
+        
+        # Impact Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This programming reflects the soul of GirlTREK's mission—to walk as a radical act of healing and transformation. By reaching women who have experienced incarceration, we are modeling what it means to serve with compassion, build community through care, and ensure that no woman is left behind.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # Caregiver Tribe Program
+    st.markdown('<h4>Caregiver Support Programs</h4>', unsafe_allow_html=True)
+    
+    with st.expander("💜 GirlTREK Caregiver Tribe Program", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The GirlTREK Caregiver Tribe Program is a comprehensive initiative designed to support and empower caregivers through education, resources, and community building. Building on insights from our 2024 Listening and Learning series, this program offers a structured pathway for caregivers to prioritize their health while caring for others.
+            
+            The program recognizes caregivers broadly—from family members caring for loved ones to teachers, CNAs, EMTs, therapists, and home health providers who dedicate themselves to others' wellbeing.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * **Certification Path**: Train caregivers to become certified Caregiver Crew Leaders
+            * **Education**: Deliver 4 comprehensive workshops covering essential caregiver topics
+            * **Community Building**: Foster support networks through monthly caregiver walks
+            * **Resource Distribution**: Provide all participants with the GirlTREK Caregiver Handbook
+            """
+        )
+        
+        # Current Status Metrics
+        st.markdown('<h5>Current Status (as of July 2025)</h5>', unsafe_allow_html=True)
+        
+        caregiver_col1, caregiver_col2 = st.columns(2)
+        
+        with caregiver_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WORKSHOPS COMPLETED</p>'
+                f'<p class="metric-value">2 / 4</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">50% of program delivered</p>'
+                f'<p>{status_badge("On Track")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with caregiver_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">CAREGIVERS ENGAGED</p>'
+                f'<p class="metric-value">649</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Received workshop materials and resources</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        caregiver_col3, caregiver_col4 = st.columns(2)
+        
+        with caregiver_col3:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">SELF-CARE ASSESSMENTS</p>'
+                f'<p class="metric-value">15</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Completed during June workshop</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with caregiver_col4:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">RESOURCES DEVELOPED</p>'
+                f'<p class="metric-value">4+</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Presentations, assessments, recordings, handbooks</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Workshop Schedule
+        st.markdown('<h5>Workshop Schedule</h5>', unsafe_allow_html=True)
+        
+        # Completed Workshops
+        st.markdown('#### ✅ Completed Workshops:')
+        
+        with st.container():
+            st.success("""
+            **April 16 – Medicaid for Caregivers**
+            - Guest Speakers: Rae Scott (Human Services) & Maureen Welch (Navigating Disabilities Colorado)
+            - Topics: Medicaid application process, caregiver payments, respite care benefits
+            
+            **June 18 – Mental Health First Aid Awareness**
+            - Guest Speaker: ReNate' Elliott, GirlTREK Program Director
+            - Topics: Recognizing warning signs, ALGEE Action Plan, stress management techniques
+            """)
+        
+        # Upcoming Workshops
+        st.markdown('#### 📅 Upcoming Workshops:')
+        
+        with st.container():
+            st.info("""
+            **August 20 – Self-Care Practices**
+            - Guest Speakers: Carla Harris & Marcie Thomas (GirlTREK Cares)
+            - Focus: Prioritizing self-care, meditation, affirmations
+            
+            **October 15 – Time Management and Nutrition Tips**
+            - Guest Speakers: Jerri McElroy (Time Management) & Chef Lisa Barnett (Nutrition)
+            - Focus: Task prioritization, weekly planning, healthy eating
+            """)
+        
+        # Certification Requirements
+        st.markdown('<h5>Certification Requirements</h5>', unsafe_allow_html=True)
+        st.markdown('To earn the GT Certificate of Completion as a Caregiver Crew Leader, participants must:')
+        
+        with st.container():
+            st.warning("""
+            1. Attend all 4 workshops
+            2. Complete one Crew Leader Training
+            3. Host one caregiver group walk per month (April through November)
+            4. Complete 4 Self-Care Assessments documenting growth and needs
+            """)
+        
+        # Key Accomplishments
+        st.markdown('<h5>Key Accomplishments</h5>', unsafe_allow_html=True)
+        st.success("""
+        ✓ Successfully transitioned from listening phase to active programming
+        ✓ Developed comprehensive resource distribution system beyond workshop presentations
+        ✓ Created multiple formats for resource access (recordings, presentations, assessments)
+        ✓ Built strong participant engagement with meaningful feedback loops
+        ✓ Established clear documentation and tracking systems for participant progress
+        """)
+        
+        # Next Steps
+        st.markdown('<h5>Next Steps</h5>', unsafe_allow_html=True)
+        st.info("""
+        → Prepare Caregiver Handbook content with August workshop presenters
+        → Develop August Self-Care Assessment incorporating Mental Health workshop recap
+        → Continue resource compilation for remaining workshops
+        → Maintain engagement with all 649 participants through regular communications
+        → Support participants in organizing monthly caregiver walks
+        """)
+        
+        # Mission Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This initiative represents GirlTREK's commitment to supporting those who care for others, ensuring they have the tools, resources, and community needed to maintain their own health and wellbeing while serving their families and communities.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+        
+        # Key Accomplishments
+        st.markdown('<h5>Key Accomplishments</h5>', unsafe_allow_html=True)
+        st.success("""
+        ✓ Successfully transitioned from listening phase to active programming
+        ✓ Developed comprehensive resource distribution system beyond workshop presentations
+        ✓ Created multiple formats for resource access (recordings, presentations, assessments)
+        ✓ Built strong participant engagement with meaningful feedback loops
+        ✓ Established clear documentation and tracking systems for participant progress
+        """)
+        
+        # Next Steps
+        st.markdown('<h5>Next Steps</h5>', unsafe_allow_html=True)
+        st.info("""
+        → Prepare Caregiver Handbook content with August workshop presenters
+        → Develop August Self-Care Assessment incorporating Mental Health workshop recap
+        → Continue resource compilation for remaining workshops
+        → Maintain engagement with all 649 participants through regular communications
+        → Support participants in organizing monthly caregiver walks
+        """)
+        
+        # Mission Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This initiative represents GirlTREK's commitment to supporting those who care for others, ensuring they have the tools, resources, and community needed to maintain their own health and wellbeing while serving their families and communities.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    # Garden Club Initiative
+    st.markdown('<h4>Environmental & Food Programs</h4>', unsafe_allow_html=True)
+    
+    with st.expander("🌱 GirlTREK Garden Club", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The GirlTREK Garden Club is an intergenerational space for connecting with nature, our food, and each other. We support community-led, organic, regenerative food systems and the laborers who power them. We are committed to food sovereignty.
+            
+            Through gardening, members connect with nature, build regenerative food systems, and practice radical care for the environment, their communities, and themselves. Gardening is not just about growing food, it's about growing health, joy, and community power. GirlTREK encourages members to cultivate wherever they have space, in ways that feel authentic and regenerative.
+            
+            The goal of this work is to engage at least 1,000 GirlTREK members in the Garden Club, creating a vibrant network of gardeners who support each other and amplify sustainable, joyful practices. Members are encouraged to share knowledge, resources, and encouragement through virtual gatherings and in-person projects. Together, we are ensuring that food sovereignty, environmental stewardship, and intergenerational knowledge become everyday practices, rooted in gratitude, reciprocity, and care.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * **Recruitment & Engagement:** Connect at least 1,000 members to the Garden Club through social media, newsletter communications, and word of mouth.
+            * **Learning & Skill Building:** Host four learning experiences annually via webinars and content shared digitally for ongoing accessibility.
+            * **Impact:** Promote regenerative gardening practices, amplify joy, and foster community-led food systems that support Black farmers and communities.
+            """
+        )
+        
+        # Current Status Metrics
+        st.markdown('<h5>Current Status</h5>', unsafe_allow_html=True)
+        
+        garden_col1, garden_col2 = st.columns(2)
+        
+        with garden_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">SEED PACKETS MAILED</p>'
+                f'<p class="metric-value">197</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Supporting heirloom crops & seed saving</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with garden_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">FACEBOOK GROUP MEMBERS</p>'
+                f'<p class="metric-value">599</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Active community engagement</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        garden_col3, garden_col4 = st.columns(2)
+        
+        with garden_col3:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">EMAIL LIST MEMBERS</p>'
+                f'<p class="metric-value">251</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Receiving Garden Club communications</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with garden_col4:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WEBINAR ATTENDEES</p>'
+                f'<p class="metric-value">~100</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Per learning experience</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Learning Experiences
+        st.markdown('<h5>Learning Experiences Delivered</h5>', unsafe_allow_html=True)
+        
+        st.success("""
+        **Completed Activities:**
+        - 2 Webinars on food sovereignty and community gardening
+        - 2 Seed mailings supporting heirloom crop cultivation and seed saving
+        - First mailing: Heirloom collard greens
+        - Second mailing: Seed saving education and community seed distribution
+        """)
+        
+        # Upcoming Events
+        st.markdown('<h5>Upcoming Events</h5>', unsafe_allow_html=True)
+        
+        st.info("""
+        **October 2025**
+        - Quarterly Webinar focused on Seed Saving techniques and best practices
+        - Fall harvest celebration and knowledge sharing
+        """)
+        
+        # Impact Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                <strong>Together, we are cultivating more than gardens. We are cultivating a legacy.</strong>
+                </p>
+                <p style="color: #2E7D32; margin-top: 10px; margin-bottom: 0;">
+                This initiative connects GirlTREK members to ancestral agricultural practices, promotes food sovereignty in Black communities, and creates intergenerational spaces for healing and knowledge transfer through the sacred act of growing food.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    # Faith Crews Initiative
+    st.markdown('<h4>Faith Programs</h4>', unsafe_allow_html=True)
+    
+    with st.expander("✝️ GirlTREK Faith Crews Initiative", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            At GirlTREK, we believe that faith is a powerful force in the lives of Black women and the communities we serve. The Faith Crews Initiative was born from this truth—an invitation to return to the sacred, to walk in wellness, and to heal in sisterhood.
+            
+            Rooted in spiritual wellness, radical self-care, and collective healing, Faith Crews create sacred spaces where Black women can walk, pray, testify, and solve problems together. Through monthly walks hosted by local churches and faith leaders, we partner with congregations to establish a rhythm of rest, restoration, and resistance—one step at a time.
+            
+            Our churches are more than places of worship—they are centers of healing, organizing, and transformation. By walking alongside faith institutions, GirlTREK is building a national movement that empowers Black women to reclaim their health, joy, and legacy through the spiritual and cultural practice of walking.
+            
+            Together, we are inspiring over one million Black women to walk in the footsteps of our foremothers—in protest, in prayer, and in power. This is more than a health initiative. It is a call to action. A return to faith. A movement of women walking boldly toward liberation.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            **Recruitment:**
+            - Identify, train, and support at least 500 active Faith Crew Leaders to organize and sustain monthly walks in churches and neighborhoods across the country, with a focused reach of 300 Southern churches by December 2025
+            
+            **Engagement:**
+            - Build a national network of volunteer faith leaders supported through monthly calls, newsletters, and prayer gatherings
+            - Encourage every Faith Crew to host monthly walks on First Saturdays, establishing a consistent rhythm of spiritual wellness
+            - Launch a monthly Faith Crew newsletter to uplift testimonies, highlight community service, and celebrate spiritual milestones
+            
+            **Impact:**
+            - Promote walking as a sacred spiritual practice, while equipping faith leaders to use GirlTREK as a ministry tool for health, healing, and fellowship
+            - Develop a network of "Walking Witnesses" who testify to transformation and embody legacy leadership rooted in scripture, service, and self-care
+            - Engage 1,000 Black women in faith-based communities in regular walking
+            - Recruit 10,000 new walkers across the South, beginning with 1,500 in 2025
+            - Ensure 80% of Church Crews participate in national campaigns (PrayerTrek, High Five Week, 21-Day JumpStart/GratitudeTrek, Black Family 5K)
+            - Promote use of the GirlTREK App (upon launch), aiming for 80% adoption among Church Crews by November 2025
+            """
+        )
+        
+        # Current Status Metrics
+        st.markdown('<h5>Current Status (as of July 2025)</h5>', unsafe_allow_html=True)
+        
+        faith_col1, faith_col2 = st.columns(2)
+        
+        with faith_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">FAITH CREW LEADERS ACTIVATED</p>'
+                f'<p class="metric-value">54 / 500</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">10.8% of target achieved</p>'
+                f'<p>{status_badge("At Risk")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with faith_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">CHURCHES ENGAGED NATIONWIDE</p>'
+                f'<p class="metric-value">86 / 500</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">17.2% of target</p>'
+                f'<p>{status_badge("At Risk")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        faith_col3, faith_col4 = st.columns(2)
+        
+        with faith_col3:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">SOUTHERN REGION CHURCHES</p>'
+                f'<p class="metric-value">28 / 300</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">9.3% of Southern target</p>'
+                f'<p>{status_badge("At Risk")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with faith_col4:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">CAMPAIGN READINESS</p>'
+                f'<p class="metric-value">Preparing</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Prayer Trek & Gratitude Trek launch Oct 1, 2025</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Upcoming Strategic Milestones
+        st.markdown('<h5>Upcoming Strategic Milestones</h5>', unsafe_allow_html=True)
+        
+        st.markdown('**August–October 2025**')
+        st.markdown("""
+        - Summer of Solidarity Campaign Launch - 10 weeks of national walking activation
+        - Local crew engagement + national team walk events
+        - App launch with tracking + reward system
+        - Friday Faith Walks with National Staff (Starting August 8)
+        """)
+        
+        st.markdown('**September 7, 2025**')
+        st.markdown("""
+        - First Saturday/Sunday of Self-Care
+        - Prayer Walks hosted across the country by Church Crews
+        """)
+        
+        st.markdown('**October–November 2025**')
+        st.markdown('*Fall Season of Transformation: Prayer, Giving, Gratitude, and Family*')
+        st.markdown("""
+        - 9-Day PrayerTrek
+        - 21-Day FaithTrek / GratitudeTrek
+        - Virtual Victory Jubilee Celebration (Golden Lace Ceremonies)
+        - Black Family 5K
+        """)
+        
+        # Activation Tools & Engagement Materials
+        st.markdown('<h5>Activation Tools & Engagement Materials</h5>', unsafe_allow_html=True)
+        
+        st.info("""
+        **Faith Crew Completion Badges** (accessible via GirlTREK App):
+        - Crew Leader Training
+        - 9-Day PrayerTrek
+        - 21-Day FaithTrek or GratitudeTrek
+        
+        **Custom Church Fan Design**
+        - Dual-purpose: Promotional flyer + keepsake
+        - Bundle of 10 sent to Crew Leaders that register their church for PrayerTrek
+        """)
+        
+        # Mission Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This programming embodies GirlTREK's vision of faith as a foundation for healing—where walking becomes worship, sisterhood becomes sanctuary, and every step is a prayer for liberation. Through Faith Crews, we are building sacred spaces where Black women can reclaim their health, honor their ancestors, and walk boldly toward joy and justice.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.info(get_narrative("Engagement", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Engagement", "recommendations"))
+
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Engagement")
+    create_notes_section("Engagement")
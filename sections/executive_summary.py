@@ -0,0 +1,298 @@
+"""Executive Summary tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section, status_badge
+from datasets import REPORT_CARD
+from figures import get_figure, historic_growth_figure, membership_by_age_figure, top_cities_figure, top_states_figure
+from formatting import format_currency, format_number
+from narrative import get_narrative
+from theme import achieved_green, secondary_gray
+
+
+def render(datasets):
+    add_board_update("Executive Summary")
+    
+    st.markdown('<h3 class="section-title">Executive Summary</h3>', unsafe_allow_html=True)
+    
+    st.markdown("<h3>Key Metrics</h3>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL MEMBERSHIP</p>'
+            f'<p class="metric-value">{format_number(st.session_state.total_membership)}</p>'
+            f'<p>Goal: 1,700,000</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL NEW MEMBERS</p>'
+            f'<p class="metric-value">{format_number(st.session_state.new_members)}</p>'
+            f'<p>Goal: 100,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL CONTRIBUTIONS</p>'
+            f'<p class="metric-value">{format_currency(st.session_state.total_contributions)}</p>'
+            f'<p>Goal: $10,000,000</p>'
+            f'<p>{status_badge("On Track")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    st.markdown('<h3>Report Card Progress</h3>', unsafe_allow_html=True)
+
+    report_data = REPORT_CARD
+
+    for i in range(len(report_data["Goal"])):
+        goal = report_data["Goal"][i]
+        current = report_data["Current Total"][i]
+        percent = report_data["Percent Progress"][i]
+        status = report_data["Status"][i]
+        progress = report_data["Progress"][i]
+
+        # Add context for Care Village
+        if "Care Village" in goal:
+            goal += '<br><span style="font-size: 12px; font-style: italic; color: #666;">Total number of women who have joined movement in AL</span>'
+
+        if status == "On Track":
+            bar_color = "#4CAF50"
+        elif status == "Achieved":
+            bar_color = achieved_green
+        elif status == "At Risk":
+            bar_color = "#FF9800"
+        else:
+            bar_color = secondary_gray
+
+        progress_html = f"""
+        <div style="margin-bottom: 20px;">
+            <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
+                <div><strong>{goal}</strong></div>
+                <div style="text-align: right;">
+                    <span style="margin-right: 15px;"><strong>{current}</strong></span>
+                    <span style="margin-right: 15px;"><strong>{percent}</strong></span>
+                    <span><strong>{status}</strong></span>
+                </div>
+            </div>
+            <div style="width: 100%; background-color: #f0f2f5; height: 12px; border-radius: 6px;">
+                <div style="width: {min(progress, 100)}%; height: 100%; background-color: {bar_color}; border-radius: 6px;"></div>
+            </div>
+        </div>
+        """
+        st.markdown(progress_html, unsafe_allow_html=True)
+
+    st.markdown("<h3>Historic Movement Growth Numbers</h3>", unsafe_allow_html=True)
+
+    # Add context for organizational health
+    if "organizational health" in goal:
+        goal += '<br><span style="font-size: 12px; font-style: italic; color: #666;">Data will be collected in staff survey in Nov 2025</span>'
+
+    # Add historic comparison note
+    st.markdown(
+        f"""
+        <div style="background-color: #E3F2FD; border-radius: 10px; padding: 15px; margin-bottom: 20px; border-left: 5px solid #2196F3;">
+            <h5 style="color: #1565C0; margin-top: 0;">Historic Comparison - 2017</h5>
+            <p style="color: #424242;">In 2017: <strong>116,938 Trekkers</strong> | <strong>44,149 New Women</strong> | <strong>60.65% Growth</strong></p>
+            <p style="color: #424242;">For comparison: In 2020, we reached <strong>1,000,000 Trekkers</strong> with <strong>626,660 New Women</strong> joining (<strong>167.85% Growth</strong>)</p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    historic_fig = get_figure(historic_growth_figure, "historic_growth")
+    st.plotly_chart(historic_fig, use_container_width=True, key="historic_growth_fig")
+
+    st.markdown('<h3>Membership Distribution</h3>', unsafe_allow_html=True)
+
+    exec_fig_total_age = get_figure(membership_by_age_figure, "membership_by_age")
+    st.plotly_chart(exec_fig_total_age, use_container_width=True, key="exec_fig_total_age")
+    
+    # Add note about Unknown age group
+    st.markdown(
+        """
+        <div style="background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-top: -10px; font-style: italic; font-size: 13px;">
+            *Unknown: Members who have not submitted date of birth or age in data collection. Date of birth is optional.
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    st.markdown('<h3>Top States</h3>', unsafe_allow_html=True)
+
+    states_fig = get_figure(top_states_figure, "top_states")
+    st.plotly_chart(states_fig, use_container_width=True, key="states_fig")
+
+    st.markdown('<h3>Top Cities</h3>', unsafe_allow_html=True)
+
+    cities_fig = get_figure(top_cities_figure, "top_cities")
+    st.plotly_chart(cities_fig, use_container_width=True, key="cities_fig")
+    
+    # Member Profile Section
+    st.markdown('<h3>👩🏾 GirlTREK General Member Profile: "The Everyday Health Activist"</h3>', unsafe_allow_html=True)
+    st.markdown(
+        """
+        <div style="background-color: #F8F9FA; border-radius: 10px; padding: 20px; margin: 20px 0; border-left: 5px solid #0088FF;">
+            <p style="color: #424242; font-style: italic; font-size: 16px; margin-bottom: 20px;">
+            <strong>She is the backbone of the movement. A consistent, committed, and conscientious Black woman who is reclaiming her health and leading others by example—not necessarily with a megaphone, but with steady action.</strong>
+            </p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    
+    # Demographic Snapshot
+    st.markdown('<h4>📊 Demographic Snapshot</h4>', unsafe_allow_html=True)
+    
+    demo_col1, demo_col2, demo_col3 = st.columns(3)
+    
+    with demo_col1:
+        st.markdown("""
+        **👤 Personal Info**
+        - **Age**: 52 years old (core "sweet spot" 48-61)
+        - **Race/Ethnicity**: Black or African American
+        - **Marital Status**: Married (54.9%)
+        - **Children**: Has grown children or is a caregiver (36.8%)
+        """)
+    
+    with demo_col2:
+        st.markdown("""
+        **🎓 Education & Career**
+        - **Education**: College-educated with bachelor's degree (26% have graduate degree)
+        - **Occupation**: Professional/technical/managerial
+        - **Common Sectors**: Tech (17%), Healthcare (6.2%), Education
+        """)
+    
+    with demo_col3:
+        st.markdown("""
+        **💰 Financial Profile**
+        - **Income**: $100K+ annually (69% of engaged members)
+        - **Net Worth**: $250K-$499K
+        - **Homeowner**: 83.3% (10+ years in home)
+        - **Region**: Southern states (GA, TX, FL) or urban metros (NY, LA)
+        """)
+    
+    # Mindset & Lifestyle
+    st.markdown('<h4>💭 Mindset & Lifestyle</h4>', unsafe_allow_html=True)
+    
+    mindset_col1, mindset_col2 = st.columns(2)
+    
+    with mindset_col1:
+        st.info("""
+        **🚶🏾‍♀️ Why She Walks**
+        - Health, stress relief, joy, and reclaiming time for herself
+        - Both physical health and emotional healing
+        - Fighting isolation, inactivity, and injustice
+        
+        **👥 Social Role**
+        - May not lead a crew but admired by friends/family
+        - First to text "You walking this Saturday?"
+        - Medium to high engagement level
+        """)
+    
+    with mindset_col2:
+        st.info("""
+        **🎯 Mission Alignment**
+        - Driven by adding 10 years to Black women's life expectancy
+        - Aligned with 3 "Deadly I's" framework
+        - Subscribed to SMS list, checks Field Guide
+        - Listens to Black History Bootcamp podcast
+        """)
+    
+    # Health & Activity Level
+    st.markdown('<h4>🏃🏾‍♀️ Health & Activity Level</h4>', unsafe_allow_html=True)
+    
+    health_col1, health_col2 = st.columns(2)
+    
+    with health_col1:
+        st.success("""
+        **Exercise Routine**
+        - Walks 30 minutes/day, 5 days/week
+        - Achieved during Self-Care School or Summer of Solidarity
+        - Meets threshold to extend life by 7 years
+        """)
+    
+    with health_col2:
+        st.success("""
+        **Preferred Activities**
+        - Walking in parks or urban sidewalks
+        - Gardening (80.2%)
+        - Home cooking with healthy food
+        - Reading (92.2%)
+        - Travel (89.9%)
+        - Fitness-focused (90.5%) on her own terms
+        """)
+    
+    # Programs & Tools
+    st.markdown('<h4>🛠️ Programs & Tools She Uses</h4>', unsafe_allow_html=True)
+    
+    tools_col1, tools_col2, tools_col3 = st.columns(3)
+    
+    with tools_col1:
+        st.markdown("""
+        **📱 Digital Tools**
+        - **Field Guide**: Self-Care School calendar, Sister's Keeper pledge
+        - **Podcast**: Black History Bootcamp during walks
+        - **App/Website**: Tracks self-care streaks
+        """)
+    
+    with tools_col2:
+        st.markdown("""
+        **🎪 Events & Programs**
+        - **Mobilize**: Registers for local walks/events
+        - **Juneteenth** and **BF5K** participation
+        - **Care Programs**: Food justice, caregiving, mental health
+        """)
+    
+    with tools_col3:
+        st.markdown("""
+        **🛍️ Engagement**
+        - **Shop**: Campaign launches, golden shoelaces
+        - **SMS/Email**: Subscribed for updates
+        - **Social**: Shares with #GirlTREK #BlackGirlJoy
+        """)
+    
+    # Member Behavior Patterns
+    st.markdown('<h4>📅 Member Behavior Patterns</h4>', unsafe_allow_html=True)
+    
+    behavior_col1, behavior_col2 = st.columns(2)
+    
+    with behavior_col1:
+        st.warning("""
+        **🌸 Seasonal Engagement**
+        - **Spring**: Self-Care School (10-week training)
+        - **Summer**: Summer of Solidarity walks and local events
+        - **Fall**: Gratitude Season – Black Family 5K, 9-Day Prayer Trek, Gratitude Trek
+        """)
+    
+    with behavior_col2:
+        st.warning("""
+        **🌟 Social Influence**
+        - Invites others to walk (Sister's Keeper bracelet goal)
+        - Participates in Harriet House Parties, Juneteenth walks
+        - Shares GirlTREK's message in church, workplace, community
+        """)
+    
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.info(get_narrative("Executive Summary", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Executive Summary", "recommendations"))
+    
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Executive Summary")
+    create_notes_section("Executive Summary")
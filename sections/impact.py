@@ -0,0 +1,208 @@
+"""Impact tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section
+from figures import get_figure, knowledge_impact_figure
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Impact")
+    
+    st.markdown('<h3 class="section-title">Impact Metrics - Self-Care School 2025</h3>', unsafe_allow_html=True)
+
+    # Health and Well-being Impact
+    st.markdown('<h4>Health & Well-being Outcomes</h4>', unsafe_allow_html=True)
+    
+    health_col1, health_col2, health_col3 = st.columns(3)
+    
+    with health_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">HEALTH KNOWLEDGE CHANGE</p>'
+            f'<p class="metric-value">999</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Women reporting a change in health knowledge</p>'
+            f'<p style="font-size: 14px; color: #666;">0.00% (baseline measure)</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with health_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">MENTAL WELL-BEING IMPROVEMENT</p>'
+            f'<p class="metric-value">998</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Women reporting changes in self-reported mental well-being</p>'
+            f'<p style="font-size: 14px; color: #666;">99.90% of respondents</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with health_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">SOCIAL CONNECTION</p>'
+            f'<p class="metric-value">673</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Women feeling more connected and less isolated through GirlTREK</p>'
+            f'<p style="font-size: 14px; color: #666;">68.53% of respondents</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Behavior Change Impact
+    st.markdown('<h4>Behavior Change & Empowerment</h4>', unsafe_allow_html=True)
+    
+    behavior_col1, behavior_col2 = st.columns(2)
+    
+    with behavior_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">EMPOWERED TO TAKE ACTION</p>'
+            f'<p class="metric-value">907</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Participants feeling empowered to make positive changes</p>'
+            f'<p style="font-size: 14px; color: #666;">90.52% of respondents</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with behavior_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">STRONGER WALKING HABIT</p>'
+            f'<p class="metric-value">709</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Participants who built a stronger walking habit</p>'
+            f'<p style="font-size: 14px; color: #666;">68.70% of respondents</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    behavior_col3, behavior_col4 = st.columns(2)
+    
+    with behavior_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">IMPLEMENTED NEW HABITS</p>'
+            f'<p class="metric-value">293</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Participants who implemented new habits, actions, or mindsets</p>'
+            f'<p style="font-size: 14px; color: #666;">34.92% of respondents</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with behavior_col4:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">SHARED WITH OTHERS</p>'
+            f'<p class="metric-value">819</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Participants who shared lessons learned with others</p>'
+            f'<p style="font-size: 14px; color: #666;">83.66% of respondents</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Knowledge Increase by Topic
+    st.markdown('<h4>Knowledge Increase by Self-Care School Topics</h4>', unsafe_allow_html=True)
+    st.markdown('<p style="font-style: italic; color: #666;">Number of participants reporting significant increase in knowledge:</p>', unsafe_allow_html=True)
+    
+    # Display as metric boxes with correct percentages
+    knowledge_col1, knowledge_col2 = st.columns(2)
+    
+    knowledge_items = [
+        ("Land rights, housing & environmental justice", 710, 71.60),
+        ("Civic engagement & political participation", 569, 57.00),
+        ("Safety, self-defense & public resource access", 645, 64.40),
+        ("Decarceration, gun safety & restorative justice", 658, 63.76),
+        ("Mental health & emotional boundaries", 622, 60.27),
+        ("Radical care, family legacy & intergenerational healing", 695, 67.34),
+        ("Parenting, mentorship & end-of-life planning", 536, 51.94),
+        ("Self-esteem, celebration & personal empowerment", 602, 58.33)
+    ]
+    
+    for i in range(0, 4):
+        with knowledge_col1:
+            topic, count, pct = knowledge_items[i]
+            st.markdown(
+                f"""
+                <div class="metric-box" style="margin-bottom: 15px;">
+                    <p class="metric-title" style="font-size: 14px;">{topic.upper()}</p>
+                    <p class="metric-value" style="font-size: 24px;">{count}</p>
+                    <p style="font-size: 14px; color: #666;">{pct}% of respondents</p>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+    
+    for i in range(4, 8):
+        with knowledge_col2:
+            topic, count, pct = knowledge_items[i]
+            st.markdown(
+                f"""
+                <div class="metric-box" style="margin-bottom: 15px;">
+                    <p class="metric-title" style="font-size: 14px;">{topic.upper()}</p>
+                    <p class="metric-value" style="font-size: 24px;">{count}</p>
+                    <p style="font-size: 14px; color: #666;">{pct}% of respondents</p>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+    
+    # Create visualization of knowledge topics
+    knowledge_impact_fig = get_figure(knowledge_impact_figure, "knowledge_impact")
+    st.plotly_chart(knowledge_impact_fig, use_container_width=True, key="knowledge_impact_fig")
+    
+    # Summary metrics
+    st.markdown('<h4>Impact Summary</h4>', unsafe_allow_html=True)
+    
+    summary_col1, summary_col2, summary_col3 = st.columns(3)
+    
+    with summary_col1:
+        st.markdown(
+            f"""
+            <div class="metric-box">
+                <p class="metric-title">TOTAL KNOWLEDGE TOPICS</p>
+                <p class="metric-value">8</p>
+                <p style="font-style: italic; font-size: 12px; color: #666;">Areas of significant knowledge increase</p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    with summary_col2:
+        st.markdown(
+            f"""
+            <div class="metric-box">
+                <p class="metric-title">AVERAGE IMPACT PER TOPIC</p>
+                <p class="metric-value">630</p>
+                <p style="font-style: italic; font-size: 12px; color: #666;">Average participants reporting knowledge gain per topic</p>
+                <p style="font-size: 14px; color: #666;">61.08% average response rate</p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    with summary_col3:
+        st.markdown(
+            f"""
+            <div class="metric-box">
+                <p class="metric-title">TOTAL KNOWLEDGE IMPACTS</p>
+                <p class="metric-value">5,037</p>
+                <p style="font-style: italic; font-size: 12px; color: #666;">Sum of all topic-specific knowledge gains</p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.info(get_narrative("Impact", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Impact", "recommendations"))
+    
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Impact")
+    create_notes_section("Impact")
@@ -0,0 +1,291 @@
+"""Marketing tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section
+from figures import audience_performance_figure, campaign_comparison_figure, email_comparison_figure, get_figure
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Marketing")
+    
+    st.markdown('<h3 class="section-title">Marketing Metrics</h3>', unsafe_allow_html=True)
+
+    sub_col1, sub_col2 = st.columns(2)
+
+    with sub_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL SUBSCRIBERS</p>'
+            f'<p class="metric-value">931,141</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">Total number of people subscribed to our email list</p>'
+            f'<p>Goal: 1,300,000 (71.63%)</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with sub_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">ACTIVE SUBSCRIBERS</p>'
+            f'<p class="metric-value">320,463</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">People who have opened an email, clicked on an email, or joined the email list in the last 120 days</p>'
+            f'<p>34.4% of Total</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    st.markdown("<h3>Email Performance Metrics</h3>", unsafe_allow_html=True)
+    
+    email_col1, email_col2 = st.columns(2)
+    
+    with email_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">AVERAGE OPEN RATE</p>'
+            f'<p class="metric-value">18.54%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">Percentage of recipients who open your email out of the total number successfully delivered</p>'
+            f'<p><strong>Industry Standard:</strong> Nonprofits average 28.59%</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with email_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CLICK-THROUGH RATE</p>'
+            f'<p class="metric-value">1.06%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">Measures how effectively your email drives recipients to take action by clicking on a link, button, or image</p>'
+            f'<p><strong>Industry Standard:</strong> Nonprofits average 3.29%</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Email Engagement Comparison Chart
+    st.markdown("<h4>Email Performance vs Industry Standards</h4>", unsafe_allow_html=True)
+    
+    comparison_fig = get_figure(email_comparison_figure, "email_comparison")
+    st.plotly_chart(comparison_fig, use_container_width=True, key="email_comparison_fig")
+    
+    # META Advertising Performance
+    st.markdown("<h3>META Advertising Performance (Year to Date)</h3>", unsafe_allow_html=True)
+    
+    # WNBA Campaign
+    st.markdown('<h4>WNBA Campaign</h4>', unsafe_allow_html=True)
+    
+    wnba_col1, wnba_col2, wnba_col3 = st.columns(3)
+    
+    with wnba_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL SPEND</p>'
+            f'<p class="metric-value">$3,901.12</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">WNBA campaign investment</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with wnba_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">IMPRESSIONS</p>'
+            f'<p class="metric-value">336,543</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total ad impressions</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with wnba_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CLICK-THROUGH RATE</p>'
+            f'<p class="metric-value">1.23%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">CTR performance</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    wnba_col4, wnba_col5 = st.columns(2)
+    
+    with wnba_col4:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">COST PER CLICK</p>'
+            f'<p class="metric-value">$0.94</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Average CPC</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with wnba_col5:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL CLICKS</p>'
+            f'<p class="metric-value">1,986</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total ad clicks</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # WNBA Top Audience
+    st.markdown(
+        f"""
+        <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+             padding: 15px; border-radius: 5px; margin: 15px 0;">
+            <p style="color: #2E7D32; margin: 0;"><strong>🎯 Top Performing Audience:</strong> Email List + LAL (Lookalike Audiences)</p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    
+    # Underground App Campaign
+    st.markdown('<h4>Underground App Campaign</h4>', unsafe_allow_html=True)
+    
+    app_col1, app_col2, app_col3 = st.columns(3)
+    
+    with app_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL SPEND</p>'
+            f'<p class="metric-value">$7,279.07</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Underground App campaign investment</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with app_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">IMPRESSIONS</p>'
+            f'<p class="metric-value">522,347</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total ad impressions</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with app_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CLICK-THROUGH RATE</p>'
+            f'<p class="metric-value">1.30%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">CTR performance</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    app_col4, app_col5, app_col6 = st.columns(3)
+    
+    with app_col4:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">COST PER CLICK</p>'
+            f'<p class="metric-value">$2.37</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Average CPC</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with app_col5:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL CLICKS</p>'
+            f'<p class="metric-value">3,074</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total ad clicks</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with app_col6:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">COST PER LEAD</p>'
+            f'<p class="metric-value">$25.90</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Average CPL</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    app_col7, app_col8 = st.columns(2)
+    
+    with app_col7:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL LEADS</p>'
+            f'<p class="metric-value">281</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Total leads generated</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with app_col8:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">LEAD CONVERSION RATE</p>'
+            f'<p class="metric-value">9.14%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Leads per total clicks</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Underground App Audience Performance
+    st.markdown('<h5>Underground App - Top Performing Audiences</h5>', unsafe_allow_html=True)
+    
+    audience_fig = get_figure(audience_performance_figure, "audience_performance")
+    st.plotly_chart(audience_fig, use_container_width=True, key="audience_performance_fig")
+    
+    # Campaign Comparison
+    st.markdown('<h4>Campaign Performance Comparison</h4>', unsafe_allow_html=True)
+    
+    # Create comparison chart for spend vs clicks
+    comparison_spend_fig = get_figure(campaign_comparison_figure, "campaign_comparison")
+    st.plotly_chart(comparison_spend_fig, use_container_width=True, key="campaign_comparison_fig")
+    
+    # META Advertising Summary
+    st.markdown('<h4>META Advertising Summary</h4>', unsafe_allow_html=True)
+    
+    summary_col1, summary_col2, summary_col3 = st.columns(3)
+    
+    with summary_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL AD SPEND</p>'
+            f'<p class="metric-value">$11,180.19</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Combined WNBA + Underground App</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with summary_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL IMPRESSIONS</p>'
+            f'<p class="metric-value">858,890</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Combined campaign reach</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with summary_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL CLICKS</p>'
+            f'<p class="metric-value">5,060</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Combined campaign clicks</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.warning(get_narrative("Marketing", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Marketing", "recommendations"))
+    
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Marketing")
+    create_notes_section("Marketing")
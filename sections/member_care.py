@@ -0,0 +1,89 @@
+"""Member Care tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Member Care")
+    
+    st.markdown('<h3 class="section-title">Member Care Metrics</h3>', unsafe_allow_html=True)
+
+    mc_col1, mc_col2 = st.columns(2)
+
+    with mc_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">MEMBER SATISFACTION RATING</p>'
+            f'<p class="metric-value">93%</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">How happy members are with GirlTREK services (via Zendesk tickets)</p>'
+            f'<p>Goal: 95%</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with mc_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">RESOLUTION/RESPONSIVENESS RATE</p>'
+            f'<p class="metric-value">2 hours</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666;">Percentage of support tickets resolved within specified timeframe</p>'
+            f'<p>Goal: 48 hours</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    st.markdown('<h3>Top Member Issues/Concerns</h3>', unsafe_allow_html=True)
+    st.markdown(
+        """
+        - SCS Registration Error Message
+        - Connecting to the Movement
+        """,
+        unsafe_allow_html=True
+    )
+    
+    # Add Member Testimonials
+    st.markdown('<h3>Member Testimonials</h3>', unsafe_allow_html=True)
+    
+    with st.expander("Karen Laing - Finding Joy and Healing"):
+        st.markdown(
+            """
+            *"I have found more joy and healing spaces during these weeks and participating in GirlTrek's self-care school has been mission critical in this time when I was fired after six months on the job and it jeopardized the affordable housing my daughter and I found last fall. But God continues to keep us and y'all continue to educate, empower and inspire us as we encourage ourselves in the Lord. Thank you. and amen.*
+            
+            **— Karen Laing**
+            """
+        )
+    
+    with st.expander("Angelia Taylor - Plant Forward Success"):
+        st.markdown(
+            """
+            *"I love the Week 4 'Plant Forward' message! Thank you so much for inspiring us to feed our souls and bodies better. While working on my Master in Public Health, I designed a project that researched Black women's health. One of the three areas that I focused on included buying and eating more fruits and vegetables. Eating what the earth provides helped me lose 106 pounds! It was actually a lot of fun! I also taught plant-based meals to kids, complete with 'chocolate pudding' made from eggplant. LOL! You should have seen them lick the bowls. PRICELESS!! Again, thank you soooooo much for providing such a warm space for us to heal our communities. You are so appreciated.*
+            
+            **— Angelia Taylor, Champaign, Illinois**
+            """
+        )
+    
+    with st.expander("Alicia Cross - Perseverance Through Recovery"):
+        st.markdown(
+            """
+            *"I have walked with GirlTrek since 2019, but had a full knee replacement in 2024, so I'm still rehabbing and my surgeon approved me to ride my Trek bike to continue to break up the scar tissue which is working. Walking is causing quite a bit of swelling, but I'm taking one day at a time. Seven weeks of GirlTrek has been a lifesaver. I appreciate you ALL SO MUCH!!*
+            
+            **— Alicia Cross, Lanham, MD**
+            """
+        )
+    
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.info(get_narrative("Member Care", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Member Care", "recommendations"))
+    
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Member Care")
+    create_notes_section("Member Care")
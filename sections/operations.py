@@ -0,0 +1,158 @@
+"""Operations tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section, status_badge
+from formatting import format_currency
+from narrative import get_narrative
+
+
+def render(datasets):
+    finance_trend_data = datasets["finance_trend"]
+
+    add_board_update("Operations")
+    
+    st.markdown('<h3 class="section-title">Operations Metrics</h3>', unsafe_allow_html=True)
+
+    st.markdown('<h4>Financial Overview (YTD May 2025)</h4>', unsafe_allow_html=True)
+
+    ytd_revenue = finance_trend_data['Revenue'].sum()
+    ytd_expenses = finance_trend_data['Expenses'].sum()
+    
+    finance_col1, finance_col2 = st.columns(2)
+    
+    with finance_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">YTD REVENUE</p>'
+            f'<p class="metric-value">{format_currency(ytd_revenue)}</p>'
+            f'<p>Budget: $1,237,419</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with finance_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">YTD EXPENSES</p>'
+            f'<p class="metric-value">{format_currency(ytd_expenses)}</p>'
+            f'<p>Budget: $1,608,765</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    st.markdown('<h4>Systems Performance</h4>', unsafe_allow_html=True)
+
+    sys_col1, sys_col2, sys_col3 = st.columns(3)
+
+    with sys_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">ASANA ADOPTION</p>'
+            f'<p class="metric-value">38%</p>'
+            f'<p>Goal: 85%</p>'
+            f'{status_badge("At Risk")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with sys_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">AUDIT COMPLIANCE</p>'
+            f'<p class="metric-value">100%</p>'
+            f'<p>Goal: 100%</p>'
+            f'{status_badge("Achieved")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with sys_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">CYBERSECURITY COMPLIANCE</p>'
+            f'<p class="metric-value">70%</p>'
+            f'<p>Goal: 90%</p>'
+            f'{status_badge("On Track")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Additional Operations Metrics
+    st.markdown('<h4>Store Performance</h4>', unsafe_allow_html=True)
+    
+    store_col1, store_col2, store_col3 = st.columns(3)
+    
+    with store_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">STORE SALES</p>'
+            f'<p class="metric-value">$99,836</p>'
+            f'<p>Goal: $400,000</p>'
+            f'{status_badge("At Risk")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with store_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">AVERAGE ORDER VALUE</p>'
+            f'<p class="metric-value">$44.36</p>'
+            f'<p>Target: $20-60</p>'
+            f'{status_badge("On Track")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with store_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">GROSS PROFIT %</p>'
+            f'<p class="metric-value">37%</p>'
+            f'<p>Target: 50-60%</p>'
+            f'{status_badge("On Track")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    # HR/People Operations Section
+    st.markdown('<h4>People Operations</h4>', unsafe_allow_html=True)
+    
+    hr_col1, hr_col2, hr_col3 = st.columns(3)
+    
+    with hr_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">STAFF RETENTION</p>'
+            f'<p class="metric-value">94%</p>'
+            f'<p>Industry Avg: 86%</p>'
+            f'{status_badge("On Track")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+    
+    with hr_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">EMPLOYEE SATISFACTION</p>'
+            f'<p class="metric-value">88%</p>'
+            f'<p>Target: 85%</p>'
+            f'{status_badge("On Track")}'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+        
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.info(get_narrative("Operations", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Operations", "recommendations"))
+        
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Operations")
+    create_notes_section("Operations")
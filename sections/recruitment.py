@@ -0,0 +1,371 @@
+"""Recruitment tab"""
+import streamlit as st
+
+from components import add_board_update, create_data_downloads, create_notes_section, status_badge
+from figures import get_figure, new_members_by_age_figure, new_members_by_month_figure
+from formatting import format_number
+from narrative import get_narrative
+
+
+def render(datasets):
+    add_board_update("Recruitment")
+    
+    st.markdown('<h3 class="section-title">Recruitment Metrics</h3>', unsafe_allow_html=True)
+
+    recruitment_col1, recruitment_col2, recruitment_col3 = st.columns(3)
+
+    with recruitment_col1:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL NEW MEMBERS</p>'
+            f'<p class="metric-value">{format_number(st.session_state.new_members)}</p>'
+            f'<p>Goal: 100,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with recruitment_col2:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">NEW MEMBERS AGE 18-25</p>'
+            f'<p class="metric-value">316</p>'
+            f'<p>Goal: 100,000</p>'
+            f'<p>{status_badge("At Risk")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    with recruitment_col3:
+        st.markdown(
+            f'<div class="metric-box">'
+            f'<p class="metric-title">TOTAL RECRUITMENT PARTNERSHIPS</p>'
+            f'<p class="metric-value">18</p>'
+            f'<p style="font-style: italic; font-size: 12px; color: #666; margin-bottom: 5px;">Contact has been made with 20 community organizations</p>'
+            f'<p>Goal: 10</p>'
+            f'<p>{status_badge("Achieved")}</p>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+    recruit_monthly_fig = get_figure(new_members_by_month_figure, "new_members_by_month")
+    st.plotly_chart(recruit_monthly_fig, use_container_width=True, key="recruit_monthly_fig")
+    
+    st.markdown('<h3>New Members by Age Group</h3>', unsafe_allow_html=True)
+    
+    new_age_fig = get_figure(new_members_by_age_figure, "new_members_by_age")
+    st.plotly_chart(new_age_fig, use_container_width=True, key="new_age_fig")
+
+    # Recruitment Programs Section
+    st.markdown('<h3>Recruitment Programs</h3>', unsafe_allow_html=True)
+
+    # Volunteer Recruitment        
+    with st.expander("📚 Volunteer Recruitment", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The Volunteer Recruitment initiative is essential to supporting GirlTREK events and other community activities. I assist volunteers by preparing them to host walks or manage tables at events, while also identifying and supervising them at GirlTREK-led initiatives.
+            
+            While GirlTREK has strong national partnerships, it is equally important to engage local community organizations to establish crews and strengthen connections within their neighborhoods.
+            
+            Additionally, many of our sisters are engaging in books individually, whether reading at home or listening to audiobooks. Our goal is to bring them together by building community around books—through gatherings at Black-owned bookstores, walking with authors, and creating shared spaces for conversation and connection.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * **Recruitment:** Organize volunteers in 25 cities to host recruitment events and build local leadership.
+            * **Engagement:** Recruit 100+ partners, with at least 75% actively supporting health initiatives.
+            * **Impact:** Launch the Walking Book Club to connect 5,000+ members with Black authors, bookstores, and libraries.
+            """
+        )
+        
+        # Current Status Metrics
+        st.markdown('<h5>Current Status</h5>', unsafe_allow_html=True)
+        
+        volunteer_col1, volunteer_col2 = st.columns(2)
+        
+        with volunteer_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">VOLUNTEER RECRUITMENT CITIES</p>'
+                f'<p class="metric-value">16 / 25</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Cities with organized volunteers</p>'
+                f'<p style="font-size: 14px; color: #666;">64% of target achieved</p>'
+                f'<p>{status_badge("On Track")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with volunteer_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">COMMUNITY PARTNERSHIPS</p>'
+                f'<p class="metric-value">23 / 100+</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Partners secured</p>'
+                f'<p style="font-size: 14px; color: #666;">23% of target achieved</p>'
+                f'<p>{status_badge("At Risk")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        volunteer_col3, volunteer_col4 = st.columns(2)
+        
+        with volunteer_col3:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">ACTIVE PARTNER RATE</p>'
+                f'<p class="metric-value">TBD</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Goal: 75% actively supporting initiatives</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with volunteer_col4:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WALKING BOOK CLUB</p>'
+                f'<p class="metric-value">Launching</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">"Step Into Stories" National Book Lovers Call TBA</p>'
+                f'<p style="font-size: 14px; color: #666;">Goal: 5,000+ members</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Impact Stories
+        st.markdown('<h5>Impact & Success Stories</h5>', unsafe_allow_html=True)
+        
+        st.success("""
+        **Key Achievements:**
+        - Approximately 3 organizations have started crews and maintained consistency
+        - Multiple women have taken the initiative personally, starting crews at work, in neighborhoods, or with friends
+        - First-time volunteers and solo trekkers have been inspired to start their own crews after volunteering
+        
+        **Transformational Impact:**
+        The most impactful experiences come from first-time volunteers—solo trekkers who discover their leadership potential and go on to start their own crews after volunteering with us. This ripple effect demonstrates how volunteer engagement creates sustainable, community-led growth.
+        """)
+        
+        # Walking Book Club Details
+        st.markdown('<h5>Walking Book Club: "Step Into Stories"</h5>', unsafe_allow_html=True)
+        
+        st.info("""
+        **Initiative Components:**
+        - Connect members with Black authors for walking discussions
+        - Partner with Black-owned bookstores for community gatherings
+        - Collaborate with libraries for accessible programming
+        - Create shared spaces for literary conversation and connection
+        - Host National Book Lovers Call (Date TBA)
+        
+        **Vision:** Transform individual reading experiences into collective community building through movement and literature.
+        """)
+        
+        # Next Steps
+        st.markdown('<h5>Next Steps & Opportunities</h5>', unsafe_allow_html=True)
+        
+        st.warning("""
+        **Priority Actions:**
+        - Expand volunteer recruitment to remaining 9 cities
+        - Accelerate partnership development to reach 100+ organizations
+        - Launch Walking Book Club with initial author partnerships
+        - Develop volunteer training materials for consistent crew leadership
+        - Create partnership activation toolkit for 75% engagement rate
+        """)
+        
+        # Impact Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This initiative transforms individual walkers into community leaders, creating a sustainable network of local champions who extend GirlTREK's reach and impact. Through volunteer engagement and literary connection, we're building stronger, more connected communities where every walker can become a leader and every reader can find their tribe.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+        
+    
+    # College Aged Women Program
+    with st.expander("📚 College Aged Women - Nyra Govan", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The GirlTREK College Crews initiative was created because GirlTREK has been waiting for students to be the revolutionaries that the world has been waiting for. Throughout history we have seen the youth at the forefront of many revolutions with their eyes locked on long-term reforms. Given the current economic climate and conditions, there is concern for students' well-being as they progress through college. 
+            
+            GirlTREK aims to provide a safe space for the next generation. GirlTREK looks forward to bringing its culture to college campuses to help the next generation prioritize their health and create a safe space on college campuses. Through daily walking, students will be able to connect with like minded individuals as they walk to better health, being leaders on campus and in the community. 
+            
+            The practice of radical self-care is not in the academic curriculum, so we want to ensure that students are starting this behavior change early in their life instead of falling to the system of burnout throughout their collegiate experience. The northern star of this goal is to get 100 college students across 100 college campuses to start crews on colleges across the country, with a focus on HBCUs. These college students will be our college leads that are leading their peers by walking, talking, and solving problems at their universities. 
+            
+            **Things change when Black women walk** – GirlTREK is excited to empower young women to start their self-care journey now.
+            """
+        )
+        
+        # Program Goals
+        st.markdown('<h5>Program Goals</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * **Recruitment**: Identify and train 100 students in MHFA to serve as College Crew Leads on 100 campuses
+            * **Engagement**: Encourage students to host walks once a month on campus, creating safe spaces for college women
+            * **Impact**: Promote physical activity and empower the next generation of Legacy Builders for the movement
+            """
+        )
+        
+        # Current Status Metrics
+        st.markdown('<h5>Current Status</h5>', unsafe_allow_html=True)
+        
+        college_col1, college_col2 = st.columns(2)
+        
+        with college_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">COLLEGE LEADS RECRUITED</p>'
+                f'<p class="metric-value">11 / 100</p>'
+                f'<p style="font-size: 14px; color: #666;">11% of target achieved</p>'
+                f'<p>{status_badge("At Risk")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with college_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WALKS COMPLETED</p>'
+                f'<p class="metric-value">0</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Due to semester not beginning yet</p>'
+                f'<p>Goal: Monthly walks on campus</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Walk Schedule
+        st.markdown('<h5>Scheduled Solidarity Walks</h5>', unsafe_allow_html=True)
+        st.markdown('<p style="font-style: italic;">Rounds of walks scheduled for college students to walk in solidarity together:</p>', unsafe_allow_html=True)
+        
+        college_schedule_html = f"""
+        <div style="background-color: #F3F9FF; border-radius: 10px; padding: 15px; margin: 10px 0;">
+            <p><strong>Round 1</strong>: September 18th, 2025</p>
+            <p><strong>Round 2</strong>: January 22nd, 2026</p>
+            <p><strong>Round 3</strong>: April 9th, 2026</p>
+        </div>
+        """
+        st.markdown(college_schedule_html, unsafe_allow_html=True)
+        
+        # Mission Statement
+        st.markdown(
+            f"""
+            <div style="background-color: #E8F5E8; border-left: 5px solid #4CAF50; 
+                 padding: 15px; border-radius: 5px; margin: 15px 0;">
+                <p style="color: #2E7D32; font-style: italic; margin: 0;">
+                This programming represents the heart of GirlTrek's mission—empowering Black women to reclaim their health and legacy through the simple yet radical act of walking. Together, we are ensuring that self-care and wellness become a lifestyle in the lives of young women to have the wit to carry the choice of our foremothers.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+        
+
+    # Mommy and Me Program
+    with st.expander("👩‍👧‍👦 Mommy and Me - Keturah Queen", expanded=False):
+        # Program Overview
+        st.markdown('<h5>Program Overview</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            The "Mommy and Me" Walks initiative recruits GirlTrek moms to serve as Mom Coaches, leading family-centered wellness experiences in their communities. The program creates safe, supportive spaces for mothers and children to gather, move, and connect while promoting health and sisterhood within the GirlTrek movement.
+            """
+        )
+        
+        # Key Objectives
+        st.markdown('<h5>Key Objectives</h5>', unsafe_allow_html=True)
+        st.markdown(
+            """
+            * **Recruitment**: Train 50 GirlTrek moms as Mom Coaches
+            * **Engagement**: Host fun, family-friendly community walks
+            * **Impact**: Promote physical activity, strengthen community ties, and inspire the next generation
+            * **Summer Goal**: Complete 100 "Mommy and Me" Walks nationwide
+            """
+        )
+        
+        # Current Progress Metrics
+        st.markdown('<h5>Current Progress (July 2025)</h5>', unsafe_allow_html=True)
+        
+        mommy_col1, mommy_col2 = st.columns(2)
+        
+        with mommy_col1:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">MOM COACHES RECRUITED</p>'
+                f'<p class="metric-value">45 / 50</p>'
+                f'<p style="font-size: 14px; color: #666;">90% Complete</p>'
+                f'<p>{status_badge("On Track")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with mommy_col2:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">WALKS COMPLETED</p>'
+                f'<p class="metric-value">8</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Successful "Mommy and Me" Walks</p>'
+                f'<p>Goal: 100</p>'
+                f'<p>{status_badge("On Track")}</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        mommy_col3, mommy_col4 = st.columns(2)
+        
+        with mommy_col3:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">COMMUNITY ENGAGEMENT</p>'
+                f'<p class="metric-value">83</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Free tickets sold in Round 1</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        with mommy_col4:
+            st.markdown(
+                f'<div class="metric-box">'
+                f'<p class="metric-title">REMAINING NEED</p>'
+                f'<p class="metric-value">5</p>'
+                f'<p style="font-style: italic; font-size: 12px; color: #666;">Additional Mom Coaches to reach target</p>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        
+        # Walk Schedule
+        st.markdown('<h5>Walk Schedule</h5>', unsafe_allow_html=True)
+        
+        schedule_html = f"""
+        <div style="background-color: #F3F9FF; border-radius: 10px; padding: 15px; margin: 10px 0;">
+            <p><strong>Round 1</strong>: Completed July 5th ✅</p>
+            <p><strong>Round 2</strong>: Currently in progress</p>
+            <ul style="margin-left: 20px;">
+                <li>July 19</li>
+                <li>August 2 & 23</li>
+                <li>September 6</li>
+            </ul>
+        </div>
+        """
+        st.markdown(schedule_html, unsafe_allow_html=True)
+
+    # Data Analysis & Recommendations
+    st.markdown('### 📊 Data Analysis & Recommendations')
+    
+    # Key Insights
+    st.markdown('#### 🔍 Key Insights')
+    st.warning(get_narrative("Recruitment", "insights"))
+    
+    # Strategic Recommendations
+    st.markdown('#### 💡 Strategic Recommendations')
+    st.success(get_narrative("Recruitment", "recommendations"))
+
+    st.markdown('<hr>', unsafe_allow_html=True)
+    create_data_downloads("Recruitment")
+    create_notes_section("Recruitment")
@@ -0,0 +1,46 @@
+"""Start the dashboard with its caches already built.
+
+    python serve.py [--api-port 8502] [--no-wait] [streamlit options, e.g. --server.port 8501]
+
+Runs the warm-up from warmup.py in this process, then starts Streamlit on
+app.py. Streamlit runs the app in the same process and reuses the modules
+imported here, so the first session finds the datasets, figures and PDF
+fragments already cached. The metrics API is started as well, so a load
+balancer can poll /health until the dashboard is ready.
+"""
+import argparse
+import os
+import sys
+
+from streamlit.web import cli as streamlit_cli
+
+from metrics_api import start_api_server
+from warmup import start_warmup
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm the dashboard caches, then start Streamlit")
+    parser.add_argument("--api-host", default=os.environ.get("DASHBOARD_API_HOST", "127.0.0.1"))
+    parser.add_argument("--api-port", type=int, default=int(os.environ.get("DASHBOARD_API_PORT", 8502)))
+    parser.add_argument("--no-wait", action="store_true",
+                        help="start Streamlit right away and warm up in the background")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    # The app starts the API from DASHBOARD_API_PORT; the same host and port reuse this server
+    os.environ["DASHBOARD_API_HOST"] = args.api_host
+    os.environ["DASHBOARD_API_PORT"] = str(args.api_port)
+    start_api_server(args.api_host, args.api_port)
+
+    warmup_thread = start_warmup()
+    if not args.no_wait:
+        print("Warming dashboard caches...")
+        warmup_thread.join()
+
+    sys.argv = ["streamlit", "run", APP_PATH] + streamlit_args
+    return streamlit_cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
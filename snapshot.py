@@ -0,0 +1,136 @@
+"""Self-contained static HTML snapshot of the whole dashboard.
+
+All ten sections go into one file that opens offline without Streamlit:
+each section's leadership update, the tables and text declared in
+layouts.SECTION_LAYOUTS, its charts and its notes. plotly.js is inlined
+once and every figure is embedded as compact JSON, rendered on load.
+"""
+import hashlib
+import html
+from datetime import datetime
+
+from plotly.offline import get_plotlyjs
+
+from cache_registry import get_cache
+from datasets import dataset_versions
+from figures import SECTION_FIGURES, get_figure
+from layouts import SECTIONS, SECTION_LAYOUTS, fill_cell
+from narrative import board_updates, get_narrative_store
+from theme import primary_blue, dark_bg, dark_card_bg, dark_text
+
+_figure_cache = get_cache("snapshot_figures", maxsize=64)
+_snapshot_cache = get_cache("html_snapshots", maxsize=4)
+
+# The cached HTML carries this marker; render_snapshot() fills in the time of each request
+GENERATED_AT = "<!-- generated-at -->"
+
+STYLE = """
+body { font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif; margin: 0 auto; max-width: 1100px; padding: 24px; color: #212121; }
+h1, h2, h3 { color: %(accent)s; }
+nav a { margin-right: 12px; }
+section { border-top: 2px solid %(accent)s; margin-top: 32px; padding-top: 8px; }
+table { border-collapse: collapse; margin: 8px 0 16px; }
+th { background: %(accent)s; color: white; }
+th, td { border: 1px solid #ccc; padding: 6px 10px; text-align: left; }
+.update, .notes { background: #f5f5f5; border-left: 4px solid %(accent)s; padding: 8px 16px; margin: 12px 0; }
+.notes p { white-space: pre-wrap; }
+body.dark { background: %(dark_bg)s; color: %(dark_text)s; }
+body.dark .update, body.dark .notes { background: %(dark_card_bg)s; }
+"""
+
+
+def _script_json(value):
+    # Keep "</script>" in chart text from closing the script element
+    return value.replace("</", "<\\/")
+
+
+def figure_json(builder, dataset_name):
+    """Return a chart's Plotly JSON, built once per dataset version"""
+    key = (builder.__name__, dataset_name, dataset_versions()[dataset_name])
+    return _figure_cache.get_or_create(key, lambda: get_figure(builder, dataset_name).to_json())
+
+
+def _layout_html(section_name, context):
+    parts = []
+    for kind, value in SECTION_LAYOUTS.get(section_name, []):
+        if kind == "subheading":
+            parts.append(f"<h3>{html.escape(value)}</h3>")
+        elif kind == "text":
+            parts.append(f"<p>{html.escape(fill_cell(value, context))}</p>")
+        elif kind == "table":
+            header, *rows = [[html.escape(fill_cell(cell, context)) for cell in row] for row in value["rows"]]
+            parts.append(
+                "<table><tr>" + "".join(f"<th>{cell}</th>" for cell in header) + "</tr>"
+                + "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+                + "</table>"
+            )
+    return "\n".join(parts)
+
+
+def _notes_html(title, notes):
+    if not notes.strip():
+        return ""
+    return f'<div class="notes"><h3>{html.escape(title)}</h3><p>{html.escape(notes)}</p></div>'
+
+
+def build_snapshot(context, notes_by_section=None, global_notes="", dark_mode=False, accent=primary_blue):
+    notes_by_section = notes_by_section or {}
+    figures = {}
+    sections = []
+    updates = board_updates()
+    for section in SECTIONS:
+        anchor = section.lower().replace(" ", "-")
+        parts = [f'<section id="{anchor}"><h2>{html.escape(section)}</h2>']
+        if section in updates:
+            parts.append(f'<div class="update"><h3>Leadership Update</h3>{updates[section]}</div>')
+        parts.append(_layout_html(section, context))
+        for builder, dataset_name in SECTION_FIGURES.get(section, []):
+            figure_id = f"fig-{len(figures)}"
+            figures[figure_id] = figure_json(builder, dataset_name)
+            parts.append(f'<div class="chart" id="{figure_id}"></div>')
+        parts.append(_notes_html(f"{section} Notes", notes_by_section.get(section, "")))
+        parts.append("</section>")
+        sections.append("\n".join(parts))
+
+    nav = " ".join(f'<a href="#{s.lower().replace(" ", "-")}">{html.escape(s)}</a>' for s in SECTIONS)
+    figure_data = "{" + ",".join(f'"{fid}":{_script_json(data)}' for fid, data in figures.items()) + "}"
+    style = STYLE % {"accent": accent, "dark_bg": dark_bg, "dark_card_bg": dark_card_bg, "dark_text": dark_text}
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>GirlTREK Organizational Dashboard</title>
+<style>{style}</style>
+<script>{get_plotlyjs()}</script>
+</head>
+<body class="{'dark' if dark_mode else ''}">
+<h1>GirlTREK Organizational Dashboard</h1>
+<p>Snapshot generated on {GENERATED_AT}</p>
+<nav>{nav}</nav>
+{chr(10).join(sections)}
+{_notes_html("Dashboard Notes", global_notes)}
+<script>
+const FIGURES = {figure_data};
+for (const [id, figure] of Object.entries(FIGURES)) {{
+    Plotly.newPlot(id, figure.data, figure.layout, {{responsive: true, displaylogo: false}});
+}}
+</script>
+</body>
+</html>
+"""
+
+
+def render_snapshot(context, notes_by_section=None, global_notes="", dark_mode=False, accent=primary_blue):
+    """Return the snapshot HTML, reusing the last build while data and notes are unchanged.
+
+    Only the "generated on" time differs between calls, so it is filled in
+    here rather than baked into the cached (and persisted) build.
+    """
+    key = hashlib.sha256(repr((
+        context, sorted((notes_by_section or {}).items()), global_notes, dark_mode, accent,
+        sorted(dataset_versions().items()), get_narrative_store().version
+    )).encode()).hexdigest()
+    snapshot = _snapshot_cache.get_or_create(
+        key, lambda: build_snapshot(context, notes_by_section, global_notes, dark_mode, accent)
+    )
+    return snapshot.replace(GENERATED_AT, datetime.now().strftime('%B %d, %Y at %H:%M'), 1)
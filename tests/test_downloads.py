@@ -0,0 +1,45 @@
+"""Deferred download callables must return data st.download_button can serve."""
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notes_export import notes_csv, notes_zip  # noqa: E402
+from notes_store import NotesStore  # noqa: E402
+
+
+def as_download(data):
+    """Run data through the same conversion Streamlit applies on click"""
+    return convert_data_to_bytes_and_infer_mime(data, unsupported_error=TypeError(type(data)))[0]
+
+
+@pytest.fixture
+def notes_store(tmp_path):
+    store = NotesStore(str(tmp_path / "notes.db"))
+    store.save("Recruitment", "first\n", "2024-01-01 09:00:00")
+    store.save("Recruitment", 'first\nsecond, with "quotes"\n', "2024-01-02 09:00:00")
+    return store
+
+
+def test_workbook_bytes():
+    openpyxl = pytest.importorskip("openpyxl")
+    from workbook import workbook_bytes
+
+    workbook = openpyxl.load_workbook(io.BytesIO(as_download(workbook_bytes())))
+    assert "grants" in workbook.sheetnames
+
+
+def test_notes_csv(notes_store):
+    text = as_download(notes_csv(notes_store, ["Recruitment"], history=True)).decode("utf-8")
+    assert text.splitlines()[0] == "tab,revision,saved_at,notes"
+    assert '"first\nsecond, with ""quotes""\n"' in text
+
+
+def test_notes_zip(notes_store):
+    with zipfile.ZipFile(io.BytesIO(as_download(notes_zip(notes_store)))) as bundle:
+        assert sorted(bundle.namelist()) == ["notes.csv", "notes_history.csv", "notes_history.json"]
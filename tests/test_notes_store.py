@@ -0,0 +1,67 @@
+"""Journal compaction must never change what the notes store reads back."""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notes_store import NotesStore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store with about 200 days of edits to two tabs"""
+    rng = random.Random(1)
+    store = NotesStore(str(tmp_path / "notes.db"))
+    saved_at = datetime.now() - timedelta(days=200)
+    text = ""
+    for i in range(900):
+        saved_at += timedelta(minutes=rng.randint(1, 600))
+        if saved_at > datetime.now():
+            break
+        lines = text.splitlines(keepends=True)
+        if lines and rng.random() < 0.4:
+            lines.pop(rng.randrange(len(lines)))
+        lines.insert(rng.randint(0, len(lines)), f"line {i}\n")
+        text = "".join(lines)
+        store.save("A", text, saved_at.strftime("%Y-%m-%d %H:%M:%S"))
+        if rng.random() < 0.3:
+            store.save("B", text[::-1], saved_at.strftime("%Y-%m-%d %H:%M:%S"))
+    return store
+
+
+def days():
+    start = (datetime.now() - timedelta(days=201)).date()
+    return [start + timedelta(days=d) for d in range(203)]
+
+
+def revisions(store):
+    return {tab: list(store.iter_revisions(tab)) for tab in ("A", "B")}
+
+
+def test_compact_keeps_every_revision_by_default(store):
+    before = revisions(store)
+    folded, pruned = store.compact()
+    assert folded > 0 and pruned == 0
+    assert revisions(store) == before
+    for tab, rows in before.items():
+        assert all(store.get_revision(tab, revision) == body for revision, body, _ in rows)
+    assert store.compact() == (0, 0)
+
+
+def test_retention_keeps_reads_as_of_each_day(store):
+    as_of = {day: store.get_all_as_of(day) for day in days()}
+    recent = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+    before = revisions(store)
+    _, pruned = store.compact(retention_days=90)
+    assert pruned > 0
+    assert all(store.get_all_as_of(day) == texts for day, texts in as_of.items())
+    for tab, rows in revisions(store).items():
+        # Recent history keeps every revision
+        assert [row for row in rows if row[2] >= recent] == [row for row in before[tab] if row[2] >= recent]
+        assert all(store.get_revision(tab, revision) == body for revision, body, _ in rows)
+        assert rows[-1][1] == store.get(tab)
+    assert store.compact(retention_days=90) == (0, 0)
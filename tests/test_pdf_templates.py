@@ -0,0 +1,28 @@
+"""Notes are user text and must never break a PDF."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("reportlab")
+
+from datasets import KEY_METRICS  # noqa: E402
+from layouts import SECTIONS, pdf_context  # noqa: E402
+from pdf_templates import notes_markup, render_pdf  # noqa: E402
+
+
+def test_notes_markup_escapes_and_keeps_line_breaks():
+    assert notes_markup("a <b>bold & more\r\nnext") == "a &lt;b&gt;bold &amp; more<br/>next"
+
+
+def test_complete_dashboard_with_markup_like_notes():
+    notes = {section: f"{section}: a <b>bold\n<unclosed" for section in SECTIONS}
+    pdf = render_pdf(
+        "Complete Dashboard",
+        context=pdf_context(dict(KEY_METRICS)),
+        notes_by_section=notes,
+        global_notes="x < y & <i>",
+    )
+    assert pdf.startswith(b"%PDF")
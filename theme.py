@@ -0,0 +1,20 @@
+"""Dashboard color scheme shared by the app, its charts and the static exports"""
+primary_blue = "#0088FF"
+primary_orange = "#FF5722"
+primary_yellow = "#FFEB3B"
+secondary_blue = "#00C8FF"
+secondary_orange = "#FF9100"
+secondary_teal = "#00E5FF"
+secondary_beige = "#FFECB3"
+secondary_gold = "#FFC400"
+secondary_white = "#FFFFFF"
+secondary_gray = "#424242"
+secondary_pink = "#FF4081"
+secondary_purple = "#AA00FF"
+secondary_green = "#00E676"
+achieved_green = "#00C853"
+
+dark_bg = "#121212"
+dark_card_bg = "#1E1E1E"
+dark_text = "#FFFFFF"
+dark_secondary_text = "#BBBBBB"
@@ -0,0 +1,231 @@
+"""Persist the process caches to disk so that a restart comes back warm.
+
+Figures are stored as Plotly JSON and PDFs, data bundles, API responses
+and HTML snapshots as the bytes or text they already are; nothing is
+pickled. manifest.json lists every entry with its cache key. On boot an
+entry is restored only if the code that built it is unchanged and the
+dataset version in its key is still current, so a restart never serves
+stale charts or data.
+
+The caches are saved every few minutes while they change and once more at
+exit. Set DASHBOARD_CACHE_DIR to move the directory, or to "" to turn
+persistence off.
+"""
+import atexit
+import hashlib
+import importlib
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+
+import plotly.io as pio
+
+from cache_registry import get_cache
+from datasets import dataset_versions, datasets_version
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("DASHBOARD_CACHE_DIR", os.path.join(BASE_DIR, ".warm_cache"))
+SAVE_INTERVAL = 300
+FORMAT_VERSION = 1
+
+# Modules whose code shapes the cached values; editing any of them discards the snapshot
+SOURCE_FILES = [
+    "datasets.py", "figures.py", "theme.py", "layouts.py", "formatting.py", "pdf_templates.py",
+    "snapshot.py", "narrative.py", "data_bundle.py", "metrics_api.py",
+]
+
+_save_lock = threading.Lock()
+_last_saved = None
+
+
+@lru_cache(maxsize=None)
+def code_version():
+    digest = hashlib.sha256(str(FORMAT_VERSION).encode())
+    for name in SOURCE_FILES:
+        with open(os.path.join(BASE_DIR, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _dataset_current(key):
+    # (builder name, dataset name, dataset version)
+    return dataset_versions().get(key[1]) == key[2]
+
+
+def _version_current(key):
+    # (..., datasets_version())
+    return key[-1] == datasets_version()
+
+
+def _always_current(key):
+    return True  # Keyed by a hash of every input, so a stale entry can never be looked up
+
+
+def _encode_text(value):
+    return value.encode("utf-8")
+
+
+def _decode_text(data):
+    return data.decode("utf-8")
+
+
+def _identity(data):
+    return data
+
+
+def _encode_figure(figure):
+    return figure.to_json().encode("utf-8")
+
+
+def _decode_figure(data):
+    return pio.from_json(data.decode("utf-8"))
+
+
+def _encode_response(response):
+    return response[0]
+
+
+def _decode_response(data):
+    from metrics_api import response_etag  # metrics_api starts the warm-up, which imports this module
+    return data, response_etag(data)
+
+
+# cache name: (module that registers the cache, file extension, encode, decode, is_current(key))
+CODECS = {
+    "figures": ("figures", ".json", _encode_figure, _decode_figure, _dataset_current),
+    "snapshot_figures": ("snapshot", ".json", _encode_text, _decode_text, _dataset_current),
+    "html_snapshots": ("snapshot", ".html", _encode_text, _decode_text, _always_current),
+    "pdf_fragments": ("pdf_templates", ".pdf", _identity, _identity, _always_current),
+    "data_bundles": ("data_bundle", ".zip", _identity, _identity, _version_current),
+    "api_responses": ("metrics_api", ".json", _encode_response, _decode_response, _version_current),
+}
+
+
+def _json_key(key):
+    return list(key) if isinstance(key, tuple) else key
+
+
+def _cache_key(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _file_name(cache_name, key, ext):
+    digest = hashlib.sha256(json.dumps([code_version(), cache_name, _json_key(key)]).encode())
+    return f"{cache_name}-{digest.hexdigest()[:24]}{ext}"
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _registered_caches():
+    caches = {}
+    for name, (module, _, _, _, _) in CODECS.items():
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue  # e.g. PDF support not installed
+        caches[name] = get_cache(name)
+    return caches
+
+
+def save_caches(directory=CACHE_DIR, force=False):
+    """Write every persistable cache entry to directory; returns the number of entries, or None if unchanged"""
+    global _last_saved
+    if not directory:
+        return None
+    with _save_lock:
+        snapshot = {name: cache.items() for name, cache in _registered_caches().items()}
+        signature = {name: [repr(key) for key, _ in items] for name, items in snapshot.items()}
+        if signature == _last_saved and not force:
+            return None
+
+        os.makedirs(directory, exist_ok=True)
+        entries = []
+        for name, items in snapshot.items():
+            _, ext, encode, _, _ = CODECS[name]
+            for key, value in items:
+                file_name = _file_name(name, key, ext)
+                path = os.path.join(directory, file_name)
+                if not os.path.exists(path):  # File names hash the key, so an existing file holds this value
+                    _write_atomic(path, encode(value))
+                entries.append({"cache": name, "key": _json_key(key), "file": file_name})
+
+        manifest = {
+            "format": FORMAT_VERSION,
+            "code_version": code_version(),
+            "datasets_version": datasets_version(),
+            "saved_at": time.time(),
+            "entries": entries,
+        }
+        _write_atomic(os.path.join(directory, "manifest.json"), json.dumps(manifest).encode("utf-8"))
+
+        # Drop files from earlier saves that are no longer referenced
+        referenced = {entry["file"] for entry in entries} | {"manifest.json"}
+        for file_name in os.listdir(directory):
+            if file_name not in referenced and file_name.split("-", 1)[0] in CODECS:
+                os.remove(os.path.join(directory, file_name))
+        _last_saved = signature
+        return len(entries)
+
+
+def restore_caches(directory=CACHE_DIR):
+    """Load the saved entries that are still valid into the process caches; returns the number restored"""
+    if not directory:
+        return 0
+    try:
+        with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if manifest.get("format") != FORMAT_VERSION or manifest.get("code_version") != code_version():
+        return 0
+
+    caches = _registered_caches()
+    restored = 0
+    for entry in manifest["entries"]:
+        name = entry["cache"]
+        if name not in caches:
+            continue
+        _, _, _, decode, is_current = CODECS[name]
+        key = _cache_key(entry["key"])
+        if not is_current(key):
+            continue
+        try:
+            with open(os.path.join(directory, entry["file"]), "rb") as f:
+                value = decode(f.read())
+        except (OSError, ValueError) as e:
+            print(f"Skipping cached {name} entry {entry['file']}: {e}")
+            continue
+        caches[name].set(key, value)
+        restored += 1
+    return restored
+
+
+def _save_quietly():
+    try:
+        save_caches()
+    except Exception as e:
+        print(f"Error saving warm cache: {e}")
+
+
+def _autosave(interval):
+    while True:
+        _save_quietly()
+        time.sleep(interval)
+
+
+@lru_cache(maxsize=None)
+def start_autosave(interval=SAVE_INTERVAL):
+    """Save the caches now, every interval seconds while they change, and at exit"""
+    if not CACHE_DIR:
+        return None
+    atexit.register(_save_quietly)
+    thread = threading.Thread(target=_autosave, args=(interval,), name="warm-cache-autosave", daemon=True)
+    thread.start()
+    return thread
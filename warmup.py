@@ -0,0 +1,145 @@
+"""Build the process-wide caches before the first visitor arrives.
+
+    python serve.py                 # warm up, then start Streamlit
+    streamlit run app.py            # warms up in the background on the first session
+
+Warm-up loads every dataset and its version hash, the notes cache and the
+narrative content, restores the caches saved by the previous run (see
+warm_cache.py), imports each section module, builds every chart into the
+shared figure cache and renders every section's PDF in both themes, which
+fills the Complete Dashboard fragment cache. health() reports progress;
+the metrics API serves it at /health.
+
+The standalone metrics API (python metrics_api.py) runs a shorter warm-up
+that only loads the datasets and serializes the API responses. It never
+renders PDFs or charts and leaves .warm_cache/ to the app process, so the
+two processes do not overwrite or sweep each other's saved caches.
+"""
+import importlib
+import threading
+import time
+from functools import lru_cache
+
+from datasets import KEY_METRICS, dataset_versions, load_datasets
+from figures import SECTION_FIGURES, get_figure
+from layouts import SECTIONS, pdf_context
+from narrative import start_search_indexing
+from notes_cache import get_notes_cache
+from notes_store import GLOBAL_TAB
+from sections import module_name
+from warm_cache import restore_caches, start_autosave
+
+_lock = threading.Lock()
+_state = {"status": "idle", "started_at": None, "finished_at": None, "steps": {}, "errors": {}}
+
+
+def warm_data():
+    load_datasets()
+    dataset_versions()
+    get_notes_cache()
+    start_search_indexing()
+
+
+def warm_datasets():
+    load_datasets()
+    dataset_versions()
+
+
+def warm_api():
+    metrics_api = importlib.import_module("metrics_api")  # metrics_api imports this module
+    for path in metrics_api.build_payload("/api")["endpoints"]:
+        metrics_api.get_response(path)
+
+
+def warm_sections():
+    for section in SECTIONS:
+        importlib.import_module(module_name(section))
+
+
+def warm_figures():
+    # Charts are theme-independent: Streamlit applies the light or dark theme in the browser
+    for figures in SECTION_FIGURES.values():
+        for builder, dataset_name in figures:
+            get_figure(builder, dataset_name)
+
+
+def warm_pdfs():
+    pdf_templates = importlib.import_module("pdf_templates")
+    context = pdf_context(dict(KEY_METRICS))
+    notes = get_notes_cache()
+    notes_by_section = {section: notes.get(section) for section in SECTIONS}
+    for dark_mode in (False, True):
+        for section in SECTIONS + ["Complete Dashboard"]:
+            pdf_templates.render_pdf(
+                section,
+                dark_mode=dark_mode,
+                context=context,
+                section_notes=notes_by_section.get(section, ""),
+                global_notes=notes.get(GLOBAL_TAB),
+                notes_by_section=notes_by_section
+            )
+
+
+WARMUP_STEPS = [
+    ("data", warm_data),
+    ("restore", restore_caches),
+    ("sections", warm_sections),
+    ("figures", warm_figures),
+    ("pdfs", warm_pdfs),
+]
+
+# The standalone metrics API serves JSON only (metrics, report card, datasets)
+API_WARMUP_STEPS = [
+    ("data", warm_datasets),
+    ("api", warm_api),
+]
+
+
+def _record(**changes):
+    with _lock:
+        _state.update(changes)
+
+
+def run_warmup(steps=WARMUP_STEPS):
+    """Run every warm-up step in order; a failing step is recorded and the rest still run"""
+    _record(status="warming", started_at=time.time())
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"Warm-up step {name} failed: {e}")
+            with _lock:
+                _state["errors"][name] = str(e)
+        with _lock:
+            _state["steps"][name] = round(time.perf_counter() - start, 3)
+    _record(status="degraded" if _state["errors"] else "ready", finished_at=time.time())
+
+
+def _warm_and_persist():
+    run_warmup()
+    start_autosave()
+
+
+@lru_cache(maxsize=None)
+def start_warmup():
+    """Run the warm-up once per process on a daemon thread, then keep the caches saved to disk"""
+    thread = threading.Thread(target=_warm_and_persist, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+@lru_cache(maxsize=None)
+def start_api_warmup():
+    """Run the standalone API's warm-up once per process; nothing is restored from or saved to disk"""
+    thread = threading.Thread(target=run_warmup, args=(API_WARMUP_STEPS,), name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def health():
+    """Return the warm-up state; "ready" (or "degraded") means sessions will find the caches built"""
+    with _lock:
+        state = dict(_state, steps=dict(_state["steps"]), errors=dict(_state["errors"]))
+    state["ready"] = state["status"] in ("ready", "degraded")
+    return state
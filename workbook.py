@@ -0,0 +1,98 @@
+"""Multi-sheet Excel export of every dashboard dataset.
+
+Uses openpyxl's write-only mode, which streams rows to disk as they are
+added, so no sheet's cells are held in memory; only the finished file is,
+since Streamlit serves downloads from bytes. Numbers, dates and currency
+amounts are written as typed cells with Excel number formats rather than
+text.
+"""
+import io
+import math
+from datetime import date, datetime
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+from datasets import currency_text_columns, load_datasets, parse_currency
+from theme import primary_blue
+
+# Money columns are formatted as currency; "$1,234" text columns are parsed cell by cell
+CURRENCY_COLUMNS = {"Amount", "Amount Requested", "Amount Funded", "Revenue", "Expenses", "Spend", "CPC"}
+CURRENCY_FORMAT = '"$"#,##0.00'
+INTEGER_FORMAT = "#,##0"
+DECIMAL_FORMAT = "#,##0.00"
+DATE_FORMAT = "yyyy-mm-dd"
+
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill("solid", fgColor=primary_blue.lstrip("#"))
+
+
+def _column_format(name, dtype):
+    if name in CURRENCY_COLUMNS and dtype.kind in "iuf":
+        return CURRENCY_FORMAT
+    if dtype.kind in "iu":
+        return INTEGER_FORMAT
+    if dtype.kind == "f":
+        return DECIMAL_FORMAT
+    if dtype.kind == "M":
+        return DATE_FORMAT
+    return None
+
+
+def _value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if hasattr(value, "item"):  # numpy scalar
+        return value.item()
+    if hasattr(value, "to_pydatetime"):  # pandas Timestamp
+        return value.to_pydatetime()
+    return value if isinstance(value, (int, float, date, datetime)) else str(value)
+
+
+def write_sheet(workbook, title, df):
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.freeze_panes = "A2"
+    for i, column in enumerate(df.columns, start=1):
+        width = max([len(str(column))] + [len(str(v)) for v in df[column].head(100)])
+        sheet.column_dimensions[get_column_letter(i)].width = min(width + 2, 60)
+
+    header = []
+    for column in df.columns:
+        cell = WriteOnlyCell(sheet, value=str(column))
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        header.append(cell)
+    sheet.append(header)
+
+    # Parse currency text per cell rather than converting a copy of the whole frame
+    currency = set(currency_text_columns(df))
+    formats = [
+        CURRENCY_FORMAT if column in currency else _column_format(column, df[column].dtype)
+        for column in df.columns
+    ]
+    parsers = [parse_currency if column in currency else None for column in df.columns]
+    for row in df.itertuples(index=False, name=None):
+        cells = []
+        for value, number_format, parse in zip(row, formats, parsers):
+            cell = WriteOnlyCell(sheet, value=_value(parse(value) if parse else value))
+            if number_format:
+                cell.number_format = number_format
+            cells.append(cell)
+        sheet.append(cells)
+
+
+def write_workbook(fileobj, datasets=None):
+    """Write one sheet per dataset ({name: DataFrame}, default: all) to fileobj"""
+    workbook = Workbook(write_only=True)
+    for name, df in (datasets or load_datasets()).items():
+        write_sheet(workbook, name, df)
+    workbook.save(fileobj)
+
+
+def workbook_bytes(datasets=None):
+    """Return the workbook as bytes, the form st.download_button accepts"""
+    output = io.BytesIO()
+    write_workbook(output, datasets)
+    return output.getvalue()